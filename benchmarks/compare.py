@@ -0,0 +1,57 @@
+"""
+Compare two benchmark result files scenario by scenario.
+
+Usage (from the repository root):
+
+    python -m benchmarks.compare benchmarks/results/before.json benchmarks/results/after.json
+"""
+import argparse
+import json
+from pathlib import Path
+
+METRICS = [
+    ('throughput_rps', lambda s: s['throughput_rps'], True),
+    ('p50_ms', lambda s: s['latency_ms']['p50'], False),
+    ('p95_ms', lambda s: s['latency_ms']['p95'], False),
+    ('p99_ms', lambda s: s['latency_ms']['p99'], False),
+    ('queries', lambda s: s['queries_per_request']['mean'], False),
+]
+
+
+def change(before, after):
+    if before in (None, 0) or after is None:
+        return None
+    return (after - before) / before * 100
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('before')
+    parser.add_argument('after')
+    args = parser.parse_args(argv)
+
+    before, after = (json.loads(Path(path).read_text()) for path in (args.before, args.after))
+    for label, report in (('before', before), ('after', after)):
+        meta = report['meta']
+        print(f"{label + ':':7} {meta['commit']} {meta['timestamp']} {meta.get('server') or ''}")
+    print()
+    previous = {s['name']: s for s in before['scenarios']}
+    print(f"{'scenario':32} " + ' '.join(f"{name:>22}" for name, _, _ in METRICS))
+    for scenario in after['scenarios']:
+        old = previous.get(scenario['name'])
+        if old is None:
+            continue
+        cells = []
+        for name, get, higher_is_better in METRICS:
+            delta = change(get(old), get(scenario))
+            value = get(scenario)
+            if delta is None:
+                cells.append(f"{value if value is not None else '-':>22}")
+            else:
+                marker = '+' if (delta > 0) == higher_is_better else '-'
+                cells.append(f"{value:>12} ({delta:+6.1f}%{marker})")
+        print(f"{scenario['name']:32} " + ' '.join(cells))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,353 @@
+"""
+HTTP benchmark for the customer, vendor and account APIs.
+
+Seeds a dataset with ``generate_data``, starts a local server with the
+``benchmark`` settings (which report SQL counts in response headers), then
+drives list (first and deep page), retrieve, create, update and delete on
+every endpoint under a fixed concurrency. Results are printed and saved as
+JSON so runs can be compared with ``python -m benchmarks.compare``.
+
+Usage (from the repository root):
+
+    python -m benchmarks.http_bench --rows 10000 --concurrency 8 --requests 400
+    python -m benchmarks.http_bench --url http://127.0.0.1:8000 --skip-seed
+
+To compare the WSGI deployment with the async read views under ASGI, run
+the read scenarios at a high concurrency against each server:
+
+    python -m benchmarks.http_bench --server gunicorn --reads-only --concurrency 64
+    python -m benchmarks.http_bench --server uvicorn --reads-only --concurrency 64 --skip-seed
+"""
+import argparse
+import http.client
+import json
+import os
+import platform
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import urlsplit
+
+ROOT = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).resolve().parent / 'results'
+
+ENDPOINTS = {
+    'customers': {
+        'path': '/api/customers/',
+        'payload': lambda n: {"name": f"Bench Customer {n}", "email": f"bench.customer.{n}@example.com"},
+    },
+    'vendors': {
+        'path': '/api/vendors/',
+        'payload': lambda n: {"name": f"Bench Vendor {n}", "email": f"bench.vendor.{n}@example.com"},
+    },
+    'accounts': {
+        'path': '/api/accounts/',
+        'payload': lambda n: {"name": f"Bench Account {n}", "code": f"B{n:09d}", "account_type": "expense"},
+    },
+}
+PK_FIELDS = {'customers': 'customer_id', 'vendors': 'vendor_id', 'accounts': 'account_id'}
+
+
+def percentile(values, fraction):
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def process_tree(pid):
+    """
+    Return ``pid`` and its descendants (e.g. gunicorn's workers), using /proc.
+    """
+    pids, pending = [], [pid]
+    while pending:
+        current = pending.pop()
+        pids.append(current)
+        try:
+            children = Path(f'/proc/{current}/task/{current}/children').read_text().split()
+        except OSError:
+            children = []
+        pending.extend(int(child) for child in children)
+    return pids
+
+
+def read_rss_mb(pid):
+    """
+    Return ``(rss, peak_rss)`` in MB summed over a local process and its
+    children, or ``(None, None)`` where /proc is not available.
+    """
+    totals = {}
+    for process in process_tree(pid):
+        try:
+            status = Path(f'/proc/{process}/status').read_text()
+        except OSError:
+            continue
+        for line in status.splitlines():
+            key, _, rest = line.partition(':')
+            if key in ('VmRSS', 'VmHWM'):
+                totals[key] = totals.get(key, 0) + int(rest.split()[0]) / 1024
+    return totals.get('VmRSS'), totals.get('VmHWM')
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class Client:
+    """
+    Minimal thread-safe HTTP client; one connection per request keeps the
+    measurement independent of the server's keep-alive support.
+    """
+
+    def __init__(self, base_url):
+        parts = urlsplit(base_url)
+        self.host, self.port = parts.hostname, parts.port or 80
+
+    def request(self, method, path, body=None):
+        headers = {'Accept': 'application/json'}
+        data = None
+        if body is not None:
+            data = json.dumps(body).encode()
+            headers['Content-Type'] = 'application/json'
+        connection = http.client.HTTPConnection(self.host, self.port, timeout=60)
+        started = time.perf_counter()
+        try:
+            connection.request(method, path, body=data, headers=headers)
+            response = connection.getresponse()
+            payload = response.read()
+            elapsed = time.perf_counter() - started
+            queries = response.getheader('X-Query-Count')
+            return {
+                'status': response.status,
+                'latency': elapsed,
+                'queries': int(queries) if queries is not None else None,
+                'bytes': len(payload),
+                'body': payload,
+            }
+        except OSError as exc:
+            return {'status': None, 'latency': time.perf_counter() - started, 'queries': None, 'bytes': 0,
+                    'error': str(exc)}
+        finally:
+            connection.close()
+
+
+def run_scenario(client, name, requests, concurrency, server_pid):
+    """
+    Execute ``requests`` (a list of ``(method, path, body)``) with a thread
+    pool and summarise latency, throughput, query counts and server memory.
+    """
+    results = []
+    lock = threading.Lock()
+
+    def work(request):
+        result = client.request(*request)
+        with lock:
+            results.append(result)
+        return result
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(work, requests))
+    wall = time.perf_counter() - started
+
+    latencies = [r['latency'] * 1000 for r in results]
+    queries = [r['queries'] for r in results if r['queries'] is not None]
+    errors = sum(1 for r in results if r['status'] is None or r['status'] >= 400)
+    rss, peak_rss = read_rss_mb(server_pid) if server_pid else (None, None)
+    return {
+        'name': name,
+        'requests': len(results),
+        'errors': errors,
+        'throughput_rps': round(len(results) / wall, 2) if wall else None,
+        'latency_ms': {
+            'mean': round(statistics.fmean(latencies), 3) if latencies else None,
+            'p50': round(percentile(latencies, 0.50), 3) if latencies else None,
+            'p95': round(percentile(latencies, 0.95), 3) if latencies else None,
+            'p99': round(percentile(latencies, 0.99), 3) if latencies else None,
+            'max': round(max(latencies), 3) if latencies else None,
+        },
+        'queries_per_request': {
+            'mean': round(statistics.fmean(queries), 2) if queries else None,
+            'max': max(queries) if queries else None,
+        },
+        'response_bytes_mean': round(statistics.fmean(r['bytes'] for r in results), 1) if results else None,
+        'server_rss_mb': round(rss, 1) if rss else None,
+        'server_peak_rss_mb': round(peak_rss, 1) if peak_rss else None,
+    }, results
+
+
+def manage(settings, *args):
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE=settings)
+    subprocess.run([sys.executable, 'manage.py', *args], cwd=ROOT, env=env, check=True)
+
+
+def server_command(args):
+    """
+    Command line for the server under test: Django's threaded dev server,
+    gunicorn with threaded WSGI workers, or uvicorn serving the ASGI app.
+    """
+    bind = f'127.0.0.1:{args.port}'
+    if args.server == 'gunicorn':
+        return [sys.executable, '-m', 'gunicorn', 'src.config.wsgi:application', '--bind', bind,
+                '--workers', str(args.workers), '--threads', str(args.threads), '--worker-class', 'gthread']
+    if args.server == 'uvicorn':
+        return [sys.executable, '-m', 'uvicorn', 'src.config.asgi:application', '--host', '127.0.0.1',
+                '--port', str(args.port), '--workers', str(args.workers), '--no-access-log']
+    return [sys.executable, 'manage.py', 'runserver', bind, '--noreload']
+
+
+def start_server(settings, port, command):
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE=settings)
+    process = subprocess.Popen(
+        command, cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=0.5).close()
+            return process
+        except OSError:
+            if process.poll() is not None:
+                raise RuntimeError("The benchmark server exited during startup.")
+            time.sleep(0.1)
+    process.terminate()
+    raise RuntimeError("The benchmark server did not start within 30s.")
+
+
+def build_plan(args, rows, created):
+    """
+    Yield ``(scenario_name, requests)`` per endpoint, in an order where
+    creates feed the update and delete scenarios.
+    """
+    rng = random.Random(args.seed)
+    page_size = 100
+    for entity, endpoint in ENDPOINTS.items():
+        path = endpoint['path']
+        count = rows[entity]
+        last_page = max(1, (count + page_size - 1) // page_size)
+        n = args.requests
+        yield f'{entity}.list_first_page', [('GET', f'{path}?page=1&page_size={page_size}', None)] * n
+        yield f'{entity}.list_deep_page', [('GET', f'{path}?page={last_page}&page_size={page_size}', None)] * n
+        yield f'{entity}.retrieve', [('GET', f'{path}{rng.randint(1, max(1, count))}/', None) for _ in range(n)]
+        if args.reads_only:
+            continue
+
+        offset = int(time.time() * 1000) % 10 ** 8
+        yield f'{entity}.create', [('POST', path, endpoint['payload'](offset + i)) for i in range(n)]
+        yield f'{entity}.update', [
+            ('PUT', f'{path}{pk}/', endpoint['payload'](offset + n + i)) for i, pk in enumerate(created.get(entity, []))
+        ]
+        yield f'{entity}.delete', [('DELETE', f'{path}{pk}/', None) for pk in created.get(entity, [])]
+
+
+def print_table(scenarios):
+    header = f"{'scenario':32} {'req':>6} {'err':>5} {'rps':>9} {'p50':>9} {'p95':>9} {'p99':>9} {'q/req':>7} {'rss MB':>8}"
+    print(header)
+    print('-' * len(header))
+    for s in scenarios:
+        latency = s['latency_ms']
+        fmt = lambda v: f"{v:9.2f}" if v is not None else f"{'-':>9}"
+        queries = s['queries_per_request']['mean']
+        print(
+            f"{s['name']:32} {s['requests']:6d} {s['errors']:5d} {fmt(s['throughput_rps'])} "
+            f"{fmt(latency['p50'])} {fmt(latency['p95'])} {fmt(latency['p99'])} "
+            f"{queries if queries is not None else '-':>7} {s['server_rss_mb'] or '-':>8}"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--rows', type=int, default=10000, help="Vendors and accounts to seed (customers = rows / 10).")
+    parser.add_argument('--requests', type=int, default=200, help="Requests per scenario.")
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--settings', help="Settings module (default benchmark, or benchmark_asgi for uvicorn).")
+    parser.add_argument('--server', choices=['runserver', 'gunicorn', 'uvicorn'], default='runserver')
+    parser.add_argument('--workers', type=int, default=1, help="Server processes (gunicorn and uvicorn).")
+    parser.add_argument('--threads', type=int, default=8, help="Threads per gunicorn worker.")
+    parser.add_argument('--reads-only', action='store_true', help="Only run the list and retrieve scenarios.")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--url', help="Benchmark an already running server instead of starting one.")
+    parser.add_argument('--skip-seed', action='store_true', help="Reuse the existing dataset.")
+    parser.add_argument('--only', help="Comma-separated entities to run, e.g. vendors,accounts.")
+    parser.add_argument('--output', help="Result file (default benchmarks/results/<time>-<commit>.json).")
+    args = parser.parse_args(argv)
+
+    if args.settings is None:
+        args.settings = 'src.config.settings.benchmark_asgi' if args.server == 'uvicorn' else 'src.config.settings.benchmark'
+    rows = {'customers': max(1, args.rows // 10), 'vendors': args.rows, 'accounts': args.rows}
+    if args.only:
+        for entity in set(ENDPOINTS) - set(args.only.split(',')):
+            ENDPOINTS.pop(entity)
+
+    server = None
+    if not args.url:
+        manage(args.settings, 'migrate', '--verbosity', '0')
+        if not args.skip_seed:
+            manage(args.settings, 'generate_data', '--truncate', '--seed', str(args.seed),
+                   '--customers', str(rows['customers']), '--vendors', str(rows['vendors']),
+                   '--accounts', str(rows['accounts']))
+        server = start_server(args.settings, args.port, server_command(args))
+    base_url = args.url or f'http://127.0.0.1:{args.port}'
+
+    client = Client(base_url)
+    created = {}  # Ids from the create scenarios, reused by update and delete
+    scenarios = []
+    try:
+        for name, requests in build_plan(args, rows, created):
+            if not requests:
+                continue
+            summary, results = run_scenario(client, name, requests, args.concurrency, server and server.pid)
+            if name.endswith('.create'):
+                entity = name.split('.')[0]
+                created[entity] = [
+                    json.loads(r['body'])['data'][PK_FIELDS[entity]] for r in results if r['status'] == 201
+                ]
+            scenarios.append(summary)
+            print(f"{name}: {summary['throughput_rps']} req/s, p95 {summary['latency_ms']['p95']} ms", flush=True)
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+
+    report = {
+        'meta': {
+            'commit': git_commit(),
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'base_url': base_url,
+            'settings': None if args.url else args.settings,
+            'server': None if args.url else args.server,
+            'workers': args.workers,
+            'threads': args.threads if args.server == 'gunicorn' else None,
+            'rows': rows,
+            'requests_per_scenario': args.requests,
+            'concurrency': args.concurrency,
+            'seed': args.seed,
+        },
+        'scenarios': scenarios,
+    }
+    output = Path(args.output) if args.output else RESULTS_DIR / (
+        f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{report['meta']['commit'] or 'nogit'}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print()
+    print_table(scenarios)
+    print(f"\nResults written to {output}")
+
+
+if __name__ == '__main__':
+    main()
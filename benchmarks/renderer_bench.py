@@ -0,0 +1,64 @@
+"""
+Micro-benchmark of response rendering: DRF's stdlib JSON renderer versus
+the orjson-backed ``FastJSONRenderer`` and ``MessagePackRenderer``, each in
+the row layout and the columnar layout (``?layout=columnar``). Reports encode
+time and bytes per page, and checks the fast JSON output is byte-identical.
+
+Usage (from the repository root):
+
+    python -m benchmarks.renderer_bench --page-size 100
+"""
+import argparse
+import os
+
+from benchmarks.serialization_bench import best_of, setup_django
+
+
+class FakeRequest:
+    def __init__(self, layout):
+        self.query_params = {'layout': layout} if layout else {}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--page-size', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args(argv)
+
+    call_command = setup_django()
+    call_command('generate_data', customers=args.page_size, vendors=args.page_size, accounts=args.page_size,
+                 stdout=open(os.devnull, 'w'))
+
+    from rest_framework.renderers import JSONRenderer
+    from src.apps.accounts.serializers import AccountSerializer
+    from src.apps.vendors.serializers import VendorSerializer
+    from utils import renderers
+
+    for serializer_class in (VendorSerializer, AccountSerializer):
+        rows = serializer_class.fast_data(serializer_class.fast_values(serializer_class.Meta.model.objects.order_by('pk')))
+        envelope = {
+            "message": "Data retrieved successfully", "code": 200, "subCode": "0", "errors": None,
+            "data": {"total": len(rows), "count": len(rows), "next": None, "previous": None, "results": rows},
+        }
+        candidates = [('drf json', JSONRenderer(), None), ('fast json', renderers.FastJSONRenderer(), None),
+                      ('fast json columnar', renderers.FastJSONRenderer(), 'columnar')]
+        if renderers.msgpack is not None:
+            candidates += [('msgpack', renderers.MessagePackRenderer(), None),
+                           ('msgpack columnar', renderers.MessagePackRenderer(), 'columnar')]
+
+        baseline = JSONRenderer().render(envelope)
+        print(f"\n{serializer_class.Meta.model.__name__} page of {len(rows)} rows "
+              f"(orjson={'yes' if renderers.orjson else 'no'}, "
+              f"identical={renderers.FastJSONRenderer().render(envelope) == baseline})")
+        print(f"{'renderer':20} {'encode us':>10} {'bytes':>8} {'vs drf':>8}")
+        drf_time = None
+        for name, renderer, layout in candidates:
+            context = {'request': FakeRequest(layout)}
+            elapsed = best_of(lambda: renderer.render(envelope, renderer_context=context), args.repeat)
+            drf_time = drf_time or elapsed
+            size = len(renderer.render(envelope, renderer_context=context))
+            print(f"{name:20} {elapsed * 1e6:10.1f} {size:8d} {drf_time / elapsed:7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
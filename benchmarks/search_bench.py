@@ -0,0 +1,61 @@
+"""
+Typeahead benchmark of the trigram search index on the generated dataset.
+
+Seeds ``generate_data`` (which rebuilds the index), then replays every
+keystroke of a few typical queries against ``search_index.search`` and
+reports the median and p95 latency and the SQL statements per lookup.
+
+Usage (from the repository root):
+
+    python -m benchmarks.search_bench --scale 0.2 --repeat 20
+"""
+import argparse
+import os
+import time
+
+from benchmarks.http_bench import percentile
+from benchmarks.serialization_bench import setup_django
+
+QUERIES = ["kwame mensah", "james smi", "volta trading", "receivables 12", "sales.15", "+1555"]
+
+
+def keystrokes(query, min_length):
+    return [query[:end] for end in range(min_length, len(query) + 1)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--scale', type=float, default=0.2, help="generate_data --scale (1.0 is 210k rows).")
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--query', action='append', help="Query to replay (repeatable, default: a built-in set).")
+    args = parser.parse_args(argv)
+
+    call_command = setup_django()
+    call_command('generate_data', scale=args.scale, stdout=open(os.devnull, 'w'))
+
+    from django.conf import settings
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+    from src.apps.search.indexing import search_index
+
+    print(f"{'query':18} {'p50 ms':>8} {'p95 ms':>8} {'queries':>8} {'results':>8}")
+    overall = []
+    for query in args.query or QUERIES:
+        for typed in keystrokes(query, settings.SEARCH['MIN_QUERY_LENGTH']):
+            timings = []
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                search_index.search(typed)
+                timings.append(time.perf_counter() - started)
+            with CaptureQueriesContext(connection) as queries:
+                results = search_index.search(typed)
+            overall.extend(timings)
+            print(
+                f"{typed!r:18} {percentile(timings, 0.5) * 1000:8.2f} {percentile(timings, 0.95) * 1000:8.2f} "
+                f"{len(queries):8d} {len(results):8d}"
+            )
+    print(f"\nall keystrokes: p50 {percentile(overall, 0.5) * 1000:.2f} ms, p95 {percentile(overall, 0.95) * 1000:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
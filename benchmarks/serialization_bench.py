@@ -0,0 +1,77 @@
+"""
+Micro-benchmark of list-page serialization: DRF ``ModelSerializer`` over
+model instances versus the ``FastReadSerializerMixin`` path over
+``values()`` rows. Also checks that both produce byte-identical JSON.
+
+Usage (from the repository root):
+
+    python -m benchmarks.serialization_bench --rows 5000 --page-size 100
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def setup_django():
+    sys.path[:0] = [str(ROOT), str(ROOT / 'src')]
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'src.config.settings.testing')
+    import django
+    django.setup()
+    from django.core.management import call_command
+    call_command('migrate', verbosity=0)
+    return call_command
+
+
+def best_of(function, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--rows', type=int, default=5000)
+    parser.add_argument('--page-size', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args(argv)
+
+    call_command = setup_django()
+    call_command('generate_data', customers=args.rows, vendors=args.rows, accounts=args.rows, stdout=open(os.devnull, 'w'))
+
+    from rest_framework.renderers import JSONRenderer
+    from src.apps.accounts.serializers import AccountSerializer
+    from src.apps.customers.serializers import CustomerSerializer
+    from src.apps.vendors.serializers import VendorSerializer
+
+    renderer = JSONRenderer()
+    print(f"{'serializer':22} {'drf ms':>9} {'fast ms':>9} {'speedup':>8} identical")
+    for serializer_class in (CustomerSerializer, VendorSerializer, AccountSerializer):
+        queryset = serializer_class.Meta.model.objects.order_by('pk')
+        offset = args.rows // 2
+
+        def drf():
+            return serializer_class(queryset[offset:offset + args.page_size], many=True).data
+
+        def fast():
+            return serializer_class.fast_data(serializer_class.fast_values(queryset)[offset:offset + args.page_size])
+
+        identical = renderer.render(drf()) == renderer.render(fast())
+        drf_time, fast_time = best_of(drf, args.repeat), best_of(fast, args.repeat)
+        print(
+            f"{serializer_class.__name__:22} {drf_time * 1000:9.3f} {fast_time * 1000:9.3f} "
+            f"{drf_time / fast_time:7.1f}x {identical}"
+        )
+        if not identical:
+            print(json.dumps({'drf': drf()[:1], 'fast': fast()[:1]}, default=str, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+"""
+Time-to-first-request benchmark for worker boot.
+
+Starts a fresh server several times per settings module and measures, from
+process spawn, when the first request to ``--path`` is answered, plus the
+latency of that first request and of the next one. The default compares
+the regular ``benchmark`` settings with ``benchmark_lean`` (production-like
+boot: admin and schema tooling left out, ``WARM_UP`` on). Results are
+printed and saved as JSON next to the HTTP benchmark results.
+
+Usage (from the repository root):
+
+    python -m benchmarks.startup_bench --server gunicorn --runs 10
+    python -m benchmarks.startup_bench --settings src.config.settings.benchmark_asgi --server uvicorn
+
+For a per-module breakdown of one boot, see ``manage.py profile_startup``.
+"""
+import argparse
+import http.client
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchmarks.http_bench import RESULTS_DIR, ROOT, git_commit, manage, read_rss_mb, server_command
+
+DEFAULT_SETTINGS = 'src.config.settings.benchmark,src.config.settings.benchmark_lean'
+
+
+def get(port, path):
+    """
+    Return ``(status, latency_ms)`` of one GET, or ``None`` while the
+    server does not accept connections yet.
+    """
+    connection = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+    started = time.perf_counter()
+    try:
+        connection.request('GET', path, headers={'Accept': 'application/json'})
+        response = connection.getresponse()
+        response.read()
+        return response.status, (time.perf_counter() - started) * 1000
+    except (ConnectionError, http.client.RemoteDisconnected):
+        return None
+    finally:
+        connection.close()
+
+
+def boot_once(args, settings):
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE=settings)
+    spawned = time.perf_counter()
+    process = subprocess.Popen(
+        server_command(args), cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = spawned + 60
+        while True:
+            first = get(args.port, args.path)
+            if first is not None:
+                break
+            if process.poll() is not None:
+                raise RuntimeError(f"The server exited during startup ({settings}).")
+            if time.perf_counter() > deadline:
+                raise RuntimeError(f"The server did not answer within 60s ({settings}).")
+            time.sleep(0.005)
+        first_response_ms = (time.perf_counter() - spawned) * 1000
+        second = get(args.port, args.path)
+        rss, _ = read_rss_mb(process.pid)
+    finally:
+        process.terminate()
+        process.wait()
+    return {
+        'status': first[0],
+        'first_response_ms': round(first_response_ms, 1),
+        'first_request_ms': round(first[1], 2),
+        'second_request_ms': round(second[1], 2) if second else None,
+        'rss_mb': round(rss, 1) if rss is not None else None,
+    }
+
+
+def summarize(settings, runs):
+    def median(key):
+        values = [run[key] for run in runs if run[key] is not None]
+        return round(statistics.median(values), 2) if values else None
+
+    return {
+        'settings': settings,
+        'runs': runs,
+        'median': {key: median(key) for key in ('first_response_ms', 'first_request_ms', 'second_request_ms', 'rss_mb')},
+        'errors': sum(1 for run in runs if run['status'] >= 400),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--settings', default=DEFAULT_SETTINGS, help="Comma-separated settings modules to compare.")
+    parser.add_argument('--server', choices=['runserver', 'gunicorn', 'uvicorn'], default='gunicorn')
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--threads', type=int, default=8, help="Threads per gunicorn worker.")
+    parser.add_argument('--runs', type=int, default=5, help="Boots per settings module.")
+    parser.add_argument('--path', default='/api/accounts/?page_size=1')
+    parser.add_argument('--port', type=int, default=8766)
+    parser.add_argument('--output', help="Result file (default benchmarks/results/startup-<time>-<commit>.json).")
+    args = parser.parse_args(argv)
+
+    results = []
+    for settings in args.settings.split(','):
+        manage(settings, 'migrate', '--verbosity', '0')
+        runs = [boot_once(args, settings) for _ in range(args.runs)]
+        results.append(summarize(settings, runs))
+        median = results[-1]['median']
+        print(f"{settings}: first response after {median['first_response_ms']} ms", flush=True)
+
+    report = {
+        'meta': {
+            'commit': git_commit(),
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'server': args.server,
+            'workers': args.workers,
+            'path': args.path,
+            'runs': args.runs,
+        },
+        'startup': results,
+    }
+    output = Path(args.output) if args.output else RESULTS_DIR / (
+        f"startup-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{report['meta']['commit'] or 'nogit'}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+
+    print()
+    header = f"{'settings':40} {'first response':>15} {'1st req':>9} {'2nd req':>9} {'rss MB':>8} {'err':>4}"
+    print(header)
+    print('-' * len(header))
+    for result in results:
+        median = result['median']
+        fmt = lambda value, width: f"{value:{width}}" if value is not None else f"{'-':>{width}}"
+        print(
+            f"{result['settings']:40} {fmt(median['first_response_ms'], 15)} {fmt(median['first_request_ms'], 9)} "
+            f"{fmt(median['second_request_ms'], 9)} {fmt(median['rss_mb'], 8)} {result['errors']:4d}"
+        )
+    print(f"\nResults written to {output}")
+
+
+if __name__ == '__main__':
+    main()
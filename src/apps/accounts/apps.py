@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class AccountsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "src.apps.accounts"
+
+    def ready(self):
+        from utils.cache import api_cache
+        api_cache.register(self.get_model("Account"))
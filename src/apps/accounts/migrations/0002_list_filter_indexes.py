@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="account",
+            name="name",
+            field=models.CharField(db_index=True, max_length=255),
+        ),
+        migrations.AddIndex(
+            model_name="account",
+            index=models.Index(fields=["account_type", "account_id"], name="account_type_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="account",
+            index=models.Index(fields=["created_at", "account_id"], name="account_created_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="account",
+            index=models.Index(fields=["updated_at", "account_id"], name="account_updated_id_idx"),
+        ),
+    ]
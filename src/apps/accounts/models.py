@@ -5,7 +5,7 @@ class Account(models.Model):
     Represents an account in the chart of accounts, standalone.
     """
     account_id = models.AutoField(primary_key=True)
-    name = models.CharField(max_length=255)
+    name = models.CharField(max_length=255, db_index=True)
     code = models.CharField(max_length=20, unique=True)
     account_type = models.CharField(
         max_length=50,
@@ -15,7 +15,12 @@ class Account(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['account_type', 'account_id'], name='account_type_id_idx'),
+            models.Index(fields=['created_at', 'account_id'], name='account_created_id_idx'),
+            models.Index(fields=['updated_at', 'account_id'], name='account_updated_id_idx'),
+        ]
+
     def __str__(self):
         return f"{self.code} - {self.name}"
-
-
@@ -1,7 +1,12 @@
 from rest_framework import serializers
+from utils.fast_serializers import FastReadSerializerMixin
+from utils.fieldsets import SparseFieldsetMixin
+from utils.integrity import ConstraintUniquenessMixin
 from .models import Account
 
-class AccountSerializer(serializers.ModelSerializer):
+class AccountSerializer(
+    SparseFieldsetMixin, FastReadSerializerMixin, ConstraintUniquenessMixin, serializers.ModelSerializer
+):
     class Meta:
         model = Account
         fields = '__all__'
\ No newline at end of file
@@ -1,7 +1,19 @@
 from django.urls import path
-from .views import AccountListCreateAPIView, AccountRetrieveUpdateDeleteAPIView
+from utils.async_views import read_view
+from .views import (
+    AccountAsyncListView,
+    AccountAsyncRetrieveView,
+    AccountBatchRetrieveAPIView,
+    AccountBulkAPIView,
+    AccountExportAPIView,
+    AccountImportAPIView,
+)
 
 urlpatterns = [
-    path('', AccountListCreateAPIView.as_view(), name='account-list-create'),
-    path('<int:pk>/', AccountRetrieveUpdateDeleteAPIView.as_view(), name='account-retrieve-update-delete'),
+    path('', read_view(AccountAsyncListView), name='account-list-create'),
+    path('batch/', AccountBatchRetrieveAPIView.as_view(), name='account-batch-retrieve'),
+    path('bulk/', AccountBulkAPIView.as_view(), name='account-bulk'),
+    path('export/', AccountExportAPIView.as_view(), name='account-export'),
+    path('import/', AccountImportAPIView.as_view(), name='account-import'),
+    path('<int:pk>/', read_view(AccountAsyncRetrieveView), name='account-retrieve-update-delete'),
 ]
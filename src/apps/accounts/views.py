@@ -1,12 +1,22 @@
-from drf_yasg.utils import swagger_auto_schema
+from utils.api_schema import swagger_auto_schema
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework.exceptions import ValidationError
 from rest_framework.generics import ListCreateAPIView
 from utils.pagination import CustomPagination
 from .serializers import AccountSerializer
 from .models import Account
 from utils.response_formatter import custom_response
+from utils.async_views import AsyncListView, AsyncRetrieveView
+from utils.batch import BatchRetrieveAPIView
+from utils.bulk import BulkWriteAPIView
+from utils.conditional import apply_validators, is_not_modified, not_modified_response
+from utils.export import StreamingExportAPIView
+from utils.filters import DeclaredFilterBackend, StableOrderingFilter
+from utils.importer import BulkImportAPIView
+from utils.partial_update import PreconditionFailed, partial_update
+from utils.reads import get_detail, get_list_page
 
 class AccountListCreateAPIView(ListCreateAPIView):
     """
@@ -15,18 +25,28 @@ class AccountListCreateAPIView(ListCreateAPIView):
     queryset = Account.objects.all()
     serializer_class = AccountSerializer
     pagination_class = CustomPagination
+    pagination_mode = 'page'  # Set to 'cursor' to default to keyset pagination
+    count_strategy = 'exact'  # Or 'cached' / 'estimated'; clients may send ?count=
+    filter_backends = [DeclaredFilterBackend, StableOrderingFilter]
+    filter_fields = {
+        'account_type': 'exact',
+        'code': 'prefix',
+        'name': 'prefix',
+        'created_at': 'range',
+        'updated_at': 'range',
+    }
+    ordering_fields = ['account_id', 'code', 'name', 'created_at', 'updated_at']
+    ordering = ['account_id']
 
     def list(self, request):
-        queryset = self.filter_queryset(self.get_queryset())
-        paginator = self.pagination_class()
-        paginated_queryset = paginator.paginate_queryset(queryset, request)
-        serializer = self.get_serializer(paginated_queryset, many=True)
-        return paginator.get_paginated_response(serializer.data)
+        page = get_list_page(self, request)
+        if is_not_modified(request, page["validators"]):
+            return not_modified_response(page["validators"])
+        return apply_validators(Response(page["body"]), page["validators"])
 
     def create(self, request):
         serializer = self.get_serializer(data=request.data)
-        if serializer.is_valid():
-            serializer.save()
+        if serializer.is_valid() and serializer.try_save():
             response_data = custom_response(
                 message="Account created successfully",
                 code=201,
@@ -52,14 +72,7 @@ class AccountRetrieveUpdateDeleteAPIView(APIView):
     )
     def get(self, request, pk):
         try:
-            account = Account.objects.get(pk=pk)
-            serializer = AccountSerializer(account)
-            response_data = custom_response(
-                message="Account retrieved successfully",
-                code=200,
-                data=serializer.data,
-            )
-            return Response(response_data, status=status.HTTP_200_OK)
+            data, validators = get_detail(request, AccountSerializer, pk)
         except Account.DoesNotExist:
             response_data = custom_response(
                 message="Account not found",
@@ -67,6 +80,14 @@ class AccountRetrieveUpdateDeleteAPIView(APIView):
                 errors={"detail": "Account does not exist"},
             )
             return Response(response_data, status=status.HTTP_404_NOT_FOUND)
+        if data is None:
+            return not_modified_response(validators)
+        response_data = custom_response(
+            message="Account retrieved successfully",
+            code=200,
+            data=data,
+        )
+        return apply_validators(Response(response_data, status=status.HTTP_200_OK), validators)
 
     @swagger_auto_schema(
         operation_summary="Update Account",
@@ -78,8 +99,7 @@ class AccountRetrieveUpdateDeleteAPIView(APIView):
         try:
             account = Account.objects.get(pk=pk)
             serializer = AccountSerializer(account, data=request.data)
-            if serializer.is_valid():
-                serializer.save()
+            if serializer.is_valid() and serializer.try_save():
                 response_data = custom_response(
                     message="Account updated successfully",
                     code=200,
@@ -100,6 +120,48 @@ class AccountRetrieveUpdateDeleteAPIView(APIView):
             )
             return Response(response_data, status=status.HTTP_404_NOT_FOUND)
 
+    @swagger_auto_schema(
+        operation_summary="Partially Update Account",
+        operation_description=(
+            "Update only the supplied fields of an account with a single UPDATE (a change to a searched field "
+            "also rewrites its search entry on commit). The response holds only the primary key, the supplied "
+            "fields and updated_at. Send If-Match (the ETag from GET) or If-Unmodified-Since to reject the "
+            "change if the account was modified in the meantime."
+        ),
+        request_body=AccountSerializer,
+        responses={200: AccountSerializer, 404: "Account not found", 412: "Account was modified"},
+    )
+    def patch(self, request, pk):
+        try:
+            data = partial_update(request, AccountSerializer, pk)
+        except ValidationError as exc:
+            response_data = custom_response(
+                message="Account update failed",
+                code=400,
+                errors=exc.detail,
+            )
+            return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
+        except PreconditionFailed as exc:
+            response_data = custom_response(
+                message="Account update failed",
+                code=412,
+                errors={"detail": str(exc)},
+            )
+            return Response(response_data, status=status.HTTP_412_PRECONDITION_FAILED)
+        except Account.DoesNotExist:
+            response_data = custom_response(
+                message="Account not found",
+                code=404,
+                errors={"detail": "Account does not exist"},
+            )
+            return Response(response_data, status=status.HTTP_404_NOT_FOUND)
+        response_data = custom_response(
+            message="Account updated successfully",
+            code=200,
+            data=data,
+        )
+        return Response(response_data, status=status.HTTP_200_OK)
+
     @swagger_auto_schema(
         operation_summary="Delete Account",
         operation_description="Delete a specific account by ID.",
@@ -122,3 +184,52 @@ class AccountRetrieveUpdateDeleteAPIView(APIView):
                 errors={"detail": "Account does not exist"},
             )
             return Response(response_data, status=status.HTTP_404_NOT_FOUND)
+
+
+class AccountBatchRetrieveAPIView(BatchRetrieveAPIView):
+    """
+    Retrieves many accounts by ID in one call.
+    """
+    serializer_class = AccountSerializer
+    entity_name = "Account"
+
+
+class AccountBulkAPIView(BulkWriteAPIView):
+    """
+    Handles creating, updating, and deleting accounts in batches.
+    """
+    serializer_class = AccountSerializer
+    entity_name = "Account"
+
+
+class AccountExportAPIView(StreamingExportAPIView):
+    """
+    Streams all accounts as NDJSON or CSV.
+    """
+    serializer_class = AccountSerializer
+    entity_name = "Account"
+    filter_fields = ('account_type',)
+
+
+class AccountImportAPIView(BulkImportAPIView):
+    """
+    Imports accounts from an uploaded CSV or NDJSON file.
+    """
+    serializer_class = AccountSerializer
+    entity_name = "Account"
+
+
+class AccountAsyncListView(AsyncListView):
+    """
+    Async (ASGI) list of accounts; creates go to `AccountListCreateAPIView`.
+    """
+    sync_view_class = AccountListCreateAPIView
+
+
+class AccountAsyncRetrieveView(AsyncRetrieveView):
+    """
+    Async (ASGI) retrieve of a account; updates and deletes go to `AccountRetrieveUpdateDeleteAPIView`.
+    """
+    sync_view_class = AccountRetrieveUpdateDeleteAPIView
+    serializer_class = AccountSerializer
+    entity_name = "Account"
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class CustomersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "src.apps.customers"
+
+    def ready(self):
+        from utils.cache import api_cache
+        api_cache.register(self.get_model("Customer"))
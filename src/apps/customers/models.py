@@ -5,7 +5,7 @@ class Customer(models.Model):
     Represents a customer, completely standalone.
     """
     customer_id = models.AutoField(primary_key=True)
-    name = models.CharField(max_length=255)
+    name = models.CharField(max_length=255, db_index=True)
     email = models.EmailField(unique=True)
     phone = models.CharField(max_length=15, blank=True, null=True)
     address = models.TextField(blank=True, null=True)
@@ -13,5 +13,11 @@ class Customer(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['created_at', 'customer_id'], name='customer_created_id_idx'),
+            models.Index(fields=['updated_at', 'customer_id'], name='customer_updated_id_idx'),
+        ]
+
     def __str__(self):
         return self.name
@@ -1,7 +1,12 @@
 from rest_framework import serializers
+from utils.fast_serializers import FastReadSerializerMixin
+from utils.fieldsets import SparseFieldsetMixin
+from utils.integrity import ConstraintUniquenessMixin
 from .models import Customer
 
-class CustomerSerializer(serializers.ModelSerializer):
+class CustomerSerializer(
+    SparseFieldsetMixin, FastReadSerializerMixin, ConstraintUniquenessMixin, serializers.ModelSerializer
+):
     class Meta:
         model = Customer
         fields = '__all__'
\ No newline at end of file
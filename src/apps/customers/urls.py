@@ -1,7 +1,19 @@
 from django.urls import path
-from .views import CustomerListCreateAPIView, CustomerRetrieveUpdateDeleteAPIView
+from utils.async_views import read_view
+from .views import (
+    CustomerAsyncListView,
+    CustomerAsyncRetrieveView,
+    CustomerBatchRetrieveAPIView,
+    CustomerBulkAPIView,
+    CustomerExportAPIView,
+    CustomerImportAPIView,
+)
 
 urlpatterns = [
-    path('', CustomerListCreateAPIView.as_view(), name='customer-list-create'),
-    path('<int:pk>/', CustomerRetrieveUpdateDeleteAPIView.as_view(), name='customer-retrieve-update-delete'),
+    path('', read_view(CustomerAsyncListView), name='customer-list-create'),
+    path('batch/', CustomerBatchRetrieveAPIView.as_view(), name='customer-batch-retrieve'),
+    path('bulk/', CustomerBulkAPIView.as_view(), name='customer-bulk'),
+    path('export/', CustomerExportAPIView.as_view(), name='customer-export'),
+    path('import/', CustomerImportAPIView.as_view(), name='customer-import'),
+    path('<int:pk>/', read_view(CustomerAsyncRetrieveView), name='customer-retrieve-update-delete'),
 ]
\ No newline at end of file
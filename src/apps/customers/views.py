@@ -1,12 +1,22 @@
-from drf_yasg.utils import swagger_auto_schema
+from utils.api_schema import swagger_auto_schema
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework.exceptions import ValidationError
 from rest_framework.generics import ListCreateAPIView
 from utils.pagination import CustomPagination
 from .serializers import CustomerSerializer
 from .models import Customer
 from utils.response_formatter import custom_response
+from utils.async_views import AsyncListView, AsyncRetrieveView
+from utils.batch import BatchRetrieveAPIView
+from utils.bulk import BulkWriteAPIView
+from utils.conditional import apply_validators, is_not_modified, not_modified_response
+from utils.export import StreamingExportAPIView
+from utils.filters import DeclaredFilterBackend, StableOrderingFilter
+from utils.importer import BulkImportAPIView
+from utils.partial_update import PreconditionFailed, partial_update
+from utils.reads import get_detail, get_list_page
 
 class CustomerListCreateAPIView(ListCreateAPIView):
     """
@@ -15,18 +25,27 @@ class CustomerListCreateAPIView(ListCreateAPIView):
     queryset = Customer.objects.all()
     serializer_class = CustomerSerializer
     pagination_class = CustomPagination
+    pagination_mode = 'page'  # Set to 'cursor' to default to keyset pagination
+    count_strategy = 'exact'  # Or 'cached' / 'estimated'; clients may send ?count=
+    filter_backends = [DeclaredFilterBackend, StableOrderingFilter]
+    filter_fields = {
+        'email': 'exact',
+        'name': 'prefix',
+        'created_at': 'range',
+        'updated_at': 'range',
+    }
+    ordering_fields = ['customer_id', 'name', 'created_at', 'updated_at']
+    ordering = ['customer_id']
 
     def list(self, request):
-        queryset = self.filter_queryset(self.get_queryset())
-        paginator = self.pagination_class()
-        paginated_queryset = paginator.paginate_queryset(queryset, request)
-        serializer = self.get_serializer(paginated_queryset, many=True)
-        return paginator.get_paginated_response(serializer.data)
+        page = get_list_page(self, request)
+        if is_not_modified(request, page["validators"]):
+            return not_modified_response(page["validators"])
+        return apply_validators(Response(page["body"]), page["validators"])
 
     def create(self, request):
         serializer = self.get_serializer(data=request.data)
-        if serializer.is_valid():
-            serializer.save()
+        if serializer.is_valid() and serializer.try_save():
             response_data = custom_response(
                 message="Customer created successfully",
                 code=201,
@@ -52,14 +71,7 @@ class CustomerRetrieveUpdateDeleteAPIView(APIView):
     )
     def get(self, request, pk):
         try:
-            customer = Customer.objects.get(pk=pk)
-            serializer = CustomerSerializer(customer)
-            response_data = custom_response(
-                message="Customer retrieved successfully",
-                code=200,
-                data=serializer.data,
-            )
-            return Response(response_data, status=status.HTTP_200_OK)
+            data, validators = get_detail(request, CustomerSerializer, pk)
         except Customer.DoesNotExist:
             response_data = custom_response(
                 message="Customer not found",
@@ -67,6 +79,14 @@ class CustomerRetrieveUpdateDeleteAPIView(APIView):
                 errors={"detail": "Customer does not exist"},
             )
             return Response(response_data, status=status.HTTP_404_NOT_FOUND)
+        if data is None:
+            return not_modified_response(validators)
+        response_data = custom_response(
+            message="Customer retrieved successfully",
+            code=200,
+            data=data,
+        )
+        return apply_validators(Response(response_data, status=status.HTTP_200_OK), validators)
 
     @swagger_auto_schema(
         operation_summary="Update Customer",
@@ -78,8 +98,7 @@ class CustomerRetrieveUpdateDeleteAPIView(APIView):
         try:
             customer = Customer.objects.get(pk=pk)
             serializer = CustomerSerializer(customer, data=request.data)
-            if serializer.is_valid():
-                serializer.save()
+            if serializer.is_valid() and serializer.try_save():
                 response_data = custom_response(
                     message="Customer updated successfully",
                     code=200,
@@ -100,6 +119,48 @@ class CustomerRetrieveUpdateDeleteAPIView(APIView):
             )
             return Response(response_data, status=status.HTTP_404_NOT_FOUND)
 
+    @swagger_auto_schema(
+        operation_summary="Partially Update Customer",
+        operation_description=(
+            "Update only the supplied fields of a customer with a single UPDATE (a change to a searched field "
+            "also rewrites its search entry on commit). The response holds only the primary key, the supplied "
+            "fields and updated_at. Send If-Match (the ETag from GET) or If-Unmodified-Since to reject the "
+            "change if the customer was modified in the meantime."
+        ),
+        request_body=CustomerSerializer,
+        responses={200: CustomerSerializer, 404: "Customer not found", 412: "Customer was modified"},
+    )
+    def patch(self, request, pk):
+        try:
+            data = partial_update(request, CustomerSerializer, pk)
+        except ValidationError as exc:
+            response_data = custom_response(
+                message="Customer update failed",
+                code=400,
+                errors=exc.detail,
+            )
+            return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
+        except PreconditionFailed as exc:
+            response_data = custom_response(
+                message="Customer update failed",
+                code=412,
+                errors={"detail": str(exc)},
+            )
+            return Response(response_data, status=status.HTTP_412_PRECONDITION_FAILED)
+        except Customer.DoesNotExist:
+            response_data = custom_response(
+                message="Customer not found",
+                code=404,
+                errors={"detail": "Customer does not exist"},
+            )
+            return Response(response_data, status=status.HTTP_404_NOT_FOUND)
+        response_data = custom_response(
+            message="Customer updated successfully",
+            code=200,
+            data=data,
+        )
+        return Response(response_data, status=status.HTTP_200_OK)
+
     @swagger_auto_schema(
         operation_summary="Delete Customer",
         operation_description="Delete a specific customer by ID.",
@@ -122,3 +183,51 @@ class CustomerRetrieveUpdateDeleteAPIView(APIView):
                 errors={"detail": "Customer does not exist"},
             )
             return Response(response_data, status=status.HTTP_404_NOT_FOUND)
+
+
+class CustomerBatchRetrieveAPIView(BatchRetrieveAPIView):
+    """
+    Retrieves many customers by ID in one call.
+    """
+    serializer_class = CustomerSerializer
+    entity_name = "Customer"
+
+
+class CustomerBulkAPIView(BulkWriteAPIView):
+    """
+    Handles creating, updating, and deleting customers in batches.
+    """
+    serializer_class = CustomerSerializer
+    entity_name = "Customer"
+
+
+class CustomerExportAPIView(StreamingExportAPIView):
+    """
+    Streams all customers as NDJSON or CSV.
+    """
+    serializer_class = CustomerSerializer
+    entity_name = "Customer"
+
+
+class CustomerImportAPIView(BulkImportAPIView):
+    """
+    Imports customers from an uploaded CSV or NDJSON file.
+    """
+    serializer_class = CustomerSerializer
+    entity_name = "Customer"
+
+
+class CustomerAsyncListView(AsyncListView):
+    """
+    Async (ASGI) list of customers; creates go to `CustomerListCreateAPIView`.
+    """
+    sync_view_class = CustomerListCreateAPIView
+
+
+class CustomerAsyncRetrieveView(AsyncRetrieveView):
+    """
+    Async (ASGI) retrieve of a customer; updates and deletes go to `CustomerRetrieveUpdateDeleteAPIView`.
+    """
+    sync_view_class = CustomerRetrieveUpdateDeleteAPIView
+    serializer_class = CustomerSerializer
+    entity_name = "Customer"
@@ -0,0 +1,15 @@
+from django.apps import AppConfig
+
+
+class SearchConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "src.apps.search"
+
+    def ready(self):
+        from src.apps.accounts.models import Account
+        from src.apps.customers.models import Customer
+        from src.apps.vendors.models import Vendor
+        from .indexing import search_index
+        search_index.register('customers', Customer, fields=['name', 'email', 'phone'], subtitle='email')
+        search_index.register('vendors', Vendor, fields=['name', 'email', 'contact_person'], subtitle='email')
+        search_index.register('accounts', Account, fields=['name', 'code'], subtitle='code')
@@ -0,0 +1,347 @@
+import math
+import re
+import threading
+import time
+
+from django.conf import settings
+from django.db import connections, router, transaction
+from django.db.models.signals import post_delete, post_save
+from utils.bulk import IN_QUERY_CHUNK_SIZE
+from utils.signals import rows_changed
+from .models import SearchDocument, SearchGram
+
+WORD_RE = re.compile(r'[^\W_]+')
+
+
+def trigrams(text, prefix=False):
+    """
+    Return the set of trigrams of ``text`` in the style of pg_trgm: each
+    lower-cased word is padded with a blank on both sides. pg_trgm's extra
+    leading blank is left out; the single-letter gram it adds matches a large
+    share of all words and would dominate the cost of every lookup.
+
+    With ``prefix`` the last word is left open-ended, so a partly typed word
+    ("jam") matches the words it starts ("james").
+    """
+    words = WORD_RE.findall(text.lower())
+    grams = set()
+    for position, word in enumerate(words):
+        open_ended = prefix and position == len(words) - 1 and not text[-1:].isspace()
+        padded = f" {word}" if open_ended else f" {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class SearchableEntity:
+    """
+    How one model is indexed: its public name, the fields that are searched,
+    and the fields shown as a result's title and subtitle.
+    """
+
+    def __init__(self, name, model, fields, title='name', subtitle=None):
+        self.name = name
+        self.model = model
+        self.fields = fields
+        self.title = title
+        self.subtitle = subtitle
+
+    @property
+    def value_fields(self):
+        return ['pk', *dict.fromkeys([*self.fields, self.title, *([self.subtitle] if self.subtitle else [])])]
+
+    def covers(self, fields):
+        """
+        Whether a write of ``fields`` (None for any field) can change the
+        indexed document.
+        """
+        return fields is None or not set(self.value_fields).isdisjoint(fields)
+
+    def build(self, row):
+        """
+        Return an unsaved document and its trigrams for a ``values()`` row.
+        """
+        text = ' '.join(str(row[field]) for field in self.fields if row[field]).lower()
+        grams = trigrams(text)
+        document = SearchDocument(
+            entity=self.name,
+            object_id=row['pk'],
+            title=row[self.title] or '',
+            subtitle=(row[self.subtitle] or '') if self.subtitle else '',
+            text=text,
+            gram_count=len(grams),
+        )
+        return document, grams
+
+
+class SearchIndex:
+    """
+    Trigram inverted index over the registered entities.
+
+    Documents and their postings are stored in ``SearchDocument`` and
+    ``SearchGram`` so every worker process sees the same index. Saves,
+    deletes and bulk writes (``rows_changed``) that touch an indexed field
+    queue the row; the queue is indexed in one batch per entity when the
+    transaction commits. Writes of every row (``rows_changed`` without
+    ``pks``) leave the index alone; ``rebuild`` (the
+    ``rebuild_search_index`` command) recreates it from scratch.
+    """
+
+    def __init__(self):
+        self.entities = {}
+        self.local = threading.local()
+        self.frequency_cache = {}  # (postings filter, gram): (postings, counted up to, expires at)
+
+    @property
+    def options(self):
+        return settings.SEARCH
+
+    def register(self, name, model, fields, title='name', subtitle=None):
+        entity = SearchableEntity(name, model, fields, title, subtitle)
+        self.entities[name] = entity
+        uid = f"search-index-{name}"
+        post_save.connect(self.on_save, sender=model, dispatch_uid=uid)
+        post_delete.connect(self.on_delete, sender=model, dispatch_uid=uid)
+        rows_changed.connect(self.on_rows_changed, sender=model, dispatch_uid=uid)
+
+    def entity_for(self, model):
+        for entity in self.entities.values():
+            if entity.model is model:
+                return entity
+        return None
+
+    def insert(self, built):
+        """
+        Insert ``[(unsaved document, trigrams)]`` as built by
+        ``SearchableEntity.build``.
+        """
+        documents = SearchDocument.objects.bulk_create(
+            [document for document, _ in built], batch_size=settings.BULK_BATCH_SIZE
+        )
+        # Postings outnumber documents ~50 to 1; insert them as plain tuples
+        # rather than model instances.
+        postings = [
+            (gram, document.entity, document.pk)
+            for document, (_, grams) in zip(documents, built)
+            for gram in grams
+        ]
+        connection = connections[router.db_for_write(SearchGram)]
+        sql = 'INSERT INTO {} ({}, {}, {}) VALUES (%s, %s, %s)'.format(
+            *map(connection.ops.quote_name, (SearchGram._meta.db_table, 'gram', 'entity', 'document_id'))
+        )
+        with connection.cursor() as cursor:
+            cursor.executemany(sql, postings)
+        return len(documents)
+
+    def delete(self, documents, postings):
+        """
+        Delete the ``SearchDocument`` queryset ``documents`` and their
+        ``SearchGram`` queryset ``postings`` with one ``DELETE`` each.
+        """
+        postings.delete()
+        # The postings are gone, so the collector's cascade lookup is not needed.
+        documents._raw_delete(documents.db)
+
+    def index(self, entity, pks):
+        """
+        Bring the documents of ``pks`` in line with their rows: new rows are
+        added, changed ones rewritten and deleted ones removed. Rows whose
+        indexed text is unchanged cost the two reads alone.
+        """
+        for offset in range(0, len(pks), IN_QUERY_CHUNK_SIZE):
+            chunk = pks[offset:offset + IN_QUERY_CHUNK_SIZE]
+            rows = entity.model._default_manager.filter(pk__in=chunk).values(*entity.value_fields)
+            built = {row['pk']: entity.build(row) for row in rows}
+            current = SearchDocument.objects.filter(entity=entity.name, object_id__in=chunk)
+            stale = []
+            for document in current:
+                fresh = built.get(document.object_id)
+                if fresh and (fresh[0].title, fresh[0].subtitle, fresh[0].text) == (
+                    document.title, document.subtitle, document.text
+                ):
+                    del built[document.object_id]
+                else:
+                    stale.append(document.pk)
+            if not stale and not built:
+                continue
+            with transaction.atomic(using=router.db_for_write(SearchDocument)):
+                if stale:
+                    self.delete(SearchDocument.objects.filter(pk__in=stale), SearchGram.objects.filter(document_id__in=stale))
+                self.insert(list(built.values()))
+
+    def rebuild(self, entities=None, chunk_size=5000):
+        """
+        Drop and re-create the index for ``entities`` (all by default).
+        Returns ``{entity name: documents indexed}``.
+        """
+        counts = {}
+        for entity in entities or self.entities.values():
+            with transaction.atomic(using=router.db_for_write(SearchDocument)):
+                self.delete(
+                    SearchDocument.objects.filter(entity=entity.name), SearchGram.objects.filter(entity=entity.name)
+                )
+                rows = entity.model._default_manager.order_by('pk').values(*entity.value_fields)
+                batch, total = [], 0
+                for row in rows.iterator(chunk_size=chunk_size):
+                    batch.append(entity.build(row))
+                    if len(batch) >= chunk_size:
+                        total += self.insert(batch)
+                        batch = []
+                if batch:
+                    total += self.insert(batch)
+            counts[entity.name] = total
+        return counts
+
+    def schedule(self, entity, pks):
+        """
+        Queue ``pks`` of ``entity`` to be indexed when the current
+        transaction commits (at once outside a transaction).
+
+        Every change registers a commit callback because those of a
+        rolled-back transaction are dropped; the first callback to run
+        indexes the whole queue and the rest find it empty. Keys a rollback
+        leaves queued are indexed with the next commit, which re-reads them.
+
+        The callbacks are robust: the write is committed by then, so an
+        indexing error (such as a concurrent save of the same row adding its
+        document first) is logged rather than failing the request.
+        """
+        using = router.db_for_write(entity.model)
+        pending = self.local.__dict__.setdefault('pending', {}).setdefault(using, {})
+        pending.setdefault(entity.name, set()).update(pks)
+        # A closure rather than functools.partial: robust callbacks are logged by __qualname__.
+        transaction.on_commit(lambda: self.flush(using), using=using, robust=True)
+
+    def flush(self, using):
+        for name, pks in self.local.__dict__.get('pending', {}).pop(using, {}).items():
+            self.index(self.entities[name], sorted(pks))
+
+    def on_save(self, sender, instance, update_fields=None, **kwargs):
+        entity = self.entity_for(sender)
+        if self.options['AUTO_INDEX'] and entity.covers(update_fields):
+            self.schedule(entity, [instance.pk])
+
+    def on_delete(self, sender, instance, **kwargs):
+        if self.options['AUTO_INDEX']:
+            self.schedule(self.entity_for(sender), [instance.pk])
+
+    def on_rows_changed(self, sender, pks=None, fields=None, **kwargs):
+        entity = self.entity_for(sender)
+        if self.options['AUTO_INDEX'] and pks is not None and entity.covers(fields):
+            self.schedule(entity, pks)
+
+    def frequencies(self, postings, grams, cap):
+        """
+        Return ``{gram: postings}`` for ``grams``, each counted up to
+        ``cap``. Counts are reused for ``FREQUENCY_TTL`` seconds: the
+        keystrokes of a query share most of their grams, and a stale count
+        only changes how the postings budget is spent.
+        """
+        now = time.monotonic()
+        key = postings.query.where
+        cached = {gram: self.frequency_cache.get((str(key), gram)) for gram in grams}
+        counts = {
+            gram: entry[0] for gram, entry in cached.items()
+            if entry and entry[2] > now and (entry[0] < entry[1] or entry[1] >= cap)
+        }
+        missing = [gram for gram in grams if gram not in counts]
+        if missing:
+            connection = connections[postings.db]
+            columns, params = [], []
+            for gram in missing:
+                sample = postings.filter(gram=gram).values('document_id')[:cap]
+                sql, sample_params = sample.query.get_compiler(connection=connection).as_sql()
+                columns.append(f'(SELECT COUNT(*) FROM ({sql}) sample)')
+                params.extend(sample_params)
+            with connection.cursor() as cursor:
+                cursor.execute(f'SELECT {", ".join(columns)}', params)
+                counts.update(zip(missing, cursor.fetchone()))
+            if len(self.frequency_cache) > 10000:
+                self.frequency_cache.clear()
+            expires = now + self.options['FREQUENCY_TTL']
+            self.frequency_cache.update(((str(key), gram), (counts[gram], cap, expires)) for gram in missing)
+        return counts
+
+    def candidates(self, postings, grams):
+        """
+        Return ``{document id: shared grams}`` for the ``CANDIDATES``
+        documents sharing the most of ``grams``, and the grams left out of
+        the counts.
+
+        At most ``POSTINGS_BUDGET`` postings are read. The rarest grams are
+        read in full; the common ones ("ing", " sa") share what is left of
+        the budget, only help pick candidates from their first postings,
+        and are left for ``search`` to check on the candidates' text.
+        Below the budget every posting is counted, as one ``GROUP BY``.
+        """
+        budget = self.options['POSTINGS_BUDGET']
+        cap = budget // len(grams)
+        frequencies = self.frequencies(postings, grams, cap)
+        full, sampled = [], {}
+        for position, gram in enumerate(sorted(grams, key=lambda gram: (frequencies[gram], gram))):
+            limit = budget // (len(grams) - position)
+            if frequencies[gram] < min(cap, limit):  # Otherwise the count was cut off at `cap`
+                full.append(gram)
+            else:
+                sampled[gram] = limit
+            budget -= min(frequencies[gram], limit)
+
+        connection = connections[postings.db]
+        reads = [(postings.filter(gram__in=full).values('document_id'), 1)] if full else []
+        reads += [(postings.filter(gram=gram).values('document_id')[:limit], 0) for gram, limit in sampled.items()]
+        selects, params = [], []
+        for queryset, counted in reads:
+            sql, read_params = queryset.query.get_compiler(connection=connection).as_sql()
+            selects.append(f'SELECT document_id, {counted} AS counted FROM ({sql}) postings')
+            params.extend(read_params)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT document_id, SUM(counted) FROM ({" UNION ALL ".join(selects)}) postings '
+                f'GROUP BY document_id ORDER BY COUNT(*) DESC, document_id LIMIT %s',
+                [*params, self.options['CANDIDATES']],
+            )
+            return dict(cursor.fetchall()), list(sampled)
+
+    def search(self, query, entities=None, limit=10):
+        """
+        Return up to ``limit`` ranked matches for ``query``.
+
+        Candidates are the documents sharing the most of the query's
+        trigrams (see ``candidates``), found from the covering ``(gram,
+        entity, document)`` index. Those sharing at least ``MIN_MATCH`` of
+        them are ranked by trigram similarity, with a boost when the title
+        starts with the query or the searched text contains it verbatim.
+        """
+        grams = sorted(trigrams(query, prefix=True))
+        if not grams:
+            return []
+        postings = SearchGram.objects.filter(entity__in=entities) if entities else SearchGram.objects.all()
+        min_hits = max(1, math.ceil(len(grams) * self.options['MIN_MATCH']))
+        hits, unchecked = self.candidates(postings, grams)
+        needle = query.strip().lower()
+
+        results = []
+        for document in SearchDocument.objects.filter(pk__in=list(hits)):
+            shared = hits[document.pk]
+            if unchecked:
+                # Every trigram of the document is a substring of its padded words.
+                padded = f" {'  '.join(WORD_RE.findall(document.text))} "
+                shared += sum(gram in padded for gram in unchecked)
+            if shared < min_hits:
+                continue
+            score = shared / (len(grams) + document.gram_count - shared)
+            if document.title.lower().startswith(needle):
+                score += 1
+            elif needle in document.text:
+                score += 0.5
+            results.append({
+                "type": document.entity,
+                "id": document.object_id,
+                "title": document.title,
+                "subtitle": document.subtitle,
+                "score": round(score, 4),
+            })
+        results.sort(key=lambda result: (-result["score"], result["title"], result["id"]))
+        return results[:limit]
+
+
+search_index = SearchIndex()
@@ -0,0 +1,24 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from src.apps.search.indexing import search_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the trigram search index from the customer, vendor and account tables."
+
+    def add_arguments(self, parser):
+        parser.add_argument('entities', nargs='*', help="Entities to rebuild (default: all), e.g. customers vendors.")
+        parser.add_argument('--chunk-size', type=int, default=5000, help="Rows indexed per batch.")
+
+    def handle(self, *args, **options):
+        unknown = set(options['entities']) - set(search_index.entities)
+        if unknown:
+            raise CommandError(f"Unknown entities: {', '.join(sorted(unknown))}.")
+        entities = [search_index.entities[name] for name in options['entities']] or None
+
+        started = time.monotonic()
+        counts = search_index.rebuild(entities, chunk_size=options['chunk_size'])
+        for name, count in counts.items():
+            self.stdout.write(f"{name}: {count} documents")
+        self.stdout.write(self.style.SUCCESS(f"Search index rebuilt in {time.monotonic() - started:.1f}s."))
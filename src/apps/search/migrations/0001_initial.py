@@ -0,0 +1,41 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:21
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchDocument",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("entity", models.CharField(max_length=20)),
+                ("object_id", models.IntegerField()),
+                ("title", models.CharField(max_length=255)),
+                ("subtitle", models.CharField(blank=True, max_length=255)),
+                ("text", models.TextField()),
+                ("gram_count", models.PositiveIntegerField()),
+            ],
+            options={
+                "constraints": [models.UniqueConstraint(fields=("entity", "object_id"), name="search_document_entity_object_uniq")],
+            },
+        ),
+        migrations.CreateModel(
+            name="SearchGram",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("gram", models.CharField(max_length=3)),
+                ("entity", models.CharField(max_length=20)),
+                ("document", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name="grams", to="search.searchdocument")),
+            ],
+            options={
+                "indexes": [models.Index(fields=["gram", "entity", "document"], name="search_gram_lookup_idx")],
+            },
+        ),
+    ]
@@ -0,0 +1,35 @@
+from django.db import models
+
+class SearchDocument(models.Model):
+    """
+    One searchable row of another app (a customer, vendor or account).
+    """
+    entity = models.CharField(max_length=20)
+    object_id = models.IntegerField()
+    title = models.CharField(max_length=255)
+    subtitle = models.CharField(max_length=255, blank=True)
+    text = models.TextField()  # Lower-cased searchable fields, joined by spaces
+    gram_count = models.PositiveIntegerField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['entity', 'object_id'], name='search_document_entity_object_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.entity}:{self.object_id} {self.title}"
+
+
+class SearchGram(models.Model):
+    """
+    Posting of one trigram in one document. ``entity`` is copied from the
+    document so type-filtered lookups are answered from the index alone.
+    """
+    gram = models.CharField(max_length=3)
+    entity = models.CharField(max_length=20)
+    document = models.ForeignKey(SearchDocument, on_delete=models.CASCADE, related_name='grams')
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['gram', 'entity', 'document'], name='search_gram_lookup_idx'),
+        ]
@@ -0,0 +1,53 @@
+from django.conf import settings
+from utils.api_schema import openapi, swagger_auto_schema
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from utils.response_formatter import custom_response
+from .indexing import search_index
+
+
+class SearchAPIView(APIView):
+    """
+    Typeahead search across customers, vendors and accounts.
+    """
+
+    @swagger_auto_schema(
+        operation_summary="Search",
+        operation_description="Ranked fuzzy search across customers, vendors and accounts.",
+        manual_parameters=[
+            openapi.Parameter('q', openapi.IN_QUERY, type=openapi.TYPE_STRING, required=True),
+            openapi.Parameter('types', openapi.IN_QUERY, type=openapi.TYPE_STRING,
+                              description="Comma-separated subset of customers, vendors, accounts."),
+            openapi.Parameter('limit', openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+        ],
+    )
+    def get(self, request):
+        query = request.query_params.get('q', '').strip()
+        types = [name for name in request.query_params.get('types', '').split(',') if name]
+        errors = {}
+        if len(query) < settings.SEARCH['MIN_QUERY_LENGTH']:
+            errors["q"] = [f"Enter at least {settings.SEARCH['MIN_QUERY_LENGTH']} characters."]
+        unknown = sorted(set(types) - set(search_index.entities))
+        if unknown:
+            errors["types"] = [f"Unknown types: {', '.join(unknown)}."]
+        try:
+            limit = int(request.query_params.get('limit', 10))
+        except ValueError:
+            limit = 0
+        if not 1 <= limit <= settings.SEARCH['MAX_RESULTS']:
+            errors["limit"] = [f"Expected an integer between 1 and {settings.SEARCH['MAX_RESULTS']}."]
+        if errors:
+            return Response(custom_response(
+                message="Search failed",
+                code=400,
+                errors=errors,
+            ), status=status.HTTP_400_BAD_REQUEST)
+
+        results = search_index.search(query, entities=types, limit=limit)
+        response_data = custom_response(
+            message="Search results retrieved successfully",
+            code=200,
+            data={"query": query, "results": results},
+        )
+        return Response(response_data, status=status.HTTP_200_OK)
@@ -0,0 +1,18 @@
+from django.apps import AppConfig
+
+
+class SyncConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "src.apps.sync"
+
+    def ready(self):
+        from src.apps.accounts.models import Account
+        from src.apps.accounts.serializers import AccountSerializer
+        from src.apps.customers.models import Customer
+        from src.apps.customers.serializers import CustomerSerializer
+        from src.apps.vendors.models import Vendor
+        from src.apps.vendors.serializers import VendorSerializer
+        from .changes import change_feed
+        change_feed.register('customers', Customer, CustomerSerializer)
+        change_feed.register('vendors', Vendor, VendorSerializer)
+        change_feed.register('accounts', Account, AccountSerializer)
@@ -0,0 +1,162 @@
+import base64
+import json
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Max, Q
+from django.db.models.signals import post_delete
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from utils.db_router import reading_from_replica
+from utils.signals import rows_changed
+from .models import Tombstone
+
+
+class InvalidWatermark(ValueError):
+    pass
+
+
+class ExpiredWatermark(ValueError):
+    pass
+
+
+class Watermark:
+    """
+    Position of a client in an entity's change feed: the last row seen in
+    ``(updated_at, pk)`` order, the last tombstone id seen, and when the
+    watermark was issued. Sent to clients as an opaque token.
+    """
+
+    def __init__(self, updated_at=None, pk=0, tombstone_id=0, issued_at=None):
+        self.updated_at = updated_at
+        self.pk = pk
+        self.tombstone_id = tombstone_id
+        self.issued_at = issued_at or timezone.now()
+
+    def encode(self):
+        payload = {
+            "u": self.updated_at.isoformat() if self.updated_at else None,
+            "p": self.pk,
+            "t": self.tombstone_id,
+            "at": self.issued_at.isoformat(),
+        }
+        return base64.urlsafe_b64encode(json.dumps(payload, separators=(',', ':')).encode()).decode().rstrip('=')
+
+    @classmethod
+    def decode(cls, token):
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)))
+            updated_at = parse_datetime(payload["u"]) if payload["u"] else None
+            issued_at = parse_datetime(payload["at"])
+            if issued_at is None or (payload["u"] and updated_at is None):
+                raise ValueError
+            return cls(updated_at, int(payload["p"]), int(payload["t"]), issued_at)
+        except (ValueError, TypeError, KeyError, AttributeError):
+            raise InvalidWatermark("Invalid sync token.")
+
+
+class SyncedEntity:
+
+    def __init__(self, name, model, serializer_class):
+        self.name = name
+        self.model = model
+        self.serializer_class = serializer_class
+
+
+class ChangeFeed:
+    """
+    Incremental change feed over the registered entities.
+
+    Rows are read in ``(updated_at, pk)`` order from the composite
+    ``updated_at`` index, and deletes from ``Tombstone`` rows written on
+    ``post_delete`` (single deletes) and on ``rows_changed`` with
+    ``deleted=True`` (bulk deletes). Changes
+    younger than ``SETTLE_SECONDS`` are held back until a later call, so a
+    transaction that commits after a younger one is not skipped. Read from
+    a replica, the feed also holds back the replica's lag window: commits
+    within it may not have been replayed yet.
+    """
+
+    def __init__(self):
+        self.entities = {}
+
+    @property
+    def options(self):
+        return settings.SYNC
+
+    def register(self, name, model, serializer_class):
+        self.entities[name] = SyncedEntity(name, model, serializer_class)
+        post_delete.connect(self.on_delete, sender=model, dispatch_uid=f"sync-tombstone-{name}")
+        rows_changed.connect(self.on_rows_changed, sender=model, dispatch_uid=f"sync-tombstone-{name}")
+
+    def entity_for(self, model):
+        for entity in self.entities.values():
+            if entity.model is model:
+                return entity
+        return None
+
+    def on_delete(self, sender, instance, **kwargs):
+        Tombstone.objects.create(entity=self.entity_for(sender).name, object_id=instance.pk)
+
+    def on_rows_changed(self, sender, pks=None, deleted=False, **kwargs):
+        if deleted and pks:
+            name = self.entity_for(sender).name
+            Tombstone.objects.bulk_create(
+                [Tombstone(entity=name, object_id=pk) for pk in pks], batch_size=settings.BULK_BATCH_SIZE,
+            )
+
+    def start(self, entity, updated_since=None):
+        """
+        Watermark for a client starting from scratch (every row, deletes
+        from now on) or from ``updated_since`` (changes since that time).
+        """
+        tombstones = Tombstone.objects.filter(entity=entity.name)
+        if updated_since is not None:
+            tombstones = tombstones.filter(deleted_at__lt=updated_since)
+        last_tombstone = tombstones.aggregate(last=Max('pk'))['last'] or 0
+        return Watermark(updated_at=updated_since, tombstone_id=last_tombstone)
+
+    def changes(self, entity, watermark, limit):
+        """
+        Return ``(rows, deleted pks, next watermark, has_more)``. Clients
+        apply the rows before the deletes.
+        """
+        now = timezone.now()
+        if watermark.issued_at < now - timedelta(days=self.options['TOMBSTONE_RETENTION_DAYS']):
+            raise ExpiredWatermark("The sync token is older than the tombstone retention period; resync in full.")
+        settle = self.options['SETTLE_SECONDS']
+        if reading_from_replica():
+            # Replicas are used while within MAX_LAG at the last lag check.
+            settle += settings.REPLICA_ROUTING['MAX_LAG'] + settings.REPLICA_ROUTING['LAG_CHECK_INTERVAL']
+        horizon = now - timedelta(seconds=settle)
+
+        rows = entity.model._default_manager.filter(updated_at__lt=horizon)
+        if watermark.updated_at is not None:
+            # The >= bound lets the index seek; the OR only trims ties.
+            rows = rows.filter(
+                Q(updated_at__gt=watermark.updated_at) | Q(pk__gt=watermark.pk),
+                updated_at__gte=watermark.updated_at,
+            )
+        rows = list(rows.order_by('updated_at', 'pk')[:limit + 1])
+        tombstones = list(
+            Tombstone.objects.filter(entity=entity.name, pk__gt=watermark.tombstone_id, deleted_at__lt=horizon)
+            .order_by('pk').values_list('pk', 'object_id')[:limit + 1]
+        )
+        more_tombstones = len(tombstones) > limit
+        has_more = len(rows) > limit or more_tombstones
+        rows, tombstones = rows[:limit], tombstones[:limit]
+
+        # A watermark stays valid while no tombstone it has not seen is
+        # pruned: those are all younger than the horizon, unless this page
+        # left older ones unread.
+        issued_at = watermark.issued_at if more_tombstones else horizon
+        next_watermark = Watermark(watermark.updated_at, watermark.pk, watermark.tombstone_id, issued_at)
+        if rows:
+            next_watermark.updated_at, next_watermark.pk = rows[-1].updated_at, rows[-1].pk
+        if tombstones:
+            next_watermark.tombstone_id = tombstones[-1][0]
+        deleted = list(dict.fromkeys(object_id for _, object_id in tombstones))
+        return rows, deleted, next_watermark, has_more
+
+
+change_feed = ChangeFeed()
@@ -0,0 +1,15 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from src.apps.sync.models import Tombstone
+
+
+class Command(BaseCommand):
+    help = "Delete tombstones older than SYNC['TOMBSTONE_RETENTION_DAYS']."
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=settings.SYNC['TOMBSTONE_RETENTION_DAYS'])
+        deleted, _ = Tombstone.objects.filter(deleted_at__lt=cutoff).delete()
+        self.stdout.write(self.style.SUCCESS(f"Pruned {deleted} tombstones deleted before {cutoff:%Y-%m-%d %H:%M}."))
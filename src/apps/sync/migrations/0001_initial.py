@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:50
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="Tombstone",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("entity", models.CharField(max_length=20)),
+                ("object_id", models.IntegerField()),
+                ("deleted_at", models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["entity", "id"], name="sync_tombstone_entity_id_idx"),
+                    models.Index(fields=["deleted_at"], name="sync_tombstone_deleted_idx"),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,21 @@
+from django.db import models
+from django.utils import timezone
+
+
+class Tombstone(models.Model):
+    """
+    Record of a deleted customer, vendor or account, kept so delta-sync
+    clients can delete their copy. Pruned after ``TOMBSTONE_RETENTION_DAYS``.
+    """
+    entity = models.CharField(max_length=20)
+    object_id = models.IntegerField()
+    deleted_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['entity', 'id'], name='sync_tombstone_entity_id_idx'),
+            models.Index(fields=['deleted_at'], name='sync_tombstone_deleted_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.entity}:{self.object_id} deleted {self.deleted_at:%Y-%m-%d %H:%M}"
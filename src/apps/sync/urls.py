@@ -0,0 +1,6 @@
+from django.urls import path
+from .views import ChangesAPIView
+
+urlpatterns = [
+    path('<str:entity>/', ChangesAPIView.as_view(), name='sync-changes'),
+]
@@ -0,0 +1,98 @@
+from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from utils.api_schema import openapi, swagger_auto_schema
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from utils.response_formatter import custom_response
+from .changes import ExpiredWatermark, InvalidWatermark, Watermark, change_feed
+
+
+class ChangesAPIView(APIView):
+    """
+    Delta-sync feed of one entity (customers, vendors or accounts).
+    """
+
+    @swagger_auto_schema(
+        operation_summary="Sync Changes",
+        operation_description=(
+            "Rows changed and ids deleted since the `since` token, oldest first. Start without a token "
+            "(or with `updated_since`), apply `results` then `deleted`, and call again with `next` "
+            "while `hasMore` is true."
+        ),
+        manual_parameters=[
+            openapi.Parameter('since', openapi.IN_QUERY, type=openapi.TYPE_STRING,
+                              description="The `next` token of the previous call."),
+            openapi.Parameter('updated_since', openapi.IN_QUERY, type=openapi.TYPE_STRING,
+                              description="ISO 8601 datetime to start from instead of a token."),
+            openapi.Parameter('limit', openapi.IN_QUERY, type=openapi.TYPE_INTEGER),
+        ],
+    )
+    def get(self, request, entity):
+        feed_entity = change_feed.entities.get(entity)
+        if feed_entity is None:
+            return Response(custom_response(
+                message="Sync failed",
+                code=404,
+                errors={"detail": f"Unknown entity: {entity}."},
+            ), status=status.HTTP_404_NOT_FOUND)
+        try:
+            watermark, limit = self.parse_params(request, feed_entity)
+            rows, deleted, next_watermark, has_more = change_feed.changes(feed_entity, watermark, limit)
+        except ExpiredWatermark as exc:
+            return Response(custom_response(
+                message="Sync failed",
+                code=410,
+                errors={"since": [str(exc)]},
+            ), status=status.HTTP_410_GONE)
+        except ValueError as exc:
+            return Response(custom_response(
+                message="Sync failed",
+                code=400,
+                errors=exc.args[0],
+            ), status=status.HTTP_400_BAD_REQUEST)
+
+        response_data = custom_response(
+            message="Changes retrieved successfully",
+            code=200,
+            data={
+                "results": feed_entity.serializer_class(rows, many=True).data,
+                "deleted": deleted,
+                "next": next_watermark.encode(),
+                "hasMore": has_more,
+            },
+        )
+        return Response(response_data, status=status.HTTP_200_OK)
+
+    def parse_params(self, request, entity):
+        """
+        Return ``(watermark, limit)``; raises ``ValueError`` with an errors dict.
+        """
+        params = request.query_params
+        errors = {}
+        watermark = None
+        if params.get('since'):
+            try:
+                watermark = Watermark.decode(params['since'])
+            except InvalidWatermark as exc:
+                errors["since"] = [str(exc)]
+        else:
+            updated_since = None
+            if params.get('updated_since'):
+                updated_since = parse_datetime(params['updated_since'])
+                if updated_since is None:
+                    errors["updated_since"] = ["Expected an ISO 8601 datetime."]
+                elif timezone.is_naive(updated_since):
+                    updated_since = timezone.make_aware(updated_since)
+            if not errors:
+                watermark = change_feed.start(entity, updated_since)
+        try:
+            limit = int(params.get('limit', settings.SYNC['PAGE_SIZE']))
+        except ValueError:
+            limit = 0
+        if not 1 <= limit <= settings.SYNC['MAX_PAGE_SIZE']:
+            errors["limit"] = [f"Expected an integer between 1 and {settings.SYNC['MAX_PAGE_SIZE']}."]
+        if errors:
+            raise ValueError(errors)
+        return watermark, limit
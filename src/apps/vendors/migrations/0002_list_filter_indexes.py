@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-18 18:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("vendors", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="vendor",
+            name="name",
+            field=models.CharField(db_index=True, max_length=255),
+        ),
+        migrations.AddIndex(
+            model_name="vendor",
+            index=models.Index(fields=["created_at", "vendor_id"], name="vendor_created_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="vendor",
+            index=models.Index(fields=["updated_at", "vendor_id"], name="vendor_updated_id_idx"),
+        ),
+    ]
@@ -5,7 +5,7 @@ class Vendor(models.Model):
     Represents a vendor or supplier, completely standalone.
     """
     vendor_id = models.AutoField(primary_key=True)
-    name = models.CharField(max_length=255)
+    name = models.CharField(max_length=255, db_index=True)
     email = models.EmailField(unique=True)
     phone = models.CharField(max_length=15, blank=True, null=True)
     address = models.TextField(blank=True, null=True)
@@ -13,5 +13,11 @@ class Vendor(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['created_at', 'vendor_id'], name='vendor_created_id_idx'),
+            models.Index(fields=['updated_at', 'vendor_id'], name='vendor_updated_id_idx'),
+        ]
+
     def __str__(self):
         return self.name
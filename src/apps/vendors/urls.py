@@ -1,7 +1,19 @@
 from django.urls import path
-from .views import VendorListCreateAPIView, VendorRetrieveUpdateDeleteAPIView
+from utils.async_views import read_view
+from .views import (
+    VendorAsyncListView,
+    VendorAsyncRetrieveView,
+    VendorBatchRetrieveAPIView,
+    VendorBulkAPIView,
+    VendorExportAPIView,
+    VendorImportAPIView,
+)
 
 urlpatterns = [
-    path('', VendorListCreateAPIView.as_view(), name='vendor-list-create'),
-    path('<int:pk>/', VendorRetrieveUpdateDeleteAPIView.as_view(), name='vendor-retrieve-update-delete'),
+    path('', read_view(VendorAsyncListView), name='vendor-list-create'),
+    path('batch/', VendorBatchRetrieveAPIView.as_view(), name='vendor-batch-retrieve'),
+    path('bulk/', VendorBulkAPIView.as_view(), name='vendor-bulk'),
+    path('export/', VendorExportAPIView.as_view(), name='vendor-export'),
+    path('import/', VendorImportAPIView.as_view(), name='vendor-import'),
+    path('<int:pk>/', read_view(VendorAsyncRetrieveView), name='vendor-retrieve-update-delete'),
 ]
@@ -1,12 +1,22 @@
-from drf_yasg.utils import swagger_auto_schema
+from utils.api_schema import swagger_auto_schema
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework.exceptions import ValidationError
 from rest_framework.generics import ListCreateAPIView
 from utils.pagination import CustomPagination
 from .serializers import VendorSerializer
 from .models import Vendor
 from utils.response_formatter import custom_response
+from utils.async_views import AsyncListView, AsyncRetrieveView
+from utils.batch import BatchRetrieveAPIView
+from utils.bulk import BulkWriteAPIView
+from utils.conditional import apply_validators, is_not_modified, not_modified_response
+from utils.export import StreamingExportAPIView
+from utils.filters import DeclaredFilterBackend, StableOrderingFilter
+from utils.importer import BulkImportAPIView
+from utils.partial_update import PreconditionFailed, partial_update
+from utils.reads import get_detail, get_list_page
 
 class VendorListCreateAPIView(ListCreateAPIView):
     """
@@ -15,18 +25,27 @@ class VendorListCreateAPIView(ListCreateAPIView):
     queryset = Vendor.objects.all()
     serializer_class = VendorSerializer
     pagination_class = CustomPagination
+    pagination_mode = 'page'  # Set to 'cursor' to default to keyset pagination
+    count_strategy = 'exact'  # Or 'cached' / 'estimated'; clients may send ?count=
+    filter_backends = [DeclaredFilterBackend, StableOrderingFilter]
+    filter_fields = {
+        'email': 'exact',
+        'name': 'prefix',
+        'created_at': 'range',
+        'updated_at': 'range',
+    }
+    ordering_fields = ['vendor_id', 'name', 'created_at', 'updated_at']
+    ordering = ['vendor_id']
 
     def list(self, request):
-        queryset = self.filter_queryset(self.get_queryset())
-        paginator = self.pagination_class()
-        paginated_queryset = paginator.paginate_queryset(queryset, request)
-        serializer = self.get_serializer(paginated_queryset, many=True)
-        return paginator.get_paginated_response(serializer.data)
+        page = get_list_page(self, request)
+        if is_not_modified(request, page["validators"]):
+            return not_modified_response(page["validators"])
+        return apply_validators(Response(page["body"]), page["validators"])
 
     def create(self, request):
         serializer = self.get_serializer(data=request.data)
-        if serializer.is_valid():
-            serializer.save()
+        if serializer.is_valid() and serializer.try_save():
             response_data = custom_response(
                 message="Vendor created successfully",
                 code=201,
@@ -51,14 +70,7 @@ class VendorRetrieveUpdateDeleteAPIView(APIView):
     )
     def get(self, request, pk):
         try:
-            vendor = Vendor.objects.get(pk=pk)
-            serializer = VendorSerializer(vendor)
-            response_data = custom_response(
-                message="Vendor retrieved successfully",
-                code=200,
-                data=serializer.data,
-            )
-            return Response(response_data, status=status.HTTP_200_OK)
+            data, validators = get_detail(request, VendorSerializer, pk)
         except Vendor.DoesNotExist:
             response_data = custom_response(
                 message="Vendor not found",
@@ -66,6 +78,14 @@ class VendorRetrieveUpdateDeleteAPIView(APIView):
                 errors={"detail": "Vendor does not exist"},
             )
             return Response(response_data, status=status.HTTP_404_NOT_FOUND)
+        if data is None:
+            return not_modified_response(validators)
+        response_data = custom_response(
+            message="Vendor retrieved successfully",
+            code=200,
+            data=data,
+        )
+        return apply_validators(Response(response_data, status=status.HTTP_200_OK), validators)
 
     @swagger_auto_schema(
         operation_summary="Update Vendor",
@@ -77,8 +97,7 @@ class VendorRetrieveUpdateDeleteAPIView(APIView):
         try:
             vendor = Vendor.objects.get(pk=pk)
             serializer = VendorSerializer(vendor, data=request.data)
-            if serializer.is_valid():
-                serializer.save()
+            if serializer.is_valid() and serializer.try_save():
                 response_data = custom_response(
                     message="Vendor updated successfully",
                     code=200,
@@ -99,6 +118,48 @@ class VendorRetrieveUpdateDeleteAPIView(APIView):
             )
             return Response(response_data, status=status.HTTP_404_NOT_FOUND)
 
+    @swagger_auto_schema(
+        operation_summary="Partially Update Vendor",
+        operation_description=(
+            "Update only the supplied fields of a vendor with a single UPDATE (a change to a searched field "
+            "also rewrites its search entry on commit). The response holds only the primary key, the supplied "
+            "fields and updated_at. Send If-Match (the ETag from GET) or If-Unmodified-Since to reject the "
+            "change if the vendor was modified in the meantime."
+        ),
+        request_body=VendorSerializer,
+        responses={200: VendorSerializer, 404: "Vendor not found", 412: "Vendor was modified"},
+    )
+    def patch(self, request, pk):
+        try:
+            data = partial_update(request, VendorSerializer, pk)
+        except ValidationError as exc:
+            response_data = custom_response(
+                message="Vendor update failed",
+                code=400,
+                errors=exc.detail,
+            )
+            return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
+        except PreconditionFailed as exc:
+            response_data = custom_response(
+                message="Vendor update failed",
+                code=412,
+                errors={"detail": str(exc)},
+            )
+            return Response(response_data, status=status.HTTP_412_PRECONDITION_FAILED)
+        except Vendor.DoesNotExist:
+            response_data = custom_response(
+                message="Vendor not found",
+                code=404,
+                errors={"detail": "Vendor does not exist"},
+            )
+            return Response(response_data, status=status.HTTP_404_NOT_FOUND)
+        response_data = custom_response(
+            message="Vendor updated successfully",
+            code=200,
+            data=data,
+        )
+        return Response(response_data, status=status.HTTP_200_OK)
+
     @swagger_auto_schema(
         operation_summary="Delete Vendor",
         operation_description="Delete a specific vendor by ID.",
@@ -121,3 +182,51 @@ class VendorRetrieveUpdateDeleteAPIView(APIView):
                 errors={"detail": "Vendor does not exist"},
             )
             return Response(response_data, status=status.HTTP_404_NOT_FOUND)
+
+
+class VendorBatchRetrieveAPIView(BatchRetrieveAPIView):
+    """
+    Retrieves many vendors by ID in one call.
+    """
+    serializer_class = VendorSerializer
+    entity_name = "Vendor"
+
+
+class VendorBulkAPIView(BulkWriteAPIView):
+    """
+    Handles creating, updating, and deleting vendors in batches.
+    """
+    serializer_class = VendorSerializer
+    entity_name = "Vendor"
+
+
+class VendorExportAPIView(StreamingExportAPIView):
+    """
+    Streams all vendors as NDJSON or CSV.
+    """
+    serializer_class = VendorSerializer
+    entity_name = "Vendor"
+
+
+class VendorImportAPIView(BulkImportAPIView):
+    """
+    Imports vendors from an uploaded CSV or NDJSON file.
+    """
+    serializer_class = VendorSerializer
+    entity_name = "Vendor"
+
+
+class VendorAsyncListView(AsyncListView):
+    """
+    Async (ASGI) list of vendors; creates go to `VendorListCreateAPIView`.
+    """
+    sync_view_class = VendorListCreateAPIView
+
+
+class VendorAsyncRetrieveView(AsyncRetrieveView):
+    """
+    Async (ASGI) retrieve of a vendor; updates and deletes go to `VendorRetrieveUpdateDeleteAPIView`.
+    """
+    sync_view_class = VendorRetrieveUpdateDeleteAPIView
+    serializer_class = VendorSerializer
+    entity_name = "Vendor"
@@ -1,6 +1,19 @@
 import os
+import sys
+from pathlib import Path
+
+from decouple import config
+from django.conf import settings
 from django.core.asgi import get_asgi_application
 
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.base')
+# Make `utils` importable, as manage.py does
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', config('DJANGO_SETTINGS_MODULE', default='src.config.settings.development'))
 
 application = get_asgi_application()
+
+if settings.WARM_UP:
+    from utils.startup import warm_up
+
+    warm_up()
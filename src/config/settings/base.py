@@ -16,10 +16,15 @@ INSTALLED_APPS = [
     'src.apps.customers',
     'src.apps.vendors',
     'src.apps.accounts',
+    'src.apps.search',
+    'src.apps.sync',
     'src.utils',
 ]
 
 MIDDLEWARE = [
+    'utils.middleware.ProfilingMiddleware',
+    'utils.middleware.MetricsMiddleware',
+    'utils.middleware.ReplicaRoutingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -61,3 +66,144 @@ STATIC_URL = '/static/'
 MEDIA_URL = '/media/'
 STATIC_ROOT = BASE_DIR / 'static'
 MEDIA_ROOT = BASE_DIR / 'media'
+
+# Bulk write endpoints
+BULK_MAX_ITEMS = 1000  # Max objects accepted per bulk request
+BULK_BATCH_SIZE = 500  # Rows per INSERT/UPDATE statement
+
+# Batch retrieve endpoints (<app>/batch/)
+BATCH_RETRIEVE_MAX_IDS = 100  # Max ids accepted per request
+
+# Streaming exports
+EXPORT_CHUNK_SIZE = 2000  # Rows fetched per round trip by QuerySet.iterator()
+
+# Bulk imports
+IMPORT_BATCH_SIZE = 1000  # Rows validated and inserted per batch
+IMPORT_MAX_REJECTIONS = 1000  # Rejected rows listed in an upload's response
+
+# Request metrics exposed at /metrics
+METRICS_ENABLED = True
+METRICS_DIR = None  # Shared directory that lets /metrics sum all worker processes
+METRICS_FLUSH_INTERVAL = 5  # Seconds between snapshots written to METRICS_DIR
+METRICS_SNAPSHOT_MAX_AGE = 60  # Snapshots older than this belong to exited workers and are dropped
+METRICS_TOKEN = ''  # Bearer token for scrapers; empty leaves /metrics to staff only
+
+# On-demand request profiling (utils.middleware.ProfilingMiddleware): requests
+# sending HEADER with TOKEN, and a SAMPLE_RATE fraction of all requests, are
+# profiled and kept under DIR; staff list and download them at /profiles/
+PROFILING = {
+    'ENABLED': True,
+    'SAMPLE_RATE': 0.0,
+    'HEADER': 'X-Profile',
+    'TOKEN': '',  # Empty disables the header trigger
+    'MODE': 'deterministic',  # cProfile, or 'statistical' (stack sampling, lower overhead)
+    'SAMPLE_INTERVAL_MS': 5,  # Statistical mode
+    'MAX_SQL': 1000,  # Statements recorded per profile
+    'DIR': BASE_DIR / 'profiles',
+    'MAX_FILES': 200,  # Oldest profiles are removed beyond this
+}
+
+# Slow-query log (utils.slow_queries): statements slower than THRESHOLD_MS are
+# aggregated per normalized SQL fingerprint, with their EXPLAIN plan; staff
+# read the top-N at /slow-queries/, and manage.py slow_queries reads DIR
+SLOW_QUERIES = {
+    'ENABLED': True,
+    'THRESHOLD_MS': 100,
+    'EXPLAIN': True,
+    'PLAN_TTL': 3600,  # Seconds before a fingerprint's plan is captured again
+    'MAX_FINGERPRINTS': 500,  # The least recently seen are dropped beyond this
+    'DIR': None,  # Shared directory that lets reports cover all worker processes
+    'FLUSH_INTERVAL': 5,  # Seconds between snapshots written to DIR
+    'SNAPSHOT_MAX_AGE': 60,  # Snapshots older than this belong to exited workers and are dropped
+}
+
+# Read-through cache for detail payloads and list pages
+API_CACHE = {
+    # None: on only with SHARED_ALIAS. True also caches per process, which
+    # goes stale with more than one worker (invalidation is per process too).
+    'ENABLED': None,
+    'SHARED_ALIAS': None,  # Django cache alias shared by all workers (e.g. Redis)
+    'LRU_SIZE': 2048,  # Entries kept in each process
+    'TIMEOUT': 300,  # Seconds entries live in the shared backend
+}
+
+# Serve list/retrieve GETs with the native async views (set for ASGI deployments)
+ASYNC_READ_VIEWS = False
+
+# Trigram search index behind /api/search/
+SEARCH = {
+    'AUTO_INDEX': True,  # Index saves, deletes and bulk writes of indexed fields on commit
+    'MIN_QUERY_LENGTH': 2,
+    'MIN_MATCH': 0.3,  # Share of the query's trigrams a candidate must contain
+    'POSTINGS_BUDGET': 20000,  # Postings read per query; past it, common trigrams are sampled
+    'FREQUENCY_TTL': 60,  # Seconds a trigram's posting count is reused
+    'CANDIDATES': 200,  # Candidates ranked in Python per query
+    'MAX_RESULTS': 50,
+}
+
+# Read replicas: DATABASES aliases that serve GET reads of REPLICA_ROUTING['APPS']
+DATABASE_REPLICAS = []
+DATABASE_ROUTERS = ['utils.db_router.ReplicaRouter']
+REPLICA_ROUTING = {
+    'APPS': ['accounts', 'customers', 'vendors', 'sync'],
+    'STICKY_SECONDS': 5,  # Reads stay on the primary this long after a client's write
+    'STICKY_COOKIE': 'read_primary_until',
+    'MAX_LAG': 10,  # Seconds; replicas further behind are skipped
+    'LAG_CHECK_INTERVAL': 5,  # Seconds between lag checks, per process
+}
+
+# Totals of paginated lists (views set count_strategy, clients send ?count=)
+LIST_COUNT = {
+    'STRATEGY': 'exact',  # 'exact', 'cached' (invalidated on writes) or 'estimated' (planner statistics)
+    'EXACT_BELOW': 10000,  # Estimates below this are replaced by an exact count
+}
+
+# Delta-sync feed behind /api/sync/<entity>/
+SYNC = {
+    'PAGE_SIZE': 500,
+    'MAX_PAGE_SIZE': 5000,
+    'SETTLE_SECONDS': 5,  # Changes younger than this wait for a later call, so late commits are not skipped
+    'TOMBSTONE_RETENTION_DAYS': 30,  # Older sync tokens get 410 and must resync in full
+}
+
+# Leave create/PUT uniqueness to the database's unique constraints instead
+# of a SELECT per unique field (violations still return the same 400)
+CONSTRAINT_UNIQUENESS = False
+
+# OpenAPI schema behind /swagger.json, /swagger.yaml, /swagger/ and /redoc/
+API_SCHEMA = {
+    'VERSION': 'v1',
+    'DIR': BASE_DIR / 'schema',  # manage.py generate_schema writes openapi-<VERSION>.json/.yaml here
+    'GENERATE_ON_DEMAND': True,  # Without those files, generate the schema on first request (imports drf_yasg)
+    'INFO': {
+        'title': "QIMERP API Documentation",
+        'description': "API documentation for your project",
+        'terms_of_service': "https://www.google.com/policies/terms/",
+        'contact_email': "qfacegroup@gmail.com",
+        'license': "BSD License",
+    },
+}
+
+# Worker boot. Lean settings modules (production, benchmark_lean) drop these
+# apps from INSTALLED_APPS: the admin, served by workers booted with
+# LEAN_BOOT=False, and drf_yasg, only needed by generate_schema and
+# collectstatic. The docs pages (templates/api_docs) still load the Swagger UI
+# and ReDoc assets from drf_yasg's static files, so run collectstatic with
+# LEAN_BOOT=False; a lean collectstatic leaves them out of STATIC_ROOT.
+# WARM_UP makes the WSGI/ASGI entry points do the one-off work of the first
+# requests at boot (see utils.startup.warm_up).
+LEAN_BOOT_OMIT_APPS = ['django.contrib.admin', 'drf_yasg']
+WARM_UP = False
+
+# Serialize list pages from values() rows instead of model instances
+FAST_READ_SERIALIZATION = False
+
+REST_FRAMEWORK = {
+    'DEFAULT_RENDERER_CLASSES': [
+        'utils.renderers.FastJSONRenderer',
+        'utils.renderers.MessagePackRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_CONTENT_NEGOTIATION_CLASS': 'utils.renderers.AvailableRendererNegotiation',
+    'EXCEPTION_HANDLER': 'utils.exceptions.api_exception_handler',
+}
@@ -0,0 +1,15 @@
+from .base import *
+
+DEBUG = False
+
+ALLOWED_HOSTS = ['127.0.0.1', 'localhost']
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / 'bench.sqlite3',
+    }
+}
+
+# Report per-request SQL counts to the benchmark client
+MIDDLEWARE = ['utils.middleware.QueryCountMiddleware'] + MIDDLEWARE
@@ -0,0 +1,4 @@
+from .benchmark import *
+
+# Serve the read endpoints with the native async views
+ASYNC_READ_VIEWS = True
@@ -0,0 +1,5 @@
+from .benchmark import *
+
+# Boot like a production API worker, for benchmarks.startup_bench
+INSTALLED_APPS = [app for app in INSTALLED_APPS if app not in LEAN_BOOT_OMIT_APPS]
+WARM_UP = True
@@ -10,3 +10,6 @@ DATABASES = {
         'NAME': BASE_DIR / 'dev.sqlite3',
     }
 }
+
+# runserver is a single process, so the per-process API cache is safe
+API_CACHE = {**API_CACHE, 'ENABLED': True}
@@ -1,3 +1,5 @@
+from decouple import config
+
 from .base import *
 
 DEBUG = False
@@ -12,5 +14,35 @@ DATABASES = {
         'PASSWORD': 'your_db_password',
         'HOST': 'your_db_host',
         'PORT': '5432',
-    }
+    },
+    'replica': {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': 'your_db_name',
+        'USER': 'your_db_user',
+        'PASSWORD': 'your_db_password',
+        'HOST': 'your_replica_host',
+        'PORT': '5432',
+    },
 }
+
+# Streaming replicas that serve GET list/retrieve reads
+DATABASE_REPLICAS = ['replica']
+
+METRICS_DIR = '/tmp/qimerp-metrics'
+METRICS_TOKEN = config('METRICS_TOKEN', default='')
+
+SLOW_QUERIES = {**SLOW_QUERIES, 'DIR': '/tmp/qimerp-slow-queries'}
+
+PROFILING = {**PROFILING, 'TOKEN': config('PROFILING_TOKEN', default=''), 'DIR': '/tmp/qimerp-profiles'}
+
+# The schema is generated at build time (manage.py generate_schema), so the
+# API workers never import drf_yasg.
+API_SCHEMA = {**API_SCHEMA, 'GENERATE_ON_DEMAND': False}
+
+# API workers boot without the admin and schema tooling; run the admin and
+# the build steps with LEAN_BOOT=False, e.g.
+#   LEAN_BOOT=False python manage.py collectstatic
+# which copies the drf-yasg/ assets the /swagger/ and /redoc/ pages load.
+if config('LEAN_BOOT', default=True, cast=bool):
+    INSTALLED_APPS = [app for app in INSTALLED_APPS if app not in LEAN_BOOT_OMIT_APPS]
+WARM_UP = True
@@ -0,0 +1,18 @@
+from .development import *
+
+# Local stand-in for a primary with two read replicas. The replicas are
+# SQLite copies of the primary refreshed by `manage.py sync_replicas`, so
+# they lag until the next sync, as a streaming replica would.
+DATABASES = {
+    'default': DATABASES['default'],
+    'replica1': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / 'dev-replica1.sqlite3',
+    },
+    'replica2': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / 'dev-replica2.sqlite3',
+    },
+}
+
+DATABASE_REPLICAS = ['replica1', 'replica2']
@@ -6,7 +6,13 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': ':memory:',
-    }
+    },
+    # Stand-in replica for the routing tests; tests enable it with DATABASE_REPLICAS.
+    'replica': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+        'TEST': {'MIRROR': 'default'},
+    },
 }
 
 PASSWORD_HASHERS = [
@@ -14,3 +20,6 @@ PASSWORD_HASHERS = [
 ]
 
 EMAIL_BACKEND = 'django.core.mail.backends.locmem.EmailBackend'
+
+# Tests run in one process; exercise the per-process API cache
+API_CACHE = {**API_CACHE, 'ENABLED': True}
@@ -1,28 +1,28 @@
-from django.contrib import admin
+from django.apps import apps
 from django.urls import path, include
-from rest_framework import permissions
-from drf_yasg.views import get_schema_view
-from drf_yasg import openapi
-
-schema_view = get_schema_view(
-    openapi.Info(
-        title="QIMERP API Documentation",
-        default_version='v1',
-        description="API documentation for your project",
-        terms_of_service="https://www.google.com/policies/terms/",
-        contact=openapi.Contact(email="qfacegroup@gmail.com"),
-        license=openapi.License(name="BSD License"),
-    ),
-    public=True,
-    permission_classes=(permissions.AllowAny,),
-)
+from utils.api_schema import docs_view, schema_view
+from utils.metrics import MetricsAPIView
+from utils.profiling import ProfileDownloadAPIView, ProfileListAPIView
+from utils.slow_queries import SlowQueryReportAPIView
 
 urlpatterns = [
-    path('admin/', admin.site.urls),
     path('api/customers/', include('src.apps.customers.urls')),  # Include your app URLs
     path('api/vendors/', include('src.apps.vendors.urls')),
     path('api/accounts/', include('src.apps.accounts.urls')),
-    # Swagger and ReDoc URLs
-    path('swagger/', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
-    path('redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
+    path('api/search/', include('src.apps.search.urls')),
+    path('api/sync/', include('src.apps.sync.urls')),
+    path('metrics', MetricsAPIView.as_view(), name='metrics'),
+    path('profiles/', ProfileListAPIView.as_view(), name='profile-list'),
+    path('profiles/<str:profile_id>/', ProfileDownloadAPIView.as_view(), name='profile-download'),
+    path('slow-queries/', SlowQueryReportAPIView.as_view(), name='slow-query-report'),
+    # OpenAPI schema (see manage.py generate_schema), Swagger and ReDoc URLs
+    path('swagger.json', schema_view, {'fmt': 'json'}, name='schema-json'),
+    path('swagger.yaml', schema_view, {'fmt': 'yaml'}, name='schema-yaml'),
+    path('swagger/', docs_view, {'ui': 'swagger-ui'}, name='schema-swagger-ui'),
+    path('redoc/', docs_view, {'ui': 'redoc'}, name='schema-redoc'),
 ]
+
+if apps.is_installed('django.contrib.admin'):  # Left out of lean API workers
+    from django.contrib import admin
+
+    urlpatterns.insert(0, path('admin/', admin.site.urls))
@@ -0,0 +1,192 @@
+import hashlib
+import threading
+from importlib import import_module
+from pathlib import Path
+
+from django.conf import settings
+from django.http import HttpResponse, JsonResponse
+from django.shortcuts import render
+from django.urls import reverse
+from django.utils.http import quote_etag
+from django.views.decorators.http import require_safe
+from utils.conditional import apply_validators, is_not_modified
+from utils.response_formatter import custom_response
+
+SCHEMA_FORMATS = {'json': 'application/json', 'yaml': 'application/yaml'}
+
+
+class Deferred:
+    """
+    Stand-in for a name in a drf_yasg module: attribute lookups and a call
+    are recorded and only performed by `resolve`, so view modules describe
+    their schema without importing drf_yasg.
+    """
+
+    def __init__(self, module, path=(), call=None):
+        self.module = module
+        self.path = path
+        self.call = call
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return Deferred(self.module, self.path + (name,))
+
+    def __call__(self, *args, **kwargs):
+        return Deferred(self.module, self.path, (args, kwargs))
+
+
+def resolve(value):
+    """
+    Replace the `Deferred` values in ``value`` (recursively through lists,
+    tuples and dicts) with what they stand for.
+    """
+    if isinstance(value, Deferred):
+        target = import_module(value.module)
+        for name in value.path:
+            target = getattr(target, name)
+        if value.call is not None:
+            args, kwargs = value.call
+            target = target(*resolve(args), **resolve(kwargs))
+        return target
+    if isinstance(value, (list, tuple)):
+        return type(value)(resolve(item) for item in value)
+    if isinstance(value, dict):
+        return {key: resolve(item) for key, item in value.items()}
+    return value
+
+
+# Use like drf_yasg.openapi, e.g. openapi.Parameter('q', openapi.IN_QUERY, ...)
+openapi = Deferred('drf_yasg.openapi')
+
+schema_overrides = []
+
+
+def swagger_auto_schema(**overrides):
+    """
+    ``drf_yasg.utils.swagger_auto_schema`` for APIView methods, applied only
+    when the schema is generated.
+    """
+    def decorator(view_method):
+        schema_overrides.append((view_method, overrides))
+        return view_method
+    return decorator
+
+
+def apply_schema_overrides():
+    from drf_yasg.utils import swagger_auto_schema as decorate
+
+    while schema_overrides:
+        view_method, overrides = schema_overrides.pop()
+        decorate(**resolve(overrides))(view_method)
+
+
+def generate_schema():
+    """
+    Build the OpenAPI schema with drf_yasg and return ``{format: bytes}``.
+    """
+    from drf_yasg import openapi as yasg_openapi
+    from drf_yasg.codecs import OpenAPICodecJson, OpenAPICodecYaml
+    from drf_yasg.generators import OpenAPISchemaGenerator
+
+    import_module(settings.ROOT_URLCONF)  # Imports every view, registering its overrides
+    apply_schema_overrides()
+    options = settings.API_SCHEMA
+    info = dict(options['INFO'])
+    info = yasg_openapi.Info(
+        default_version=options['VERSION'],
+        contact=yasg_openapi.Contact(email=info.pop('contact_email')),
+        license=yasg_openapi.License(name=info.pop('license')),
+        **info,
+    )
+    schema = OpenAPISchemaGenerator(info).get_schema(request=None, public=True)
+    return {
+        'json': OpenAPICodecJson(validators=[]).encode(schema),
+        'yaml': OpenAPICodecYaml(validators=[]).encode(schema),
+    }
+
+
+def schema_path(fmt, directory=None):
+    options = settings.API_SCHEMA
+    return Path(directory or options['DIR']) / f"openapi-{options['VERSION']}.{fmt}"
+
+
+def schema_etag(content):
+    return quote_etag(hashlib.sha1(content).hexdigest()[:32])
+
+
+class SchemaArtifact:
+    """
+    The encoded schema of each format with its ETag. It is read from the
+    files ``manage.py generate_schema`` writes (again when they change) or,
+    with ``API_SCHEMA['GENERATE_ON_DEMAND']`` on and no file, generated once
+    per process.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.loaded = {}  # format -> (mtime_ns, content, etag)
+        self.generated = None
+
+    def get(self, fmt):
+        """
+        Return ``(content, etag)``, or ``None`` when there is no schema.
+        """
+        path = schema_path(fmt)
+        try:
+            mtime = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return self.generate(fmt)
+        entry = self.loaded.get(fmt)
+        if entry is None or entry[0] != mtime:
+            content = path.read_bytes()
+            entry = self.loaded[fmt] = (mtime, content, schema_etag(content))
+        return entry[1:]
+
+    def generate(self, fmt):
+        if not settings.API_SCHEMA['GENERATE_ON_DEMAND']:
+            return None
+        with self.lock:
+            if self.generated is None:
+                self.generated = {name: (content, schema_etag(content)) for name, content in generate_schema().items()}
+        return self.generated[fmt]
+
+    def reset(self):
+        self.loaded = {}
+        self.generated = None
+
+
+schema_artifact = SchemaArtifact()
+
+
+@require_safe
+def schema_view(request, fmt):
+    """
+    Serve the OpenAPI schema as JSON or YAML, revalidated by ETag.
+    """
+    schema = schema_artifact.get(fmt)
+    if schema is None:
+        return JsonResponse(custom_response(
+            message="API schema not available",
+            code=404,
+            errors={"detail": "The schema has not been generated; run manage.py generate_schema."},
+        ), status=404)
+    content, etag = schema
+    validators = {"etag": etag, "last_modified": None}
+    if is_not_modified(request, validators):
+        response = HttpResponse(status=304)
+    else:
+        response = HttpResponse(content, content_type=SCHEMA_FORMATS[fmt])
+    response['Cache-Control'] = 'no-cache'
+    return apply_validators(response, validators)
+
+
+@require_safe
+def docs_view(request, ui):
+    """
+    Swagger UI or ReDoc page, loading the schema from `schema_view`.
+    """
+    return render(request, f'api_docs/{ui}.html', {
+        'title': settings.API_SCHEMA['INFO']['title'],
+        'schema_url': reverse('schema-json'),
+    })
@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class UtilsConfig(AppConfig):
+    name = "src.utils"
+    label = "utils"
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+        from utils.slow_queries import install_slow_query_log
+        connection_created.connect(install_slow_query_log, dispatch_uid='utils-slow-query-log')
@@ -0,0 +1,203 @@
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import Http404, HttpResponse
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import exceptions, status
+from rest_framework.settings import api_settings
+from utils.cache import api_cache, call_cache
+from utils.conditional import apply_validators, has_conditional_headers, is_not_modified
+from utils.reads import abuild_list_page, aget_detail
+from utils.response_formatter import custom_response
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent computations of the same key on the event loop:
+    the first caller computes, callers arriving meanwhile await its result
+    (or its exception) instead of repeating the queries. If the first
+    caller is cancelled, the callers waiting on it start over.
+    """
+
+    def __init__(self):
+        self.pending = {}
+
+    async def run(self, key, compute):
+        future = self.pending.get(key)
+        if future is None:
+            future = self.pending[key] = asyncio.get_running_loop().create_future()
+            try:
+                future.set_result((await compute(), None))
+            except Exception as exc:
+                future.set_result((None, exc))
+            finally:
+                del self.pending[key]
+                if not future.done():
+                    future.cancel()
+        try:
+            result, exc = await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                raise
+            return await self.run(key, compute)
+        if exc is not None:
+            raise exc
+        return result
+
+
+single_flight = SingleFlight()
+
+
+class AsyncReadView(View):
+    """
+    Base for native async read handlers served under ASGI.
+
+    ``GET``/``HEAD`` are answered on the event loop; every other method is
+    delegated to ``sync_view_class``, the DRF view that serves the same URL
+    under WSGI, so writes, OPTIONS and the API schema behave exactly as
+    before. Reads run that view's ``initial`` (negotiation, authentication,
+    permissions and throttles) in a worker thread, then the async twin of
+    its handler's pipeline (see `utils.reads`) with the async ORM, and
+    responses go through the same renderers and exception handling as the
+    DRF views.
+    """
+    sync_view_class = None
+    entity_name = None  # e.g. "Vendor"
+    sync_view = None  # Set by as_view()
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(sync_view=cls.sync_view_class.as_view(), **initkwargs)
+        # Schema generators introspect `cls`, so the docs describe the DRF view.
+        view.cls = cls.sync_view_class
+        view.initkwargs = {}
+        return csrf_exempt(view)
+
+    async def delegate(self, request, *args, **kwargs):
+        return await sync_to_async(self.sync_view)(request, *args, **kwargs)
+
+    post = put = patch = delete = options = delegate
+
+    def initialize(self, request):
+        """
+        Return a ``sync_view_class`` instance set up for ``request`` the way
+        its ``dispatch`` would be, with the DRF request as ``view.request``.
+        """
+        view = self.sync_view_class()
+        view.setup(request, *self.args, **self.kwargs)
+        view.request = view.initialize_request(request, *self.args, **self.kwargs)
+        view.headers = view.default_response_headers
+        return view
+
+    def render(self, view, data, status_code=status.HTTP_200_OK, validators=None):
+        """
+        Render ``data`` like a DRF ``Response`` of ``view`` would be.
+        """
+        request = view.request
+        renderers = [
+            renderer() for renderer in api_settings.DEFAULT_RENDERER_CLASSES
+            if renderer.media_type != 'text/html'
+        ]
+        negotiator = api_settings.DEFAULT_CONTENT_NEGOTIATION_CLASS()
+        try:
+            renderer, media_type = negotiator.select_renderer(request, renderers)
+        except (exceptions.NotAcceptable, Http404) as exc:
+            # Unknown ?format= values raise Http404, which DRF turns into NotFound.
+            exc = exc if isinstance(exc, exceptions.APIException) else exceptions.NotFound()
+            renderer, media_type = renderers[0], renderers[0].media_type
+            error = api_settings.EXCEPTION_HANDLER(exc, {'view': view, 'request': request})
+            data, status_code, validators = error.data, error.status_code, None
+        context = {'view': view, 'request': request, 'response': None, 'args': self.args, 'kwargs': self.kwargs}
+        content = b'' if status_code == status.HTTP_304_NOT_MODIFIED else renderer.render(data, media_type, context)
+        content_type = f"{media_type}; charset={renderer.charset}" if renderer.charset else media_type
+        response = HttpResponse(content, status=status_code, content_type=content_type)
+        if not content:
+            del response['Content-Type']
+        response['Allow'] = ', '.join(view.allowed_methods)
+        if len(renderers) > 1:
+            response['Vary'] = 'Accept'
+        if validators is not None:
+            apply_validators(response, validators)
+        return response
+
+    def render_exception(self, view, exc):
+        """
+        Render ``exc`` as ``view.handle_exception`` answers it, including
+        its headers (``WWW-Authenticate``, ``Retry-After``).
+        """
+        error = view.handle_exception(exc)
+        response = self.render(view, error.data, error.status_code)
+        for header, value in error.items():
+            if header != 'Content-Type':
+                response[header] = value
+        return response
+
+
+class AsyncListView(AsyncReadView):
+    """
+    Async list handler mirroring the ``list`` of ``sync_view_class``:
+    same checks, filters, ordering, pagination, cache and conditional GET.
+    Cached pages are served from the event loop; concurrent misses of the
+    same page are built once.
+    """
+
+    async def get(self, request):
+        view = self.initialize(request)
+        request = view.request
+        try:
+            await sync_to_async(view.initial)(request)
+            model = view.get_serializer_class().Meta.model
+            cache_key = await call_cache(api_cache.list_key, model, request)
+            page = await call_cache(api_cache.get, cache_key)
+            if page is None:
+                if has_conditional_headers(request):
+                    # May come back without a body, for this client only.
+                    page = await abuild_list_page(view, request, cache_key)
+                else:
+                    page = await single_flight.run(cache_key, lambda: abuild_list_page(view, request, cache_key))
+        except Exception as exc:
+            return self.render_exception(view, exc)
+        if is_not_modified(request, page["validators"]):
+            return self.render(view, None, status.HTTP_304_NOT_MODIFIED, page["validators"])
+        return self.render(view, page["body"], validators=page["validators"])
+
+
+class AsyncRetrieveView(AsyncReadView):
+    """
+    Async retrieve handler mirroring the ``get`` of ``sync_view_class``.
+    """
+    serializer_class = None
+
+    async def get(self, request, pk):
+        view = self.initialize(request)
+        try:
+            await sync_to_async(view.initial)(view.request, *self.args, **self.kwargs)
+            data, validators = await aget_detail(view.request, self.serializer_class, pk)
+        except self.serializer_class.Meta.model.DoesNotExist:
+            return self.render(view, custom_response(
+                message=f"{self.entity_name} not found",
+                code=404,
+                errors={"detail": f"{self.entity_name} does not exist"},
+            ), status.HTTP_404_NOT_FOUND)
+        except Exception as exc:
+            return self.render_exception(view, exc)
+        if data is None:
+            return self.render(view, None, status.HTTP_304_NOT_MODIFIED, validators)
+        response_data = custom_response(
+            message=f"{self.entity_name} retrieved successfully",
+            code=200,
+            data=data,
+        )
+        return self.render(view, response_data, validators=validators)
+
+
+def read_view(async_view_class):
+    """
+    URL callback for a read endpoint: the async view when
+    ``ASYNC_READ_VIEWS`` is on (ASGI deployments), else its sync DRF view.
+    """
+    if settings.ASYNC_READ_VIEWS:
+        return async_view_class.as_view()
+    return async_view_class.sync_view_class.as_view()
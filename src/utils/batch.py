@@ -0,0 +1,112 @@
+import re
+
+from django.conf import settings
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from utils.cache import api_cache
+from utils.fieldsets import get_fieldset, trim
+from utils.response_formatter import custom_response
+
+
+def parse_id(value):
+    """
+    ``value`` as an integer primary key, or None. Only ints and strings of
+    digits are ids: ``int()`` would also take ``True``, ``1.9`` or ``"1_0"``.
+    """
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, str) and re.fullmatch(r'-?[0-9]+', value.strip()):
+        return int(value)
+    return None
+
+
+class BatchRetrieveAPIView(APIView):
+    """
+    Base view that retrieves many objects by primary key in one call.
+
+    Ids come from ``?ids=1,2,3`` or a POST body ``{"ids": [1, 2, 3]}``, at
+    most ``BATCH_RETRIEVE_MAX_IDS`` of them. Ids not in the detail cache
+    are read with a single ``in_bulk`` query. Results keep the order of the
+    request; ids that do not exist are listed under ``missing``. Supports
+    ``?fields=``/``?exclude=`` like the detail endpoint.
+    """
+    serializer_class = None
+    entity_name = None  # e.g. "Vendor"
+    read_only = True  # POST only carries the ids; see ReplicaRoutingMiddleware
+
+    @property
+    def model(self):
+        return self.serializer_class.Meta.model
+
+    def get(self, request):
+        return self.retrieve(request, request.query_params.get('ids', '').split(','))
+
+    def post(self, request):
+        ids = request.data.get('ids') if isinstance(request.data, dict) else None
+        return self.retrieve(request, ids)
+
+    def parse_ids(self, raw_ids):
+        """
+        Return the requested primary keys, de-duplicated in request order.
+        Raises ``ValueError`` with one message for the client per problem.
+        """
+        if not isinstance(raw_ids, list):
+            raise ValueError("Expected a list of ids.")
+        ids, invalid = [], []
+        for pk in raw_ids:
+            if isinstance(pk, str) and not pk.strip():
+                continue
+            parsed = parse_id(pk)
+            if parsed is None:
+                invalid.append(f"{pk!r} is not an integer id.")
+            else:
+                ids.append(parsed)
+        if invalid:
+            raise ValueError(*invalid)
+        ids = list(dict.fromkeys(ids))
+        max_ids = settings.BATCH_RETRIEVE_MAX_IDS
+        if not ids:
+            raise ValueError("Expected at least one id.")
+        if len(ids) > max_ids:
+            raise ValueError(f"A batch request accepts at most {max_ids} ids.")
+        return ids
+
+    def fetch(self, ids):
+        """
+        Return ``{pk: serialized object}`` for the ids that exist, reading
+        the detail cache in one round trip and the database once for the rest.
+        """
+        keys = api_cache.detail_keys(self.model, ids)
+        cached = api_cache.get_many(list(keys.values()))
+        found = {pk: cached[key] for pk, key in keys.items() if key in cached}
+        misses = [pk for pk in ids if pk not in found]
+        if misses:
+            read = {
+                pk: dict(self.serializer_class(instance).data)
+                for pk, instance in self.model._default_manager.in_bulk(misses).items()
+            }
+            api_cache.set_many({keys[pk]: data for pk, data in read.items()})
+            found.update(read)
+        return found
+
+    def retrieve(self, request, raw_ids):
+        try:
+            ids = self.parse_ids(raw_ids)
+        except ValueError as exc:
+            return Response(custom_response(
+                message=f"{self.entity_name} batch retrieval failed",
+                code=400,
+                errors={"ids": list(exc.args)},
+            ), status=status.HTTP_400_BAD_REQUEST)
+        fieldset = get_fieldset(request, self.serializer_class)
+        found = self.fetch(ids)
+        response_data = custom_response(
+            message=f"{self.entity_name} batch retrieved successfully",
+            code=200,
+            data={
+                "results": [trim(found[pk], fieldset) for pk in ids if pk in found],
+                "missing": [pk for pk in ids if pk not in found],
+            },
+        )
+        return Response(response_data, status=status.HTTP_200_OK)
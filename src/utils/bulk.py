@@ -0,0 +1,357 @@
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.utils.field_mapping import get_unique_error_message
+from rest_framework.validators import UniqueValidator
+from rest_framework.views import APIView
+from utils.response_formatter import custom_response
+from utils.signals import rows_changed
+
+IN_QUERY_CHUNK_SIZE = 500  # Keeps `__in` lookups under SQLite's variable limit
+
+
+def build_batch_serializer(serializer_class, partial=False):
+    """
+    Build one serializer instance that validates every item of a batch.
+
+    Field-level ``UniqueValidator``s are dropped because they run one SELECT
+    per item; uniqueness is checked for the whole batch by `find_unique_conflicts`.
+    """
+    serializer = serializer_class(partial=partial)
+    for field in serializer.fields.values():
+        field.validators = [v for v in field.validators if not isinstance(v, UniqueValidator)]
+    return serializer
+
+
+def validate_items(serializer, items, start=0):
+    """
+    Validate raw items with a batch serializer.
+
+    Returns ``(valid, rejected)`` where ``valid`` is a list of
+    ``(index, validated_data)`` and ``rejected`` a list of ``(index, errors)``.
+    """
+    valid, rejected = [], []
+    for index, item in enumerate(items, start=start):
+        if not isinstance(item, dict):
+            rejected.append((index, {"non_field_errors": ["Expected an object."]}))
+            continue
+        try:
+            valid.append((index, serializer.run_validation(item)))
+        except ValidationError as exc:
+            rejected.append((index, exc.detail))
+    return valid, rejected
+
+
+def get_unique_fields(model):
+    return [
+        field for field in model._meta.concrete_fields
+        if field.unique and not field.primary_key
+    ]
+
+
+def find_unique_conflicts(model, rows):
+    """
+    Check unique fields for a batch with one set-based query per field.
+
+    ``rows`` is a list of ``(index, data, pk)`` where ``pk`` is the row being
+    updated, or ``None`` for new rows. Values repeated inside the batch or
+    already taken by another row are reported as ``{index: {field: [message]}}``.
+    """
+    conflicts = {}
+    for field in get_unique_fields(model):
+        message = get_unique_error_message(field)
+        claimed = {}
+        for index, data, pk in rows:
+            value = data.get(field.name)
+            if value is None:
+                continue
+            if value in claimed:
+                conflicts.setdefault(index, {})[field.name] = [message]
+            else:
+                claimed[value] = (index, pk)
+
+        values = list(claimed)
+        for offset in range(0, len(values), IN_QUERY_CHUNK_SIZE):
+            existing = model._default_manager.filter(
+                **{f"{field.name}__in": values[offset:offset + IN_QUERY_CHUNK_SIZE]}
+            ).values_list(field.name, 'pk')
+            for value, existing_pk in existing:
+                index, pk = claimed[value]
+                if pk is None or pk != existing_pk:
+                    conflicts.setdefault(index, {})[field.name] = [message]
+    return conflicts
+
+
+def touch_auto_now_fields(model, instances):
+    """
+    Set ``auto_now`` fields, which ``bulk_update`` does not do by itself.
+    Returns the names of the fields that were set.
+    """
+    now = timezone.now()
+    names = [field.name for field in model._meta.concrete_fields if getattr(field, 'auto_now', False)]
+    for instance in instances:
+        for name in names:
+            setattr(instance, name, now)
+    return names
+
+
+def write_rechecking_conflicts(write, rows, find_conflicts):
+    """
+    Run ``write(rows)`` in a transaction and return ``(rows, result,
+    conflicts)``.
+
+    A concurrent writer may take a unique value between the pre-check and
+    the write, which rolls the whole batch back with an ``IntegrityError``.
+    The rows that now conflict are then found with ``find_conflicts(rows)``
+    (``{index: errors}``, rows being ``(index, ...)`` tuples) and left out,
+    and the rest is written again. Errors that no conflict explains are
+    raised.
+    """
+    conflicts = {}
+    while True:
+        try:
+            with transaction.atomic():
+                return rows, write(rows), conflicts
+        except IntegrityError:
+            found = find_conflicts(rows)
+            if not found:
+                raise
+            conflicts.update(found)
+            rows = [row for row in rows if row[0] not in found]
+
+
+def failure(index, errors):
+    """The per-item result of a rejected batch item."""
+    return {"index": index, "status": "failed", "errors": errors}
+
+
+def delete_rows(queryset):
+    """
+    Delete the rows of ``queryset`` with a single ``DELETE``, without the
+    per-row ``post_delete`` signals the collector would send (callers send
+    one ``rows_changed`` instead). Models that other models reference go
+    through the collector, which handles their cascades.
+    """
+    if queryset.model._meta.related_objects:
+        return queryset.delete()[0]
+    return queryset._raw_delete(queryset.db)
+
+
+class BulkWriteAPIView(APIView):
+    """
+    Base view for batch create (POST), update (PATCH) and delete (DELETE).
+
+    Every request validates all items, checks uniqueness set-based, and writes
+    the valid ones with ``bulk_create``/``bulk_update``/a filtered delete
+    inside one transaction. Invalid items are reported per index, including
+    those whose unique values a concurrent request took in the meantime.
+    """
+    serializer_class = None
+    entity_name = None  # e.g. "Vendor"
+
+    @property
+    def model(self):
+        return self.serializer_class.Meta.model
+
+    def get_items(self, request):
+        items = request.data
+        max_items = settings.BULK_MAX_ITEMS
+        if not isinstance(items, list):
+            return None, {"detail": "Expected a list of objects."}
+        if not items:
+            return None, {"detail": "Expected at least one object."}
+        if len(items) > max_items:
+            return None, {"detail": f"A bulk request accepts at most {max_items} objects."}
+        return items, None
+
+    def bulk_response(self, action, results, success_status):
+        results.sort(key=lambda result: result["index"])
+        failed = sum(1 for result in results if result["status"] == "failed")
+        succeeded = len(results) - failed
+        if not succeeded:
+            code, message = status.HTTP_400_BAD_REQUEST, f"Bulk {self.entity_name.lower()} {action} failed"
+        elif failed:
+            code, message = status.HTTP_207_MULTI_STATUS, f"Bulk {self.entity_name.lower()} {action} partially succeeded"
+        else:
+            code, message = success_status, f"Bulk {self.entity_name.lower()} {action} succeeded"
+        response_data = custom_response(
+            message=message,
+            code=code,
+            data={"succeeded": succeeded, "failed": failed, "results": results},
+        )
+        return Response(response_data, status=code)
+
+    def error_response(self, action, errors):
+        response_data = custom_response(
+            message=f"Bulk {self.entity_name.lower()} {action} failed",
+            code=400,
+            errors=errors,
+        )
+        return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
+
+    def integrity_error_response(self, action, exc):
+        response_data = custom_response(
+            message=f"Bulk {self.entity_name.lower()} {action} failed",
+            code=409,
+            errors={"detail": f"The batch conflicts with concurrent changes: {exc}"},
+        )
+        return Response(response_data, status=status.HTTP_409_CONFLICT)
+
+    def post(self, request):
+        items, errors = self.get_items(request)
+        if errors:
+            return self.error_response("create", errors)
+
+        serializer = build_batch_serializer(self.serializer_class)
+        valid, rejected = validate_items(serializer, items)
+        conflicts = find_unique_conflicts(self.model, [(index, data, None) for index, data in valid])
+
+        results = [failure(index, errors) for index, errors in rejected]
+        results += [failure(index, conflicts[index]) for index, _ in valid if index in conflicts]
+        valid = [(index, data) for index, data in valid if index not in conflicts]
+
+        def create(rows):
+            instances = [self.model(**data) for _, data in rows]
+            return self.model._default_manager.bulk_create(instances, batch_size=settings.BULK_BATCH_SIZE)
+
+        def recheck(rows):
+            return find_unique_conflicts(self.model, [(index, data, None) for index, data in rows])
+
+        try:
+            valid, instances, conflicts = write_rechecking_conflicts(create, valid, recheck)
+        except IntegrityError as exc:
+            return self.integrity_error_response("create", exc)
+        results += [failure(index, errors) for index, errors in conflicts.items()]
+        if instances:
+            rows_changed.send(sender=self.model, pks=[instance.pk for instance in instances])
+
+        results += [
+            {"index": index, "status": "created", "data": serializer.to_representation(instance)}
+            for (index, _), instance in zip(valid, instances)
+        ]
+        return self.bulk_response("create", results, status.HTTP_201_CREATED)
+
+    def parse_update_ids(self, items):
+        """
+        Read the primary key of every update item. Returns ``(keyed, results)``
+        where ``keyed`` is a list of ``(index, item, pk)`` and ``results`` holds
+        the failures of items without a valid id.
+        """
+        pk_name = self.model._meta.pk.name
+        keyed, results = [], []
+        for index, item in enumerate(items):
+            try:
+                pk = self.model._meta.pk.to_python(item.get(pk_name)) if isinstance(item, dict) else None
+            except DjangoValidationError:
+                pk = None
+            if pk is None:
+                results.append(failure(index, {pk_name: ["A valid id is required."]}))
+            else:
+                keyed.append((index, item, pk))
+        return keyed, results
+
+    def validate_updates(self, serializer, keyed):
+        """
+        Load the rows being updated in one query and validate every item.
+        Returns ``(pending, results)`` where ``pending`` is a list of
+        ``(index, validated_data, instance)`` and ``results`` holds the failures.
+        """
+        instances = self.model._default_manager.in_bulk([pk for _, _, pk in keyed])
+        pending, results = [], []
+        for index, item, pk in keyed:
+            instance = instances.get(pk)
+            if instance is None:
+                results.append(failure(index, {"detail": f"{self.entity_name} does not exist"}))
+                continue
+            valid, rejected = validate_items(serializer, [item], start=index)
+            if rejected:
+                results.append(failure(index, rejected[0][1]))
+            else:
+                pending.append((index, valid[0][1], instance))
+        return pending, results
+
+    def patch(self, request):
+        items, errors = self.get_items(request)
+        if errors:
+            return self.error_response("update", errors)
+
+        keyed, results = self.parse_update_ids(items)
+        serializer = build_batch_serializer(self.serializer_class, partial=True)
+        pending, failures = self.validate_updates(serializer, keyed)
+        results += failures
+
+        def recheck(rows):
+            return find_unique_conflicts(self.model, [(index, data, instance.pk) for index, data, instance in rows])
+
+        conflicts = recheck(pending)
+        results += [failure(index, conflicts[index]) for index, _, _ in pending if index in conflicts]
+        pending = [row for row in pending if row[0] not in conflicts]
+
+        updated_fields = set()
+        for _, data, instance in pending:
+            for name, value in data.items():
+                setattr(instance, name, value)
+            updated_fields.update(data)
+        if pending:
+            updated_fields.update(touch_auto_now_fields(self.model, [instance for _, _, instance in pending]))
+
+            def update(rows):
+                self.model._default_manager.bulk_update(
+                    [instance for _, _, instance in rows], sorted(updated_fields), batch_size=settings.BULK_BATCH_SIZE
+                )
+
+            try:
+                pending, _, conflicts = write_rechecking_conflicts(update, pending, recheck)
+            except IntegrityError as exc:
+                return self.integrity_error_response("update", exc)
+            results += [failure(index, errors) for index, errors in conflicts.items()]
+            if pending:
+                rows_changed.send(
+                    sender=self.model, pks=[instance.pk for _, _, instance in pending], fields=sorted(updated_fields)
+                )
+
+        results += [
+            {"index": index, "status": "updated", "data": serializer.to_representation(instance)}
+            for index, _, instance in pending
+        ]
+        return self.bulk_response("update", results, status.HTTP_200_OK)
+
+    def delete(self, request):
+        items, errors = self.get_items(request)
+        if errors:
+            return self.error_response("delete", errors)
+
+        pk_field = self.model._meta.pk
+        results, pks = [], []
+        for index, item in enumerate(items):
+            try:
+                pk = None if isinstance(item, str) and not item.strip() else pk_field.to_python(item)
+            except DjangoValidationError:
+                pk = None
+            if pk is None:
+                results.append(failure(index, {"detail": "Expected an id."}))
+            else:
+                pks.append((index, pk))
+
+        values = list({pk for _, pk in pks})
+        existing = set()
+        with transaction.atomic():
+            for offset in range(0, len(values), IN_QUERY_CHUNK_SIZE):
+                queryset = self.model._default_manager.filter(pk__in=values[offset:offset + IN_QUERY_CHUNK_SIZE])
+                existing.update(queryset.values_list('pk', flat=True))
+                delete_rows(queryset)
+            # Inside the transaction: receivers that record the deletes (the
+            # sync feed's tombstones) commit or roll back with them.
+            if existing:
+                rows_changed.send(sender=self.model, pks=sorted(existing), deleted=True)
+
+        for index, pk in pks:
+            if pk in existing:
+                results.append({"index": index, "status": "deleted", "id": pk})
+            else:
+                results.append(failure(index, {"detail": f"{self.entity_name} does not exist"}))
+        return self.bulk_response("delete", results, status.HTTP_200_OK)
@@ -0,0 +1,228 @@
+import hashlib
+import math
+import threading
+import time
+from collections import OrderedDict
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models.signals import post_delete, post_save
+from utils.db_router import reading_from_replica
+from utils.signals import rows_changed
+
+
+class LRUCache:
+    """
+    Small thread-safe in-process LRU cache.
+    """
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.lock = threading.Lock()
+        self.data = OrderedDict()
+
+    def get(self, key):
+        with self.lock:
+            value = self.data.get(key)
+            if value is not None:
+                self.data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self.lock:
+            self.data[key] = value
+            self.data.move_to_end(key)
+            while len(self.data) > self.max_size:
+                self.data.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.data.clear()
+
+
+class APICache:
+    """
+    Read-through cache for serialized detail payloads and list pages.
+
+    Entries live in a bounded in-process LRU and, when ``SHARED_ALIAS`` names
+    a Django cache, in that shared backend too. Every key embeds a
+    per-model generation counter that is bumped on any write, so pages cached
+    before a write can never be served after it. Without a shared alias the
+    counters are per process, which is only safe with a single worker, so
+    the cache is then off unless ``ENABLED`` is set to True.
+
+    Payloads read from a replica are stored under the same generation, except
+    within ``MAX_LAG`` (plus a lag check interval) of a write to the model:
+    the replica may not have replayed that write yet.
+    """
+
+    def __init__(self):
+        self.local_generations = {}
+        self.local_written_at = {}
+        self._local = None
+
+    @property
+    def options(self):
+        return settings.API_CACHE
+
+    @property
+    def enabled(self):
+        enabled = self.options['ENABLED']
+        return bool(self.options['SHARED_ALIAS']) if enabled is None else enabled
+
+    @property
+    def local(self):
+        if self._local is None:
+            self._local = LRUCache(self.options['LRU_SIZE'])
+        return self._local
+
+    @property
+    def shared(self):
+        alias = self.options['SHARED_ALIAS']
+        return caches[alias] if alias else None
+
+    def generation_key(self, model):
+        return f"api:{model._meta.label_lower}:generation"
+
+    def generation(self, model):
+        shared = self.shared
+        if shared is None:
+            return self.local_generations.get(model._meta.label_lower, 0)
+        key = self.generation_key(model)
+        value = shared.get(key)
+        if value is None:
+            # Start from the clock so an evicted counter never reuses old keys.
+            shared.add(key, int(time.time() * 1000), timeout=None)
+            value = shared.get(key)
+        return value
+
+    @property
+    def replica_lag_window(self):
+        options = settings.REPLICA_ROUTING
+        return options['MAX_LAG'] + options['LAG_CHECK_INTERVAL']
+
+    def written_key(self, label):
+        return f"api:{label}:written"
+
+    def bump(self, model):
+        label = model._meta.label_lower
+        self.local_generations[label] = self.local_generations.get(label, 0) + 1
+        self.local_written_at[label] = time.time()
+        shared = self.shared
+        if shared is not None:
+            key = self.generation_key(model)
+            try:
+                shared.incr(key)
+            except ValueError:
+                shared.add(key, int(time.time() * 1000), timeout=None)
+            shared.set(self.written_key(label), 1, timeout=math.ceil(self.replica_lag_window))
+
+    def recently_written(self, label):
+        """
+        Whether ``label`` was written too recently for every usable replica
+        to have replayed the write.
+        """
+        shared = self.shared
+        if shared is not None:
+            return shared.get(self.written_key(label)) is not None
+        return time.time() - self.local_written_at.get(label, 0) < self.replica_lag_window
+
+    def detail_key(self, model, pk):
+        return self.detail_keys(model, [pk])[pk]
+
+    def detail_keys(self, model, pks):
+        """
+        `detail_key` for each of ``pks``, reading the generation once.
+        """
+        generation = self.generation(model)
+        return {pk: f"api:{model._meta.label_lower}:{generation}:detail:{pk}" for pk in pks}
+
+    def list_key(self, model, request):
+        digest = hashlib.sha1(request.build_absolute_uri().encode()).hexdigest()
+        return f"api:{model._meta.label_lower}:{self.generation(model)}:list:{digest}"
+
+    def get(self, key):
+        if not self.enabled:
+            return None
+        value = self.local.get(key)
+        shared = self.shared
+        if value is None and shared is not None:
+            value = shared.get(key)
+            if value is not None:
+                self.local.set(key, value)
+        return value
+
+    def get_many(self, keys):
+        """
+        `get` for several keys, with one round trip to the shared backend;
+        returns ``{key: value}`` for the keys found.
+        """
+        if not self.enabled:
+            return {}
+        found = {}
+        for key in keys:
+            value = self.local.get(key)
+            if value is not None:
+                found[key] = value
+        shared = self.shared
+        misses = [key for key in keys if key not in found]
+        if misses and shared is not None:
+            for key, value in shared.get_many(misses).items():
+                self.local.set(key, value)
+                found[key] = value
+        return found
+
+    def set(self, key, value):
+        """
+        Store ``value`` under ``key`` (built by `detail_key`, `list_key` or
+        alike: ``api:<model label>:<generation>:...``) and return it.
+        """
+        if not self.enabled or (reading_from_replica() and self.recently_written(key.split(':', 2)[1])):
+            return value
+        self.local.set(key, value)
+        shared = self.shared
+        if shared is not None:
+            shared.set(key, value, timeout=self.options['TIMEOUT'])
+        return value
+
+    def set_many(self, entries):
+        """
+        `set` for several ``{key: value}`` entries of one model, with one
+        round trip to the shared backend; returns ``entries``.
+        """
+        if not entries or not self.enabled:
+            return entries
+        if reading_from_replica() and self.recently_written(next(iter(entries)).split(':', 2)[1]):
+            return entries
+        for key, value in entries.items():
+            self.local.set(key, value)
+        shared = self.shared
+        if shared is not None:
+            shared.set_many(entries, timeout=self.options['TIMEOUT'])
+        return entries
+
+    def register(self, model):
+        """
+        Invalidate ``model``'s entries on save, delete and bulk writes.
+        """
+        uid = f"api-cache-{model._meta.label_lower}"
+        post_save.connect(self.on_change, sender=model, dispatch_uid=uid)
+        post_delete.connect(self.on_change, sender=model, dispatch_uid=uid)
+        rows_changed.connect(self.on_change, sender=model, dispatch_uid=uid)
+
+    def on_change(self, sender, **kwargs):
+        self.bump(sender)
+
+
+api_cache = APICache()
+
+
+async def call_cache(method, *args):
+    """
+    Call an `api_cache` method from the event loop. The in-process LRU is
+    called directly; a shared backend does network I/O, so it runs in a thread.
+    """
+    if api_cache.shared is None:
+        return method(*args)
+    return await sync_to_async(method)(*args)
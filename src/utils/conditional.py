@@ -0,0 +1,131 @@
+import hashlib
+import json
+from datetime import datetime, timezone
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Count, Max
+from django.utils.dateparse import parse_datetime
+from django.utils.http import http_date, parse_etags, parse_http_date_safe, quote_etag, urlencode
+from rest_framework import status
+from rest_framework.response import Response
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def has_conditional_headers(request):
+    return 'HTTP_IF_NONE_MATCH' in request.META or 'HTTP_IF_MODIFIED_SINCE' in request.META
+
+
+def make_validators(version, last_modified):
+    """
+    Build ``{"etag", "last_modified"}`` for a response.
+
+    ``version`` identifies the representation (e.g. model, pk and
+    ``updated_at``), never the request URL: an ETag read from one URL of an
+    object, e.g. ``?fields=name``, must still match for ``If-Match`` on another.
+    """
+    digest = hashlib.sha1(version.encode()).hexdigest()[:32]
+    return {
+        "etag": quote_etag(digest),
+        "last_modified": int((last_modified - EPOCH).total_seconds()) if last_modified else None,
+    }
+
+
+def detail_validators(model, pk, updated_at):
+    """
+    Validators for one object, from its ``updated_at`` (a datetime or the
+    serialized string from a cached payload).
+    """
+    if isinstance(updated_at, str):
+        updated_at = parse_datetime(updated_at)
+    return make_validators(f"{model._meta.label_lower}:{pk}:{updated_at.isoformat()}", updated_at)
+
+
+def fetch_detail_validators(model, pk):
+    """
+    Read only ``updated_at`` for ``pk``; raises ``model.DoesNotExist``.
+    """
+    updated_at = model._default_manager.filter(pk=pk).values_list('updated_at', flat=True).first()
+    if updated_at is None:
+        raise model.DoesNotExist
+    return detail_validators(model, pk, updated_at)
+
+
+async def afetch_detail_validators(model, pk):
+    """
+    Async variant of `fetch_detail_validators`.
+    """
+    updated_at = await model._default_manager.filter(pk=pk).values_list('updated_at', flat=True).afirst()
+    if updated_at is None:
+        raise model.DoesNotExist
+    return detail_validators(model, pk, updated_at)
+
+
+def list_aggregate(queryset):
+    """
+    One cheap aggregate over the filtered queryset: the latest
+    ``updated_at`` and the row count (so deletes change the ETag as well).
+    The count doubles as the paginator's total.
+    """
+    return queryset.order_by().aggregate(last_modified=Max('updated_at'), total=Count('pk'))
+
+
+async def alist_aggregate(queryset):
+    """
+    Async variant of `list_aggregate`.
+    """
+    return await queryset.order_by().aaggregate(last_modified=Max('updated_at'), total=Count('pk'))
+
+
+def aggregate_validators(request, queryset, aggregate):
+    """
+    Validators for a list page from `list_aggregate`. The aggregate is the
+    same for every page, so the query parameters that select and shape the
+    page (sorted, so their order does not matter) are part of the version.
+
+    There is no ``Last-Modified``: the latest ``updated_at`` stays put, or
+    moves back, when a row is deleted or leaves the filter, so
+    ``If-Modified-Since`` would answer 304 for a changed list. The ETag
+    covers the count as well.
+    """
+    last_modified = aggregate['last_modified']
+    params = urlencode(sorted((key, value) for key, values in request.query_params.lists() for value in values))
+    version = (
+        f"{queryset.model._meta.label_lower}?{params}"
+        f"|{last_modified.isoformat() if last_modified else ''}:{aggregate['total']}"
+    )
+    return make_validators(version, None)
+
+
+def content_validators(body):
+    """
+    Validators for a list page from the page body itself, for paginators
+    that avoid an exact ``COUNT(*)``. The ETag stays correct without the
+    count; there is no ``Last-Modified`` because a delete would not move it.
+    """
+    version = hashlib.sha1(json.dumps(body, sort_keys=True, cls=DjangoJSONEncoder).encode()).hexdigest()
+    return make_validators(version, None)
+
+
+def is_not_modified(request, validators):
+    """
+    Evaluate ``If-None-Match``, or ``If-Modified-Since`` when no ETag was sent.
+    """
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+    if if_none_match:
+        etags = parse_etags(if_none_match)
+        return '*' in etags or validators['etag'] in etags or f"W/{validators['etag']}" in etags
+    if_modified_since = parse_http_date_safe(request.META.get('HTTP_IF_MODIFIED_SINCE', ''))
+    last_modified = validators['last_modified']
+    return if_modified_since is not None and last_modified is not None and last_modified <= if_modified_since
+
+
+def apply_validators(response, validators):
+    response['ETag'] = validators['etag']
+    if validators['last_modified'] is not None:
+        response['Last-Modified'] = http_date(validators['last_modified'])
+    return response
+
+
+def not_modified_response(validators):
+    return apply_validators(Response(status=status.HTTP_304_NOT_MODIFIED), validators)
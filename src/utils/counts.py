@@ -0,0 +1,87 @@
+import hashlib
+
+from django.conf import settings
+from django.db import DatabaseError, connections
+from rest_framework.exceptions import ValidationError
+from utils.cache import api_cache
+
+COUNT_STRATEGIES = ('exact', 'cached', 'estimated')
+COUNT_QUERY_PARAM = 'count'
+
+
+def get_count_strategy(view, request):
+    """
+    Return the count strategy for a list request: ``?count=`` if given,
+    else the view's ``count_strategy``, else ``LIST_COUNT['STRATEGY']``.
+    """
+    strategy = request.query_params.get(COUNT_QUERY_PARAM)
+    if strategy is None:
+        return getattr(view, 'count_strategy', None) or settings.LIST_COUNT['STRATEGY']
+    if strategy not in COUNT_STRATEGIES:
+        raise ValidationError({COUNT_QUERY_PARAM: [f"Expected one of: {', '.join(COUNT_STRATEGIES)}."]})
+    return strategy
+
+
+def cached_count(queryset):
+    """
+    Exact count stored in `api_cache` under the model's generation, so any
+    write through the API (or a ``rows_changed`` signal) invalidates it.
+    Without the API cache enabled this is a plain ``count()``.
+    """
+    queryset = queryset.order_by()
+    sql, params = queryset.query.sql_with_params()
+    digest = hashlib.sha1(f"{sql}|{params}".encode()).hexdigest()
+    key = f"api:{queryset.model._meta.label_lower}:{api_cache.generation(queryset.model)}:count:{digest}"
+    total = api_cache.get(key)
+    if total is None:
+        total = api_cache.set(key, queryset.count())
+    return total
+
+
+def estimate_count(queryset):
+    """
+    Planner estimate of the row count, or ``None`` when there is none.
+
+    PostgreSQL uses ``pg_class.reltuples`` for an unfiltered table and the
+    ``EXPLAIN`` row estimate otherwise. SQLite can only estimate an
+    unfiltered table, from the ``sqlite_stat1`` statistics ``ANALYZE`` keeps.
+    """
+    connection = connections[queryset.db]
+    query = queryset.order_by().query
+    unfiltered = not query.where and not query.distinct and query.low_mark == 0 and query.high_mark is None
+    table = queryset.model._meta.db_table
+    try:
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                if unfiltered:
+                    cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass", [table])
+                    row = cursor.fetchone()
+                    # reltuples is -1 until the table is first vacuumed or analyzed
+                    return row[0] if row and row[0] >= 0 else None
+                sql, params = query.sql_with_params()
+                cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+                plan = cursor.fetchone()[0]
+                return int(plan[0]['Plan']['Plan Rows'])
+            if connection.vendor == 'sqlite' and unfiltered:
+                cursor.execute("SELECT stat FROM sqlite_stat1 WHERE tbl = %s LIMIT 1", [table])
+                row = cursor.fetchone()
+                return int(row[0].split()[0]) if row else None
+    except DatabaseError:  # e.g. no sqlite_stat1 before the first ANALYZE
+        return None
+    return None
+
+
+def count_queryset(queryset, strategy):
+    """
+    Return ``(total, exact)`` for ``queryset`` using ``strategy``.
+
+    Estimates below ``LIST_COUNT['EXACT_BELOW']`` are replaced by an exact
+    count, which is cheap at that size; so is a missing estimate.
+    """
+    if strategy == 'cached':
+        return cached_count(queryset), True
+    if strategy == 'estimated':
+        estimate = estimate_count(queryset)
+        if estimate is not None and estimate >= settings.LIST_COUNT['EXACT_BELOW']:
+            return estimate, False
+    return queryset.count(), True
@@ -0,0 +1,111 @@
+import random
+import threading
+import time
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+
+# Replica chosen for the request being served in the current context, or
+# None when reads go to the primary.
+read_database = ContextVar('read_database', default=None)
+
+
+def reading_from_replica():
+    return read_database.get() is not None
+
+
+def measure_lag(alias):
+    """
+    Return how many seconds ``alias`` is behind the primary, or ``None``
+    when it cannot be reached. Only PostgreSQL streaming replicas report
+    lag; other backends (e.g. SQLite files standing in for replicas
+    locally) count as current.
+    """
+    connection = connections[alias]
+    try:
+        with connection.cursor() as cursor:
+            if connection.vendor != 'postgresql':
+                cursor.execute('SELECT 1')
+                return 0.0
+            # An idle primary stops advancing the replay timestamp, so a
+            # replica that has replayed everything it received is current.
+            cursor.execute(
+                "SELECT CASE WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn()"
+                " THEN 0 ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END"
+            )
+            return float(cursor.fetchone()[0] or 0)
+    except DatabaseError:
+        return None
+
+
+class ReplicaLagMonitor:
+    """
+    Keeps the set of replicas whose lag is within ``MAX_LAG`` seconds,
+    re-measured at most every ``LAG_CHECK_INTERVAL`` seconds per process.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.healthy = []
+        self.checked_at = None
+
+    @property
+    def options(self):
+        return settings.REPLICA_ROUTING
+
+    def is_stale(self):
+        return self.checked_at is None or time.monotonic() - self.checked_at >= self.options['LAG_CHECK_INTERVAL']
+
+    def refresh(self):
+        with self.lock:
+            if not self.is_stale():
+                return
+            lags = {alias: measure_lag(alias) for alias in settings.DATABASE_REPLICAS}
+            self.healthy = [alias for alias, lag in lags.items() if lag is not None and lag <= self.options['MAX_LAG']]
+            self.checked_at = time.monotonic()
+
+    def choose(self):
+        """
+        Return a healthy replica alias, or ``None`` to read from the primary.
+        """
+        if self.is_stale():
+            self.refresh()
+        return random.choice(self.healthy) if self.healthy else None
+
+    def reset(self):
+        self.checked_at = None
+
+
+lag_monitor = ReplicaLagMonitor()
+
+
+class ReplicaRouter:
+    """
+    Sends reads of the models in ``REPLICA_ROUTING['APPS']`` to the replica
+    `ReplicaRoutingMiddleware` picked for the current request, and every
+    write to the primary. Replicas are never migrated; they receive the
+    schema through replication.
+    """
+
+    def db_for_read(self, model, **hints):
+        alias = read_database.get()
+        if alias is not None and model._meta.app_label in settings.REPLICA_ROUTING['APPS']:
+            return alias
+        return None
+
+    def db_for_write(self, model, **hints):
+        # Explicit, so saving an instance read from a replica still writes
+        # to the primary instead of the instance's database.
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        aliases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in settings.DATABASE_REPLICAS:
+            return False
+        return None
@@ -0,0 +1,16 @@
+from rest_framework.views import exception_handler
+from utils.response_formatter import custom_response
+
+
+def api_exception_handler(exc, context):
+    """
+    DRF's exception handler with the error wrapped in the `custom_response`
+    envelope, so exceptions raised outside a view's own error handling
+    (e.g. an invalid ``?count=``, filter or ``?fields=``) look like every
+    other error response.
+    """
+    response = exception_handler(exc, context)
+    if response is not None:
+        errors = response.data if isinstance(response.data, dict) else {"detail": response.data}
+        response.data = custom_response(message=response.status_text, code=response.status_code, errors=errors)
+    return response
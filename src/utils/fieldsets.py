@@ -0,0 +1,65 @@
+from rest_framework.exceptions import ValidationError
+
+FIELDS_QUERY_PARAM = 'fields'
+EXCLUDE_QUERY_PARAM = 'exclude'
+
+
+def get_fieldset(request, serializer_class):
+    """
+    Return the tuple of serializer field names selected by ``?fields=`` and
+    ``?exclude=`` (comma-separated), or ``None`` when neither is sent.
+
+    ``id`` is accepted as an alias for the primary key field. Unknown names
+    raise a ``ValidationError`` (400).
+    """
+    params = request.query_params
+    if not params.get(FIELDS_QUERY_PARAM) and not params.get(EXCLUDE_QUERY_PARAM):
+        return None
+    readable = [field.field_name for field in serializer_class.fast_fields() if not field.write_only]
+    aliases = {'id': serializer_class.Meta.model._meta.pk.name}
+    selected = {}
+    for param in (FIELDS_QUERY_PARAM, EXCLUDE_QUERY_PARAM):
+        names = [aliases.get(name, name) for name in params.get(param, '').replace(' ', '').split(',') if name]
+        unknown = [name for name in names if name not in readable]
+        if unknown:
+            raise ValidationError({param: [f"Unknown field(s): {', '.join(unknown)}."]})
+        selected[param] = names
+    fieldset = tuple(
+        name for name in readable
+        if (not selected[FIELDS_QUERY_PARAM] or name in selected[FIELDS_QUERY_PARAM])
+        and name not in selected[EXCLUDE_QUERY_PARAM]
+    )
+    if not fieldset:
+        raise ValidationError({FIELDS_QUERY_PARAM: ["At least one field must be selected."]})
+    return fieldset
+
+
+def trim(data, fieldset):
+    """
+    Restrict an already serialized object to ``fieldset``.
+    """
+    return data if fieldset is None else {name: data[name] for name in fieldset}
+
+
+class SparseFieldsetMixin:
+    """
+    Lets a model serializer render only a subset of its fields, chosen per
+    request with `get_fieldset`, and narrow the queryset to the columns
+    those fields read.
+    """
+
+    def __init__(self, *args, fieldset=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fieldset is not None:
+            for name in set(self.fields) - set(fieldset):
+                self.fields.pop(name)
+
+    @classmethod
+    def restrict(cls, queryset, fieldset):
+        """
+        Defer the columns of fields outside ``fieldset`` (the primary key is
+        always loaded).
+        """
+        if fieldset is None:
+            return queryset
+        return queryset.only(*[field.source for field in cls.fast_fields(fieldset)])
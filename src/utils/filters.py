@@ -0,0 +1,102 @@
+import sys
+
+from django.db import connections
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend, OrderingFilter
+
+
+def prefix_upper_bound(prefix):
+    """
+    Smallest string greater than every string starting with ``prefix``, or
+    None when the prefix ends in U+10FFFF, which has no successor.
+    """
+    if ord(prefix[-1]) == sys.maxunicode:
+        return None
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+class DeclaredFilterBackend(BaseFilterBackend):
+    """
+    Applies the filters a view declares in ``filter_fields``, a mapping of
+    model field to filter kind. Every declared field must be backed by an
+    index whose leading column is that field.
+
+    - ``exact``: ``?<field>=value``
+    - ``prefix``: ``?<field>_prefix=value``
+    - ``range``: ``?<field>_after=<iso datetime>`` (inclusive) and
+      ``?<field>_before=<iso datetime>`` (exclusive)
+
+    Prefixes are sent to PostgreSQL as ``LIKE 'x%'`` (served by Django's
+    ``varchar_pattern_ops`` index) and elsewhere as a ``>= / <`` range,
+    which SQLite's binary-collated indexes can seek on.
+    """
+
+    @staticmethod
+    def active_filters(request, view):
+        """
+        Yield ``(field, kind, param, value)`` for each declared filter in the request.
+        """
+        params = request.query_params
+        for field, kind in getattr(view, 'filter_fields', {}).items():
+            names = {'exact': [field], 'prefix': [f'{field}_prefix'], 'range': [f'{field}_after', f'{field}_before']}[kind]
+            for param in names:
+                if params.get(param):
+                    yield field, kind, param, params[param]
+
+    def filter_queryset(self, request, queryset, view):
+        for field, kind, param, value in self.active_filters(request, view):
+            if kind == 'exact':
+                queryset = queryset.filter(**{field: value})
+            elif kind == 'prefix':
+                queryset = self.filter_prefix(queryset, field, value)
+            else:
+                lookup = 'gte' if param.endswith('_after') else 'lt'
+                queryset = queryset.filter(**{f'{field}__{lookup}': self.parse_datetime(param, value)})
+        return queryset
+
+    def filter_prefix(self, queryset, field, prefix):
+        if connections[queryset.db].vendor == 'postgresql':
+            return queryset.filter(**{f'{field}__startswith': prefix})
+        upper = prefix_upper_bound(prefix)
+        if upper is None:
+            # Still seeks on the lower bound; startswith keeps the match exact.
+            return queryset.filter(**{f'{field}__gte': prefix, f'{field}__startswith': prefix})
+        return queryset.filter(**{f'{field}__gte': prefix, f'{field}__lt': upper})
+
+    def parse_datetime(self, param, value):
+        try:
+            parsed = parse_datetime(value)
+        except ValueError:
+            parsed = None
+        if parsed is None:
+            raise ValidationError({param: ["Expected an ISO 8601 datetime."]})
+        return parsed
+
+
+class StableOrderingFilter(OrderingFilter):
+    """
+    ``?ordering=`` restricted to the view's ``ordering_fields``, with the
+    primary key appended as a tie-breaker so pages are deterministic and
+    match the composite ``(<field>, <pk>)`` indexes.
+    """
+
+    def get_default_ordering(self, view):
+        # Without ?ordering=, sort by the first active prefix/range filter so a
+        # single index seek serves both the filter and the sort.
+        request = getattr(view, 'request', None)
+        if request is not None:
+            for field, kind, _, _ in DeclaredFilterBackend.active_filters(request, view):
+                if kind != 'exact' and field in getattr(view, 'ordering_fields', ()):
+                    return [field]
+        return super().get_default_ordering(view)
+
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        if not ordering:
+            return ordering
+        pk_name = queryset.model._meta.pk.name
+        if not any(field.lstrip('-') in (pk_name, 'pk') for field in ordering):
+            descending = ordering[0].startswith('-')
+            ordering = [*ordering, f"-{pk_name}" if descending else pk_name]
+        return ordering
@@ -0,0 +1,182 @@
+import csv
+import io
+import json
+
+from django.conf import settings
+from django.db import IntegrityError
+from rest_framework import status
+from rest_framework.parsers import MultiPartParser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from utils.bulk import build_batch_serializer, find_unique_conflicts, validate_items, write_rechecking_conflicts
+from utils.response_formatter import custom_response
+from utils.signals import rows_changed
+
+IMPORT_FORMATS = ('csv', 'ndjson')
+
+
+def guess_format(filename):
+    """
+    Return the import format implied by a file name, or ``None``.
+    """
+    extension = filename.rsplit('.', 1)[-1].lower() if '.' in filename else ''
+    if extension in ('json', 'jsonl'):
+        return 'ndjson'
+    return extension if extension in IMPORT_FORMATS else None
+
+
+def iter_records(stream, file_format):
+    """
+    Lazily parse a text stream into ``(row_number, record, error)`` tuples.
+
+    CSV empty cells are dropped so optional fields fall back to their
+    defaults; unparseable NDJSON lines are yielded with an error instead.
+    """
+    if file_format == 'csv':
+        for row_number, row in enumerate(csv.DictReader(stream), start=1):
+            yield row_number, {key: value for key, value in row.items() if key and value != ''}, None
+        return
+
+    for row_number, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield row_number, json.loads(line), None
+        except ValueError as exc:
+            yield row_number, None, {"non_field_errors": [f"Invalid JSON: {exc}"]}
+
+
+class BulkImporter:
+    """
+    Streams records into a model in batches.
+
+    Each batch is validated with one shared serializer, checked for unique
+    collisions with one set-based query per unique field, and inserted with
+    ``bulk_create`` in its own transaction; rows whose unique values a
+    concurrent writer took meanwhile are rejected on their own. Only the
+    current batch is kept in memory; at most ``max_rejections`` rejected rows
+    are kept for the report, while ``on_reject`` sees every one of them.
+    """
+
+    def __init__(self, serializer_class, batch_size=None, max_rejections=None, on_progress=None, on_reject=None):
+        self.serializer_class = serializer_class
+        self.model = serializer_class.Meta.model
+        self.batch_size = batch_size or settings.IMPORT_BATCH_SIZE
+        self.max_rejections = settings.IMPORT_MAX_REJECTIONS if max_rejections is None else max_rejections
+        self.on_progress = on_progress
+        self.on_reject = on_reject
+        self.serializer = build_batch_serializer(serializer_class)
+        self.report = {"processed": 0, "created": 0, "rejected": 0, "rejections": []}
+
+    def reject(self, row_number, errors):
+        self.report["rejected"] += 1
+        if len(self.report["rejections"]) < self.max_rejections:
+            self.report["rejections"].append({"row": row_number, "errors": errors})
+        if self.on_reject:
+            self.on_reject(row_number, errors)
+
+    def run(self, records):
+        """
+        Import ``(row_number, record, error)`` tuples and return the report.
+        """
+        batch = []
+        for row_number, record, error in records:
+            if error:
+                self.report["processed"] += 1
+                self.reject(row_number, error)
+                continue
+            batch.append((row_number, record))
+            if len(batch) >= self.batch_size:
+                self.import_batch(batch)
+                batch = []
+        if batch:
+            self.import_batch(batch)
+        return self.report
+
+    def create_rows(self, valid):
+        """
+        Insert validated ``(index, data)`` rows. Returns ``(instances, rejected)``
+        where ``rejected`` holds the ``(index, errors)`` of rows left out.
+        """
+        def create(rows):
+            instances = [self.model(**data) for _, data in rows]
+            return self.model._default_manager.bulk_create(instances, batch_size=settings.BULK_BATCH_SIZE)
+
+        def find_conflicts(rows):
+            return find_unique_conflicts(self.model, [(index, data, None) for index, data in rows])
+
+        conflicts = find_conflicts(valid)
+        rejected = list(conflicts.items())
+        valid = [(index, data) for index, data in valid if index not in conflicts]
+        try:
+            _, instances, conflicts = write_rechecking_conflicts(create, valid, find_conflicts)
+        except IntegrityError as exc:
+            # No unique conflict explains the error; reject what is left of the batch.
+            return [], rejected + [(index, {"non_field_errors": [f"Batch rolled back: {exc}"]}) for index, _ in valid]
+        return instances, rejected + list(conflicts.items())
+
+    def import_batch(self, batch):
+        row_numbers = [row_number for row_number, _ in batch]
+        valid, rejected = validate_items(self.serializer, [record for _, record in batch])
+        instances, conflicts = self.create_rows(valid)
+        for index, errors in sorted(rejected + conflicts, key=lambda rejection: rejection[0]):
+            self.reject(row_numbers[index], errors)
+        if instances:
+            rows_changed.send(sender=self.model, pks=[instance.pk for instance in instances])
+
+        self.report["processed"] += len(batch)
+        self.report["created"] += len(instances)
+        if self.on_progress:
+            self.on_progress(self.report)
+
+
+class BulkImportAPIView(APIView):
+    """
+    Base view that imports an uploaded CSV or NDJSON file.
+
+    The file is sent as the multipart field ``file``; the format comes from
+    ``?input=csv|ndjson`` or the file extension. Uploads are parsed straight
+    from Django's upload handler (spooled to disk when large).
+    """
+    serializer_class = None
+    entity_name = None  # e.g. "Vendor"
+    parser_classes = [MultiPartParser]
+
+    def error_response(self, errors):
+        return Response(custom_response(
+            message=f"{self.entity_name} import failed",
+            code=400,
+            errors=errors,
+        ), status=status.HTTP_400_BAD_REQUEST)
+
+    def post(self, request):
+        upload = request.FILES.get('file')
+        if upload is None:
+            return self.error_response({"file": ["No file was submitted."]})
+        file_format = request.query_params.get('input') or guess_format(upload.name)
+        if file_format not in IMPORT_FORMATS:
+            return self.error_response({"input": [f"Expected one of: {', '.join(IMPORT_FORMATS)}."]})
+
+        importer = BulkImporter(self.serializer_class)
+        stream = io.TextIOWrapper(upload.file, encoding='utf-8-sig', newline='')
+        try:
+            report = importer.run(iter_records(stream, file_format))
+        except (UnicodeDecodeError, csv.Error) as exc:
+            # Batches before the unreadable part are committed; report them with the error.
+            return Response(custom_response(
+                message=f"{self.entity_name} import stopped",
+                code=400,
+                data=importer.report,
+                errors={"file": [f"Could not read file: {exc}"]},
+            ), status=status.HTTP_400_BAD_REQUEST)
+        finally:
+            stream.detach()
+
+        if not report["created"] and report["rejected"]:
+            code, message = status.HTTP_400_BAD_REQUEST, f"{self.entity_name} import failed"
+        elif report["rejected"]:
+            code, message = status.HTTP_207_MULTI_STATUS, f"{self.entity_name} import partially succeeded"
+        else:
+            code, message = status.HTTP_201_CREATED, f"{self.entity_name} import succeeded"
+        return Response(custom_response(message=message, code=code, data=report), status=code)
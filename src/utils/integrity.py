@@ -0,0 +1,67 @@
+from contextlib import nullcontext
+
+from django.conf import settings
+from django.db import IntegrityError, router, transaction
+from rest_framework.utils.field_mapping import get_unique_error_message
+from rest_framework.validators import UniqueValidator
+
+
+def unique_violation_errors(model, exc):
+    """
+    Map an ``IntegrityError`` raised by a unique column of ``model`` to the
+    errors DRF's ``UniqueValidator`` would have reported, e.g.
+    ``{"email": ["vendor with this email already exists."]}``.
+
+    Returns ``None`` when the error is not a unique violation on one of the
+    model's unique fields.
+    """
+    message = str(exc)
+    # PostgreSQL names the violated constraint; SQLite reports "table.column".
+    constraint = getattr(getattr(exc.__cause__, 'diag', None), 'constraint_name', None) or ''
+    table = model._meta.db_table
+    for field in model._meta.concrete_fields:
+        if not field.unique or field.primary_key:
+            continue
+        if f"{table}.{field.column}" in message or (constraint and field.column in constraint):
+            return {field.name: [get_unique_error_message(field)]}
+    return None
+
+
+class ConstraintUniquenessMixin:
+    """
+    Lets a model serializer leave uniqueness to the database.
+
+    With ``CONSTRAINT_UNIQUENESS`` on, the field ``UniqueValidator``s, which
+    run one SELECT per unique field before every create and update, are
+    dropped. Either way `try_save` turns a unique violation into the errors
+    the validator reports, which also covers two concurrent writes racing
+    past the validators.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if settings.CONSTRAINT_UNIQUENESS:
+            for field in fields.values():
+                field.validators = [v for v in field.validators if not isinstance(v, UniqueValidator)]
+        return fields
+
+    def try_save(self, **kwargs):
+        """
+        ``save()``, returning ``False`` with ``errors`` set instead when a
+        unique constraint rejects the row.
+        """
+        model = self.Meta.model
+        using = router.db_for_write(model)
+        # Inside a transaction a savepoint keeps it usable after the error
+        # (PostgreSQL); in autocommit mode the failed statement is all there is.
+        in_transaction = transaction.get_connection(using).in_atomic_block
+        try:
+            with transaction.atomic(using=using) if in_transaction else nullcontext():
+                self.save(**kwargs)
+        except IntegrityError as exc:
+            errors = unique_violation_errors(model, exc)
+            if errors is None:
+                raise
+            self._errors = errors
+            return False
+        return True
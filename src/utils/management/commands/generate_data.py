@@ -0,0 +1,284 @@
+import argparse
+import multiprocessing
+import random
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+import django
+from django.apps import apps
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.core.management.color import no_style
+from django.db import connection, connections, transaction
+from django.db.models import Max
+from src.apps.accounts.models import Account
+from src.apps.customers.models import Customer
+from src.apps.vendors.models import Vendor
+from utils.signals import rows_changed
+
+FIRST_NAMES = [
+    "James", "Mary", "Kwame", "Ama", "Linda", "Kofi", "Chen", "Aisha", "Carlos", "Fatima",
+    "David", "Esi", "Yaw", "Sofia", "Olivia", "Noah", "Liam", "Akosua", "Ibrahim", "Grace",
+]
+LAST_NAMES = [
+    "Smith", "Mensah", "Boateng", "Johnson", "Owusu", "Garcia", "Wang", "Asante", "Brown", "Osei",
+    "Williams", "Addo", "Nkrumah", "Martinez", "Lee", "Appiah", "Davis", "Quaye", "Lopez", "Darko",
+]
+COMPANY_WORDS = [
+    "Global", "Prime", "Apex", "Summit", "Metro", "Golden", "United", "Atlantic", "Sahel", "Volta",
+    "Pioneer", "Crown", "Harbor", "Union", "Unity", "Keystone", "Delta", "Northern", "Coastal", "Royal",
+]
+COMPANY_SUFFIXES = ["Ltd", "Supplies", "Trading", "Logistics", "Industries", "Group", "Services", "Holdings"]
+STREETS = ["High Street", "Ring Road", "Oxford Street", "Main Street", "Liberation Road", "Market Lane"]
+CITIES = ["Accra", "Kumasi", "Lagos", "London", "New York", "Nairobi", "Tema", "Takoradi"]
+DOMAINS = ["example.com", "example.org", "example.net", "mail.example.com"]
+
+# Chart-of-accounts style distribution: (type, code prefix, weight, names)
+ACCOUNT_TYPES = [
+    ('asset', '1', 30, ["Cash", "Bank", "Receivables", "Inventory", "Equipment", "Prepaid Expenses"]),
+    ('liability', '2', 20, ["Payables", "Accrued Liabilities", "Loans", "Taxes Payable", "Deferred Revenue"]),
+    ('income', '4', 15, ["Sales", "Service Revenue", "Interest Income", "Other Income"]),
+    ('expense', '5', 35, ["Salaries", "Rent", "Utilities", "Travel", "Marketing", "Supplies", "Insurance"]),
+]
+
+ENTITIES = {
+    'customers': Customer,
+    'vendors': Vendor,
+    'accounts': Account,
+}
+# Timestamps are spread over the days before this instant, so a seed
+# reproduces the same dataset whenever it is generated.
+DEFAULT_ANCHOR = '2026-01-01T00:00:00+00:00'
+DEFAULT_COUNTS = {
+    'customers': 10000,
+    'vendors': 100000,
+    'accounts': 100000,
+}
+
+
+@contextmanager
+def explicit_timestamps(model):
+    """
+    Temporarily turn off ``auto_now``/``auto_now_add`` so generated
+    ``created_at``/``updated_at`` values are stored as given.
+    """
+    saved = []
+    for field in model._meta.concrete_fields:
+        if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False):
+            saved.append((field, field.auto_now, field.auto_now_add))
+            field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+def person_name(rng):
+    return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+
+
+def phone(rng):
+    return f"+1{rng.randint(200, 999)}{rng.randint(1000000, 9999999)}"
+
+
+def address(rng):
+    return f"{rng.randint(1, 999)} {rng.choice(STREETS)}, {rng.choice(CITIES)}"
+
+
+def timestamps(rng, anchor, days):
+    created_at = anchor - timedelta(seconds=rng.randint(0, days * 86400))
+    updated_at = created_at + timedelta(seconds=int(rng.expovariate(1 / 86400) * 30))
+    return created_at, min(updated_at, anchor)
+
+
+def build_customer(rng, pk, anchor, days):
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    created_at, updated_at = timestamps(rng, anchor, days)
+    return Customer(
+        name=f"{first} {last}",
+        email=f"{first.lower()}.{last.lower()}.{pk}@{rng.choice(DOMAINS)}",
+        phone=phone(rng) if rng.random() < 0.9 else None,
+        address=address(rng) if rng.random() < 0.8 else None,
+        date_of_birth=(anchor - timedelta(days=rng.randint(18 * 365, 80 * 365))).date() if rng.random() < 0.7 else None,
+        created_at=created_at,
+        updated_at=updated_at,
+    )
+
+
+def build_vendor(rng, pk, anchor, days):
+    name = f"{rng.choice(COMPANY_WORDS)} {rng.choice(COMPANY_WORDS)} {rng.choice(COMPANY_SUFFIXES)}"
+    created_at, updated_at = timestamps(rng, anchor, days)
+    return Vendor(
+        name=name,
+        email=f"sales.{pk}@{name.split()[0].lower()}-{rng.choice(DOMAINS)}",
+        phone=phone(rng) if rng.random() < 0.95 else None,
+        address=address(rng) if rng.random() < 0.9 else None,
+        contact_person=person_name(rng) if rng.random() < 0.85 else None,
+        created_at=created_at,
+        updated_at=updated_at,
+    )
+
+
+def build_account(rng, pk, anchor, days):
+    account_type, prefix, _, names = rng.choices(ACCOUNT_TYPES, weights=[t[2] for t in ACCOUNT_TYPES])[0]
+    created_at, updated_at = timestamps(rng, anchor, days)
+    return Account(
+        name=f"{rng.choice(names)} {pk}",
+        code=f"{prefix}{pk:07d}",
+        account_type=account_type,
+        description=f"{account_type.title()} account {pk}" if rng.random() < 0.6 else None,
+        created_at=created_at,
+        updated_at=updated_at,
+    )
+
+
+BUILDERS = {
+    'customers': build_customer,
+    'vendors': build_vendor,
+    'accounts': build_account,
+}
+
+
+def generate_chunk(entity, start, stop, base_pk, seed, anchor, days, batch_size):
+    """
+    Insert rows ``start..stop-1`` for one entity, with primary keys
+    ``base_pk + start + 1`` onwards.
+
+    The random stream is seeded from ``(seed, entity, start)`` and every row
+    gets an explicit primary key, so a dataset is identical for a given seed
+    no matter how many workers build it or in which order chunks finish.
+    Unique values are derived from the primary key, so appending to existing
+    rows does not collide with them.
+    """
+    rng = random.Random(f"{seed}:{entity}:{start}")
+    model, build = ENTITIES[entity], BUILDERS[entity]
+    rows = []
+    for pk in range(base_pk + start + 1, base_pk + stop + 1):
+        row = build(rng, pk, anchor, days)
+        row.pk = pk
+        rows.append(row)
+    with explicit_timestamps(model), transaction.atomic():
+        model._default_manager.bulk_create(rows, batch_size=batch_size)
+    return entity, stop - start
+
+
+def run_task(task):
+    return generate_chunk(*task)
+
+
+def init_worker():
+    if not apps.ready:
+        django.setup()
+
+
+def reset_sequences(models):
+    """
+    Move the id sequences past the explicitly assigned primary keys
+    (a no-op on SQLite, which tracks them by itself).
+    """
+    with connection.cursor() as cursor:
+        for sql in connection.ops.sequence_reset_sql(no_style(), models):
+            cursor.execute(sql)
+
+
+def truncate(models):
+    """
+    Empty the tables and reset their id sequences in one flush
+    (TRUNCATE on PostgreSQL), bypassing the ORM delete collector.
+    """
+    tables = [model._meta.db_table for model in models]
+    sql_list = connection.ops.sql_flush(no_style(), tables, reset_sequences=True)
+    connection.ops.execute_sql_flush(sql_list)
+
+
+def anchor_datetime(value):
+    """
+    Parse ``--anchor``; dates without a time zone are taken as UTC.
+    """
+    try:
+        anchor = datetime.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Expected an ISO date or datetime, got {value!r}.")
+    return anchor if anchor.tzinfo else anchor.replace(tzinfo=dt_timezone.utc)
+
+
+class Command(BaseCommand):
+    help = "Generate a deterministic synthetic dataset of customers, vendors and accounts."
+
+    def add_arguments(self, parser):
+        for entity, count in DEFAULT_COUNTS.items():
+            parser.add_argument(f'--{entity}', type=int, help=f"Number of {entity} (default {count} x scale).")
+        parser.add_argument('--scale', type=float, default=1.0, help="Multiplier applied to the default counts.")
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--batch-size', type=int, default=5000, help="Rows built and inserted per chunk.")
+        parser.add_argument('--workers', type=int, default=1, help="Processes inserting in parallel (PostgreSQL).")
+        parser.add_argument('--days', type=int, default=730, help="Spread created_at over this many days before --anchor.")
+        parser.add_argument('--anchor', type=anchor_datetime, default=DEFAULT_ANCHOR,
+                            help=f"ISO date or datetime the timestamps end at (default {DEFAULT_ANCHOR}).")
+        parser.add_argument('--truncate', action='store_true', help="Empty the tables first.")
+        parser.add_argument('--no-index', dest='index', action='store_false',
+                            help="Skip rebuilding the search index (run rebuild_search_index later).")
+
+    def handle(self, *args, **options):
+        counts = {
+            entity: options[entity] if options[entity] is not None else int(default * options['scale'])
+            for entity, default in DEFAULT_COUNTS.items()
+        }
+        workers = options['workers']
+        if workers > 1 and connection.vendor == 'sqlite':
+            self.stderr.write("SQLite allows a single writer, falling back to --workers 1.")
+            workers = 1
+
+        if options['truncate']:
+            truncate(ENTITIES.values())
+            self.stdout.write("Tables truncated.")
+
+        anchor = options['anchor']
+        if isinstance(anchor, str):  # call_command() keyword arguments skip argparse
+            anchor = anchor_datetime(anchor)
+        batch_size = options['batch_size']
+        base_pks = {
+            entity: ENTITIES[entity]._default_manager.aggregate(last=Max('pk'))['last'] or 0
+            for entity in counts
+        }
+        tasks = [
+            (
+                entity, start, min(start + batch_size, count), base_pks[entity],
+                options['seed'], anchor, options['days'], batch_size,
+            )
+            for entity, count in counts.items()
+            for start in range(0, count, batch_size)
+        ]
+        done = dict.fromkeys(counts, 0)
+        started = time.monotonic()
+
+        def report(result):
+            entity, created = result
+            done[entity] += created
+            self.stdout.write(f"{entity}: {done[entity]}/{counts[entity]}")
+
+        if workers > 1:
+            connections.close_all()  # Children must not share the parent's connection
+            with multiprocessing.Pool(workers, initializer=init_worker) as pool:
+                for result in pool.imap_unordered(run_task, tasks):
+                    report(result)
+        else:
+            for task in tasks:
+                report(generate_chunk(*task))
+
+        reset_sequences([ENTITIES[entity] for entity, count in counts.items() if count])
+        changed = [entity for entity, count in counts.items() if count or options['truncate']]
+        for entity in changed:
+            rows_changed.send(sender=ENTITIES[entity], pks=None)
+
+        elapsed = time.monotonic() - started
+        total = sum(counts.values())
+        self.stdout.write(self.style.SUCCESS(
+            f"Generated {total} rows in {elapsed:.1f}s ({total / max(elapsed, 1e-9):.0f} rows/s)."
+        ))
+        # Rows written in bulk are not indexed one by one; rebuild the index
+        # of the changed entities in one pass instead.
+        if options['index'] and changed:
+            call_command('rebuild_search_index', *changed, stdout=self.stdout)
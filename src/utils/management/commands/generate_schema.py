@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+from utils.api_schema import generate_schema, schema_path
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate the OpenAPI schema once (e.g. at build time) and write it as JSON and YAML "
+        "to API_SCHEMA['DIR'], from where /swagger.json, /swagger.yaml and the docs pages serve it."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dir', help="Write the files here instead of API_SCHEMA['DIR'].")
+
+    def handle(self, *args, **options):
+        for fmt, content in generate_schema().items():
+            path = schema_path(fmt, options['dir'])
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(content)
+            self.stdout.write(f"{path}: {len(content)} bytes")
@@ -0,0 +1,63 @@
+import json
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+from src.apps.accounts.serializers import AccountSerializer
+from src.apps.customers.serializers import CustomerSerializer
+from src.apps.vendors.serializers import VendorSerializer
+from utils.importer import IMPORT_FORMATS, BulkImporter, guess_format, iter_records
+
+IMPORT_SERIALIZERS = {
+    'customers': CustomerSerializer,
+    'vendors': VendorSerializer,
+    'accounts': AccountSerializer,
+}
+
+
+class Command(BaseCommand):
+    help = "Stream a CSV or NDJSON file into customers, vendors or accounts using batched bulk inserts."
+
+    def add_arguments(self, parser):
+        parser.add_argument('entity', choices=sorted(IMPORT_SERIALIZERS))
+        parser.add_argument('path', help="File to import, or '-' to read from stdin.")
+        parser.add_argument('--format', choices=IMPORT_FORMATS, help="Defaults to the file extension.")
+        parser.add_argument('--batch-size', type=int, help="Rows validated and inserted per batch.")
+        parser.add_argument('--rejects', help="Write rejected rows to this file as NDJSON.")
+
+    def handle(self, *args, **options):
+        path = options['path']
+        file_format = options['format'] or guess_format(path)
+        if file_format is None:
+            raise CommandError("Cannot infer the file format, pass --format.")
+
+        rejects = open(options['rejects'], 'w', encoding='utf-8') if options['rejects'] else None
+
+        def on_reject(row_number, errors):
+            if rejects:
+                rejects.write(json.dumps({"row": row_number, "errors": errors}) + '\n')
+
+        def on_progress(report):
+            self.stdout.write(
+                f"processed={report['processed']} created={report['created']} rejected={report['rejected']}"
+            )
+
+        importer = BulkImporter(
+            IMPORT_SERIALIZERS[options['entity']],
+            batch_size=options['batch_size'],
+            max_rejections=0,
+            on_progress=on_progress,
+            on_reject=on_reject,
+        )
+        stream = sys.stdin if path == '-' else open(path, encoding='utf-8-sig', newline='')
+        try:
+            report = importer.run(iter_records(stream, file_format))
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+            if rejects:
+                rejects.close()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {report['created']} {options['entity']}, rejected {report['rejected']} "
+            f"of {report['processed']} rows."
+        ))
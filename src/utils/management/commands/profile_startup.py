@@ -0,0 +1,107 @@
+import json
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from utils.startup import group_import_times, parse_importtime
+
+# Boots the project in a fresh interpreter the way a WSGI worker does, timing
+# each phase; run under -X importtime, which reports every import on stderr.
+BOOT_SCRIPT = '''
+import io, json, sys, time
+sys.path[:0] = [{root!r}, {src!r}]
+started = time.perf_counter()
+phases = []
+def mark(name):
+    phases.append((name, time.perf_counter()))
+import django
+from django.conf import settings
+settings.INSTALLED_APPS
+mark('settings')
+django.setup(set_prefix=False)
+mark('apps')
+from django.core.handlers.wsgi import WSGIHandler
+application = WSGIHandler()
+mark('middleware')
+from django.urls import get_resolver
+get_resolver().url_patterns
+mark('urlconf')
+if settings.WARM_UP:
+    from utils.startup import warm_up
+    warm_up()
+    mark('warm_up')
+status = None
+if {path!r}:
+    path, _, query = {path!r}.partition('?')
+    environ = {{
+        'REQUEST_METHOD': 'GET', 'PATH_INFO': path, 'QUERY_STRING': query, 'SERVER_NAME': 'localhost',
+        'SERVER_PORT': '80', 'HTTP_HOST': 'localhost', 'HTTP_ACCEPT': 'application/json',
+        'wsgi.input': io.BytesIO(), 'wsgi.errors': sys.stderr, 'wsgi.url_scheme': 'http',
+    }}
+    statuses = []
+    b''.join(application(environ, lambda status, headers: statuses.append(status)))
+    status = statuses[0]
+    mark('first_request')
+previous, timings = started, []
+for name, at in phases:
+    timings.append((name, (at - previous) * 1000))
+    previous = at
+print(json.dumps({{'phases': timings, 'modules': len(sys.modules), 'status': status}}))
+'''
+
+
+class Command(BaseCommand):
+    help = (
+        "Boot the project in a fresh interpreter like a WSGI worker and report the time of each boot "
+        "phase and of the imports per app or package (from python -X importtime)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top', type=int, default=15, help="Slowest modules and groups to list.")
+        parser.add_argument('--path', help="Also time a first GET of this path, e.g. /api/accounts/?page_size=1.")
+        parser.add_argument('--json', action='store_true', help="Print the full report as JSON.")
+
+    def handle(self, *args, **options):
+        src = settings.BASE_DIR
+        script = BOOT_SCRIPT.format(root=str(src.parent), src=str(src), path=options['path'] or '')
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE=settings.SETTINGS_MODULE)
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', script], env=env, capture_output=True, text=True,
+        )
+        if result.returncode != 0:
+            raise CommandError(f"Boot failed:\n{result.stderr[-2000:]}")
+        boot = json.loads(result.stdout.strip().splitlines()[-1])
+        modules = parse_importtime(result.stderr)
+        report = {
+            'settings': settings.SETTINGS_MODULE,
+            'phases_ms': {name: round(ms, 1) for name, ms in boot['phases']},
+            'total_ms': round(sum(ms for _, ms in boot['phases']), 1),
+            'modules_loaded': boot['modules'],
+            'first_request_status': boot['status'],
+            'import_ms': round(sum(self_us for _, self_us, _, _ in modules) / 1000, 1),
+            'groups': [
+                {'group': group, 'self_ms': round(self_us / 1000, 1), 'modules': count}
+                for group, self_us, count in group_import_times(modules)
+            ],
+            'slowest': [
+                {'module': module, 'self_ms': round(self_us / 1000, 1), 'cumulative_ms': round(cumulative_us / 1000, 1)}
+                for module, self_us, cumulative_us, _ in sorted(modules, key=lambda row: -row[2])
+            ][:options['top']],
+        }
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+
+        self.stdout.write(f"Boot of {report['settings']}: {report['total_ms']} ms, {report['modules_loaded']} modules")
+        for name, ms in report['phases_ms'].items():
+            self.stdout.write(f"  {name:16} {ms:9.1f} ms")
+        if report['first_request_status']:
+            self.stdout.write(f"  (first request: {report['first_request_status']})")
+        self.stdout.write(f"\nImports: {report['import_ms']} ms, by app or package")
+        for row in report['groups'][:options['top']]:
+            self.stdout.write(f"  {row['group']:32} {row['self_ms']:9.1f} ms {row['modules']:5d} modules")
+        self.stdout.write("\nSlowest imports (cumulative, including what they import)")
+        for row in report['slowest']:
+            self.stdout.write(f"  {row['module']:48} {row['cumulative_ms']:9.1f} ms (self {row['self_ms']} ms)")
@@ -0,0 +1,42 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from utils.slow_queries import REPORT_ORDERS, slow_query_log
+
+
+class Command(BaseCommand):
+    help = (
+        "Report the slowest query fingerprints recorded by the slow-query log of every worker "
+        "(read from SLOW_QUERIES['DIR']), with their plans and sequentially scanned tables."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top', type=int, default=20)
+        parser.add_argument('--order', choices=list(REPORT_ORDERS), default='total')
+        parser.add_argument('--no-plans', action='store_true', help="Leave out the EXPLAIN output.")
+        parser.add_argument('--reset', action='store_true', help="Delete the workers' snapshots instead.")
+
+    def handle(self, *args, **options):
+        store = slow_query_log.store
+        if store is None:
+            self.stderr.write("SLOW_QUERIES['DIR'] is not set, so worker logs cannot be read from here.")
+        if options['reset']:
+            for path in store.directory.glob(f"{store.name}-*.json") if store else ():
+                path.unlink(missing_ok=True)
+            slow_query_log.reset()
+            return
+
+        entries = slow_query_log.report(options['top'], options['order'])
+        threshold = settings.SLOW_QUERIES['THRESHOLD_MS']
+        self.stdout.write(f"{len(entries)} fingerprint(s) slower than {threshold} ms, by {options['order']}\n")
+        for rank, entry in enumerate(entries, 1):
+            self.stdout.write(
+                f"#{rank} {entry['fingerprint']}  count {entry['count']}  total {entry['totalMs']} ms  "
+                f"mean {entry['meanMs']} ms  max {entry['maxMs']} ms  last {entry['lastSeen']}"
+            )
+            self.stdout.write(f"  {entry['sql']}")
+            if entry['seqScans']:
+                self.stdout.write(f"  sequential scans: {', '.join(entry['seqScans'])}")
+            if entry['plan'] and not options['no_plans']:
+                for line in entry['plan']:
+                    self.stdout.write(f"    {line}")
+            self.stdout.write("")
@@ -0,0 +1,168 @@
+import hmac
+import os
+import threading
+from bisect import bisect_left
+
+from django.conf import settings
+from django.http import HttpResponse
+from rest_framework.permissions import BasePermission, IsAdminUser
+from rest_framework.views import APIView
+from utils.snapshots import SnapshotStore, flusher
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+HISTOGRAMS = {
+    'latency': ('http_request_duration_seconds', "Request latency in seconds.", LATENCY_BUCKETS),
+    'db_time': ('http_request_db_duration_seconds', "Time spent in SQL per request, in seconds.", LATENCY_BUCKETS),
+    'queries': ('http_request_db_queries', "SQL statements executed per request.", QUERY_BUCKETS),
+    'size': ('http_response_size_bytes', "Response body size in bytes.", SIZE_BUCKETS),
+}
+
+
+def new_route_stats():
+    return {
+        'statuses': {},
+        **{name: {'buckets': [0] * (len(spec[2]) + 1), 'sum': 0.0, 'count': 0} for name, spec in HISTOGRAMS.items()},
+    }
+
+
+def merge_route_stats(target, source):
+    for status, count in source['statuses'].items():
+        target['statuses'][status] = target['statuses'].get(status, 0) + count
+    for name in HISTOGRAMS:
+        histogram, other = target[name], source[name]
+        histogram['buckets'] = [a + b for a, b in zip(histogram['buckets'], other['buckets'])]
+        histogram['sum'] += other['sum']
+        histogram['count'] += other['count']
+
+
+class MetricsRegistry:
+    """
+    In-process request metrics keyed by ``(route name, method)``.
+
+    Observations only touch a dict under a lock. When ``METRICS_DIR`` is set,
+    the `utils.snapshots.flusher` thread writes the state to a
+    `SnapshotStore` every ``METRICS_FLUSH_INTERVAL`` seconds, off the request
+    path, so that ``/metrics`` can sum all live workers.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.routes = {}
+        self.flusher_pid = None
+
+    @property
+    def store(self):
+        directory = getattr(settings, 'METRICS_DIR', None)
+        return SnapshotStore(directory, 'metrics', max_age=settings.METRICS_SNAPSHOT_MAX_AGE) if directory else None
+
+    def observe(self, route, method, status, latency, queries, db_time, size):
+        key = f"{route}|{method}"
+        with self.lock:
+            stats = self.routes.get(key)
+            if stats is None:
+                stats = self.routes[key] = new_route_stats()
+            status = str(status)
+            stats['statuses'][status] = stats['statuses'].get(status, 0) + 1
+            for name, value in (('latency', latency), ('db_time', db_time), ('queries', queries), ('size', size)):
+                if value is None:
+                    continue
+                histogram = stats[name]
+                histogram['buckets'][bisect_left(HISTOGRAMS[name][2], value)] += 1
+                histogram['sum'] += value
+                histogram['count'] += 1
+        if self.flusher_pid != os.getpid() and settings.METRICS_DIR:
+            self.start_flusher()
+
+    def start_flusher(self):
+        """
+        Have this process's `utils.snapshots.flusher` thread write the
+        snapshot every ``METRICS_FLUSH_INTERVAL`` seconds.
+        """
+        self.flusher_pid = os.getpid()
+        flusher.register(self.flush, lambda: settings.METRICS_FLUSH_INTERVAL)
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                key: {
+                    'statuses': dict(stats['statuses']),
+                    **{name: {**stats[name], 'buckets': list(stats[name]['buckets'])} for name in HISTOGRAMS},
+                }
+                for key, stats in self.routes.items()
+            }
+
+    def flush(self):
+        store = self.store
+        if store is not None:
+            store.write({'routes': self.snapshot()})
+
+    def collect(self):
+        """
+        Return this process's live metrics merged with every other worker's last snapshot.
+        """
+        merged = self.snapshot()
+        store = self.store
+        if store is not None:
+            for data in store.read_others():
+                for key, stats in data.get('routes', {}).items():
+                    merge_route_stats(merged.setdefault(key, new_route_stats()), stats)
+        return merged
+
+
+registry = MetricsRegistry()
+
+
+def render_prometheus(routes):
+    """
+    Render merged route stats in the Prometheus text exposition format.
+    """
+    lines = [
+        "# HELP http_requests_total Requests handled, by route, method and status.",
+        "# TYPE http_requests_total counter",
+    ]
+    parsed = sorted((key.split('|', 1), stats) for key, stats in routes.items())
+    for (route, method), stats in parsed:
+        for status, count in sorted(stats['statuses'].items()):
+            lines.append(f'http_requests_total{{route="{route}",method="{method}",status="{status}"}} {count}')
+
+    for name, (metric, help_text, bounds) in HISTOGRAMS.items():
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} histogram")
+        for (route, method), stats in parsed:
+            histogram = stats[name]
+            labels = f'route="{route}",method="{method}"'
+            cumulative = 0
+            for bound, count in zip(bounds, histogram['buckets']):
+                cumulative += count
+                lines.append(f'{metric}_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'{metric}_bucket{{{labels},le="+Inf"}} {histogram["count"]}')
+            lines.append(f'{metric}_sum{{{labels}}} {histogram["sum"]:.6f}')
+            lines.append(f'{metric}_count{{{labels}}} {histogram["count"]}')
+    return '\n'.join(lines) + '\n'
+
+
+class HasMetricsToken(BasePermission):
+    """
+    Allows requests sending ``Authorization: Bearer <METRICS_TOKEN>``.
+    """
+
+    def has_permission(self, request, view):
+        token = settings.METRICS_TOKEN
+        # Bytes: compare_digest refuses non-ASCII str, which would turn a stray header into a 500.
+        sent = request.headers.get('Authorization', '').encode()
+        return bool(token) and hmac.compare_digest(sent, f"Bearer {token}".encode())
+
+
+class MetricsAPIView(APIView):
+    """
+    Request metrics for Prometheus scraping. Staff, or scrapers sending the
+    ``METRICS_TOKEN`` bearer token.
+    """
+    permission_classes = [IsAdminUser | HasMetricsToken]
+    swagger_schema = None  # Internal; left out of the API schema
+
+    def get(self, request):
+        return HttpResponse(render_prometheus(registry.collect()), content_type='text/plain; version=0.0.4; charset=utf-8')
@@ -0,0 +1,322 @@
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.urls import Resolver404, resolve
+from utils.db_router import lag_monitor, read_database
+from utils.metrics import registry
+from utils.profiling import build_document, new_profiler, profile_store, profile_trigger, profiling_lock
+
+# Counters of the requests being served in the current context. Context
+# variables follow a request from the event loop into the threads running
+# its ORM calls, which per-thread connection wrappers alone would not.
+active_counters = ContextVar('active_query_counters', default=())
+
+
+def count_queries(execute, sql, params, many, context):
+    counters = active_counters.get()
+    if not counters:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        duration = time.perf_counter() - started
+        for counter in counters:
+            counter.add(sql, many, duration)
+
+
+def install_count_queries(connection, **kwargs):
+    if count_queries not in connection.execute_wrappers:
+        connection.execute_wrappers.append(count_queries)
+
+
+connection_created.connect(install_count_queries, dispatch_uid='utils-count-queries')
+
+
+class QueryCounter:
+    """
+    Counts the SQL statements run, and the time spent in them, between
+    ``start()`` and ``stop()`` in the current context (thread or task).
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.token = None
+
+    def start(self):
+        for connection in connections.all(initialized_only=True):
+            install_count_queries(connection)
+        self.token = active_counters.set((*active_counters.get(), self))
+
+    def add(self, sql, many, duration):
+        self.count += 1
+        self.duration += duration
+
+    def stop(self):
+        active_counters.reset(self.token)
+
+
+class StatementRecorder(QueryCounter):
+    """
+    A `QueryCounter` that also keeps the SQL of up to ``limit`` statements
+    (without their parameters), each with its start offset and duration.
+    """
+
+    def __init__(self, limit):
+        super().__init__()
+        self.limit = limit
+        self.statements = []
+        self.started = time.perf_counter()
+
+    def add(self, sql, many, duration):
+        super().add(sql, many, duration)
+        if len(self.statements) < self.limit:
+            self.statements.append({
+                "sql": sql,
+                "many": many,
+                "startMs": round((time.perf_counter() - duration - self.started) * 1000, 3),
+                "ms": round(duration * 1000, 3),
+            })
+
+
+class QueryCountingMiddleware:
+    """
+    Base for middleware that counts each request's SQL. It runs natively
+    in both sync (WSGI) and async (ASGI) stacks, so it adds no thread switch
+    to async views the way ``MiddlewareMixin`` subclasses do.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.acall(request)
+        if not self.is_enabled():
+            return self.get_response(request)
+        counter, started = QueryCounter(), time.perf_counter()
+        counter.start()
+        try:
+            response = self.get_response(request)
+        finally:
+            counter.stop()
+        return self.process_response(request, response, counter, time.perf_counter() - started)
+
+    async def acall(self, request):
+        if not self.is_enabled():
+            return await self.get_response(request)
+        counter, started = QueryCounter(), time.perf_counter()
+        counter.start()
+        try:
+            response = await self.get_response(request)
+        finally:
+            counter.stop()
+        return self.process_response(request, response, counter, time.perf_counter() - started)
+
+    def is_enabled(self):
+        return True
+
+    def process_response(self, request, response, counter, elapsed):
+        raise NotImplementedError
+
+
+class QueryCountMiddleware(QueryCountingMiddleware):
+    """
+    Adds ``X-Query-Count`` and ``X-DB-Time-Ms`` headers to every response.
+    Meant for benchmarks and local debugging, not for production.
+    """
+
+    def process_response(self, request, response, counter, elapsed):
+        response['X-Query-Count'] = str(counter.count)
+        response['X-DB-Time-Ms'] = f"{counter.duration * 1000:.2f}"
+        return response
+
+
+class MetricsMiddleware(QueryCountingMiddleware):
+    """
+    Records latency, SQL count and time, response size and status per route
+    (the URL pattern name, e.g. ``vendor-list-create``) in `utils.metrics`.
+    """
+
+    def is_enabled(self):
+        return settings.METRICS_ENABLED
+
+    def process_response(self, request, response, counter, elapsed):
+        match = getattr(request, 'resolver_match', None)
+        route = (match.url_name or match.view_name) if match else 'unmatched'
+        size = None if response.streaming else len(response.content)
+        registry.observe(
+            route, request.method, response.status_code,
+            elapsed, counter.count, counter.duration, size,
+        )
+        return response
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Picks the database that serves the reads of each request (see
+    `utils.db_router.ReplicaRouter`).
+
+    ``GET``/``HEAD``/``OPTIONS`` requests, and requests to views that set
+    ``read_only = True``, read from a healthy replica. A successful write
+    sets a cookie that keeps the client's reads on the primary for
+    ``STICKY_SECONDS``, so it reads its own writes while the replicas catch up.
+    """
+    sync_capable = True
+    async_capable = True
+    safe_methods = ('GET', 'HEAD', 'OPTIONS')
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    @property
+    def options(self):
+        return settings.REPLICA_ROUTING
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.acall(request)
+        reads_only = self.reads_only(request)
+        token = read_database.set(lag_monitor.choose() if reads_only and not self.is_sticky(request) else None)
+        try:
+            response = self.get_response(request)
+        finally:
+            read_database.reset(token)
+        return self.process_response(request, response, reads_only)
+
+    async def acall(self, request):
+        alias = None
+        reads_only = self.reads_only(request)
+        if reads_only and not self.is_sticky(request):
+            # Lag checks query every replica; keep them off the event loop.
+            if lag_monitor.is_stale():
+                await sync_to_async(lag_monitor.refresh)()
+            alias = lag_monitor.choose()
+        token = read_database.set(alias)
+        try:
+            response = await self.get_response(request)
+        finally:
+            read_database.reset(token)
+        return self.process_response(request, response, reads_only)
+
+    def reads_only(self, request):
+        if not settings.DATABASE_REPLICAS:
+            return False
+        if request.method in self.safe_methods:
+            return True
+        try:
+            match = resolve(request.path_info, getattr(request, 'urlconf', None))
+        except Resolver404:
+            return False
+        # DRF views expose their class as `cls`, Django's as `view_class`.
+        view_class = getattr(match.func, 'cls', None) or getattr(match.func, 'view_class', None)
+        return getattr(view_class, 'read_only', False)
+
+    def is_sticky(self, request):
+        try:
+            sticky_until = float(request.COOKIES.get(self.options['STICKY_COOKIE'], 0))
+        except ValueError:
+            sticky_until = 0
+        return sticky_until > time.time()
+
+    def process_response(self, request, response, reads_only):
+        if settings.DATABASE_REPLICAS and not reads_only and response.status_code < 400:
+            seconds = self.options['STICKY_SECONDS']
+            response.set_cookie(
+                self.options['STICKY_COOKIE'], f"{time.time() + seconds:.3f}",
+                max_age=seconds, httponly=True, samesite='Lax',
+            )
+        return response
+
+
+class ProfilingMiddleware:
+    """
+    Profiles requests on demand (see ``PROFILING``): those sending
+    ``PROFILING['HEADER']`` with the configured token, and a sampled
+    fraction of the rest. A profiled request records its Python call tree
+    (`utils.profiling`) and every SQL statement with its timing, is saved
+    to `profile_store` and answered with an ``X-Profile-Id`` header. Other
+    requests only pay for the trigger check.
+
+    Only one request per process is profiled at a time. Under ASGI the
+    profiler watches the event loop thread, including whatever else runs on
+    it meanwhile; SQL statements are recorded from any thread.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.acall(request)
+        trigger = self.trigger(request)
+        if trigger is None:
+            return self.get_response(request)
+        try:
+            profiler, recorder = self.start()
+            try:
+                response = self.get_response(request)
+            finally:
+                profiler.stop()
+                recorder.stop()
+            document = build_document(request, response, trigger, profiler, recorder, self.elapsed(recorder))
+            response['X-Profile-Id'] = profile_store.save(document)
+        finally:
+            profiling_lock.release()
+        return response
+
+    async def acall(self, request):
+        trigger = self.trigger(request)
+        if trigger is None:
+            return await self.get_response(request)
+        try:
+            profiler, recorder = self.start()
+            try:
+                response = await self.get_response(request)
+            finally:
+                profiler.stop()
+                recorder.stop()
+            document = build_document(request, response, trigger, profiler, recorder, self.elapsed(recorder))
+            response['X-Profile-Id'] = await sync_to_async(profile_store.save)(document)
+        finally:
+            profiling_lock.release()
+        return response
+
+    def trigger(self, request):
+        """
+        Return the profile trigger of ``request`` once it holds the
+        profiling lock, or ``None`` to serve it unprofiled.
+        """
+        if not settings.PROFILING['ENABLED']:
+            return None
+        trigger = profile_trigger(request)
+        if trigger is None or not profiling_lock.acquire(blocking=False):
+            return None
+        return trigger
+
+    def start(self):
+        recorder, profiler = StatementRecorder(settings.PROFILING['MAX_SQL']), new_profiler()
+        recorder.start()
+        profiler.start()
+        return profiler, recorder
+
+    def elapsed(self, recorder):
+        return time.perf_counter() - recorder.started
@@ -1,5 +1,9 @@
-from rest_framework.pagination import PageNumberPagination
+from asgiref.sync import sync_to_async
+from django.core.paginator import EmptyPage, InvalidPage, Page, PageNotAnInteger, Paginator
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 from rest_framework.response import Response
+from utils.counts import count_queryset, get_count_strategy
 
 class CustomPagination(PageNumberPagination):
     """
@@ -9,6 +13,68 @@ class CustomPagination(PageNumberPagination):
     page_size_query_param = 'page_size'  # Allow client to set page size
     max_page_size = 100  # Max page size allowed
 
+    def counts_exactly(self, request, view=None):
+        """
+        Whether this request runs ``COUNT(*)`` anyway, so list validators
+        can afford their own count (see `utils.conditional`).
+        """
+        return get_count_strategy(view, request) == 'exact'
+
+    def paginate_queryset(self, queryset, request, view=None, count=None):
+        """
+        Paginate with the total from the view's count strategy (see
+        `utils.counts`) instead of always running ``COUNT(*)``, or with
+        ``count`` when the caller already has the exact total.
+        """
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+        total, exact = self.get_total(queryset, request, view, count)
+        paginator = CountedPaginator(queryset, page_size, count=total, exact=exact)
+        self.select_page(paginator, request)
+        return self.load_page(list(self.page.object_list))
+
+    async def apaginate_queryset(self, queryset, request, view=None, count=None):
+        """
+        Async counterpart of `paginate_queryset`: fetches the page with async
+        iteration. Count strategies are sync code, so a total that ``count``
+        does not give is computed in a worker thread.
+        """
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+        if count is None:
+            total, exact = await sync_to_async(self.get_total)(queryset, request, view)
+        else:
+            total, exact = count, True
+        paginator = CountedPaginator(queryset, page_size, count=total, exact=exact)
+        self.select_page(paginator, request)
+        return self.load_page([row async for row in self.page.object_list])
+
+    def get_total(self, queryset, request, view, count=None):
+        if count is not None:
+            return count, True
+        return count_queryset(queryset, get_count_strategy(view, request))
+
+    def select_page(self, paginator, request):
+        self.request = request
+        page_number = self.get_page_number(request, paginator)
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            raise NotFound(self.invalid_page_message.format(page_number=page_number, message=str(exc)))
+        if paginator.num_pages > 1 and self.template is not None:
+            self.display_page_controls = True
+
+    def load_page(self, rows):
+        rows = self.page.load(rows)
+        if not rows and self.page.number > 1:
+            # Only reachable past the end of an estimated total.
+            raise NotFound(self.invalid_page_message.format(
+                page_number=self.page.number, message=self.page.paginator.error_messages['no_results']
+            ))
+        return rows
+
     def get_paginated_response(self, data):
         return Response({
             "message": "Data retrieved successfully",
@@ -17,9 +83,133 @@ class CustomPagination(PageNumberPagination):
             "errors": None,
             "data": {
                 "total": self.page.paginator.count,  # Total items
+                "totalExact": self.page.paginator.exact,  # False when the total is a planner estimate
                 "count": len(data),  # Items on the current page
                 "next": self.get_next_link(),  # Link to next page
                 "previous": self.get_previous_link(),  # Link to previous page
                 "results": data  # The actual data
             }
         })
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Cursor (keyset) pagination that seeks on an indexed column instead of
+    counting and offsetting, so every page costs the same as the first one.
+    """
+    page_size = 10
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = None  # Defaults to the model's primary key
+
+    def get_ordering(self, request, queryset, view):
+        if self.ordering is None:
+            self.ordering = getattr(view, 'keyset_ordering', None) or queryset.model._meta.pk.name
+        return super().get_ordering(request, queryset, view)
+
+    def paginate_queryset(self, queryset, request, view=None, count=None):
+        # ``count`` is accepted for symmetry with `CustomPagination`; keyset
+        # pages never use a total.
+        selected = queryset.query.values_select
+        if selected:
+            # Cursors are built from the ordering columns of the page's rows,
+            # which a values() fieldset may have left out.
+            ordering = [field.lstrip('-') for field in self.get_ordering(request, queryset, view)]
+            missing = [field for field in ordering if field not in selected]
+            if missing:
+                queryset = queryset.values(*selected, *missing)
+        return super().paginate_queryset(queryset, request, view=view)
+
+    def counts_exactly(self, request, view=None):
+        return False
+
+    def get_paginated_response(self, data):
+        return Response({
+            "message": "Data retrieved successfully",
+            "code": 200,
+            "subCode": "0",
+            "errors": None,
+            "data": {
+                "total": None,  # Not computed, keyset pages never run COUNT(*)
+                "totalExact": False,
+                "count": len(data),
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data
+            }
+        })
+
+
+PAGINATION_QUERY_PARAM = 'pagination'
+
+
+def get_paginator(view, request):
+    """
+    Return the paginator for a list request.
+
+    Keyset pagination is used when the client sends ``?pagination=cursor`` or
+    a ``cursor`` token, or when the view sets ``pagination_mode = 'cursor'``;
+    otherwise the view's ``pagination_class`` is used.
+    """
+    mode = request.query_params.get(PAGINATION_QUERY_PARAM) or getattr(view, 'pagination_mode', 'page')
+    if mode == 'cursor' or KeysetPagination.cursor_query_param in request.query_params:
+        return KeysetPagination()
+    return view.pagination_class()
+
+
+class CountedPage(Page):
+    """
+    Page of a `CountedPaginator`. Pages of an inexact total hold one row
+    more than the page size until `load` trims it, which is how they know
+    whether a next page exists.
+    """
+
+    def __init__(self, object_list, number, paginator):
+        super().__init__(object_list, number, paginator)
+        self.more = None
+
+    def load(self, rows):
+        if not self.paginator.exact:
+            self.more = len(rows) > self.paginator.per_page
+            rows = rows[:self.paginator.per_page]
+        self.object_list = rows
+        return rows
+
+    def has_next(self):
+        return super().has_next() if self.more is None else self.more
+
+
+class CountedPaginator(Paginator):
+    """
+    Django paginator for a row count that was computed elsewhere, e.g. by a
+    count strategy; slicing pages stays lazy.
+
+    With ``exact=False`` the count is only an estimate, so page numbers are
+    not checked against it and each page fetches one extra row instead.
+    """
+
+    def __init__(self, object_list, per_page, count, exact=True, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count = count
+        self.exact = exact
+
+    def validate_number(self, number):
+        if self.exact:
+            return super().validate_number(number)
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(self.error_messages["invalid_page"])
+        if number < 1:
+            raise EmptyPage(self.error_messages["min_page"])
+        return number
+
+    def page(self, number):
+        if self.exact:
+            return super().page(number)
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        return self._get_page(self.object_list[bottom:bottom + self.per_page + 1], number, self)
+
+    def _get_page(self, *args, **kwargs):
+        return CountedPage(*args, **kwargs)
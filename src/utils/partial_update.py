@@ -0,0 +1,82 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from django.utils.http import parse_etags, parse_http_date_safe
+from rest_framework.exceptions import ValidationError
+from utils.bulk import build_batch_serializer
+from utils.conditional import detail_validators
+from utils.integrity import unique_violation_errors
+from utils.signals import rows_changed
+
+
+class PreconditionFailed(Exception):
+    """
+    The row was modified after the version the request's ``If-Match`` or
+    ``If-Unmodified-Since`` header names.
+    """
+
+
+def apply_preconditions(request, queryset, pk):
+    """
+    Narrow the ``UPDATE`` of ``pk`` to the version the client last saw, so
+    a concurrent change makes it match no row instead of being overwritten.
+
+    ``If-Unmodified-Since`` becomes a filter on ``updated_at`` and costs no
+    extra query. ``If-Match`` takes an ETag from the detail endpoint (with
+    any query string), which is checked against one read of ``updated_at``.
+    """
+    if_match = request.META.get('HTTP_IF_MATCH')
+    if if_match and if_match.strip() != '*':
+        updated_at = queryset.values_list('updated_at', flat=True).first()
+        if updated_at is None:
+            raise queryset.model.DoesNotExist
+        if detail_validators(queryset.model, pk, updated_at)['etag'] not in parse_etags(if_match):
+            raise PreconditionFailed("The ETag does not match the current version.")
+        return queryset.filter(updated_at=updated_at)
+    if_unmodified_since = parse_http_date_safe(request.META.get('HTTP_IF_UNMODIFIED_SINCE', ''))
+    if if_unmodified_since is not None:
+        # HTTP dates have whole seconds; updated_at has microseconds.
+        cutoff = datetime.fromtimestamp(if_unmodified_since, tz=dt_timezone.utc) + timedelta(seconds=1)
+        return queryset.filter(updated_at__lt=cutoff)
+    return queryset
+
+
+def partial_update(request, serializer_class, pk):
+    """
+    Apply ``request.data`` to object ``pk`` with a single ``UPDATE`` of the
+    supplied columns and ``updated_at``, without reading the row first.
+
+    Only the supplied fields are validated. Uniqueness is left to the
+    database constraint rather than a SELECT per unique field. Returns the
+    representation of the primary key and the columns written (the supplied
+    fields and ``updated_at``), not of the whole object. ``rows_changed``
+    names those columns, so the search index only rewrites the row's entry,
+    on commit, when a searched field was written.
+
+    Raises ``ValidationError``, ``PreconditionFailed`` or ``DoesNotExist``.
+    """
+    model = serializer_class.Meta.model
+    data = build_batch_serializer(serializer_class, partial=True).run_validation(request.data)
+    if not data:
+        raise ValidationError({"detail": ["Expected at least one field to update."]})
+    now = timezone.now()
+    values = {**data, **{
+        field.name: now for field in model._meta.concrete_fields if getattr(field, 'auto_now', False)
+    }}
+    queryset = apply_preconditions(request, model._default_manager.filter(pk=pk), pk)
+    try:
+        with transaction.atomic():
+            updated = queryset.update(**values)
+    except IntegrityError as exc:
+        errors = unique_violation_errors(model, exc)
+        if errors is None:
+            raise
+        raise ValidationError(errors)
+    if not updated:
+        if model._default_manager.filter(pk=pk).exists():
+            raise PreconditionFailed(f"The {model._meta.verbose_name} was modified since the given version.")
+        raise model.DoesNotExist
+    rows_changed.send(sender=model, pks=[pk], fields=list(values))
+    fieldset = [model._meta.pk.name, *values]
+    return serializer_class(model(pk=pk, **values), fieldset=fieldset).data
@@ -0,0 +1,271 @@
+import cProfile
+import gzip
+import hmac
+import json
+import marshal
+import os
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponse
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from utils.response_formatter import custom_response
+
+PROFILE_ID = re.compile(r'^\d{19}-[0-9a-f]{12}$')
+
+# One profiled request at a time per process: profilers hook the whole
+# interpreter (or thread), and concurrent requests would pollute each other.
+profiling_lock = threading.Lock()
+
+
+def profile_trigger(request):
+    """
+    Return why ``request`` should be profiled (``'header'`` or
+    ``'sample'``), or ``None``.
+    """
+    options = settings.PROFILING
+    token = request.headers.get(options['HEADER'])
+    # compare_digest raises TypeError on non-ASCII str; as bytes a bad header simply does not match.
+    if token and options['TOKEN'] and hmac.compare_digest(token.encode(), options['TOKEN'].encode()):
+        return 'header'
+    if options['SAMPLE_RATE'] and random.random() < options['SAMPLE_RATE']:
+        return 'sample'
+    return None
+
+
+class DeterministicProfiler:
+    """
+    cProfile over the request: exact call counts and times per function,
+    with their callers (the call graph ``pstats`` works with).
+    """
+    mode = 'deterministic'
+
+    def __init__(self):
+        self.profile = cProfile.Profile()
+
+    def start(self):
+        self.profile.enable()
+
+    def stop(self):
+        self.profile.disable()
+
+    def result(self):
+        self.profile.create_stats()
+        keys = list(self.profile.stats)
+        index = {key: position for position, key in enumerate(keys)}
+        functions = []
+        for key in keys:
+            cc, nc, tt, ct, callers = self.profile.stats[key]
+            functions.append([
+                *key, cc, nc, round(tt, 6), round(ct, 6),
+                [[index[caller], *timings[:2], *(round(t, 6) for t in timings[2:])] for caller, timings in callers.items()],
+            ])
+        return {"type": self.mode, "functions": functions}
+
+
+class StackSampler:
+    """
+    Statistical profiler: a thread samples the stack of the request's thread
+    every ``interval`` seconds and counts each distinct stack. Costs nothing
+    per call, so it suits heavier requests; short ones may get few samples.
+    """
+    mode = 'statistical'
+
+    def __init__(self, interval):
+        self.interval = interval
+        self.thread_id = threading.get_ident()
+        self.stacks = Counter()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, name='stack-sampler', daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        self.thread.join()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(f"{code.co_filename}:{code.co_name}:{frame.f_lineno}")
+                frame = frame.f_back
+            self.stacks[';'.join(reversed(names))] += 1
+
+    def result(self):
+        return {
+            "type": self.mode,
+            "intervalMs": self.interval * 1000,
+            "samples": sum(self.stacks.values()),
+            "stacks": dict(self.stacks.most_common()),
+        }
+
+
+def new_profiler():
+    options = settings.PROFILING
+    if options['MODE'] == 'statistical':
+        return StackSampler(options['SAMPLE_INTERVAL_MS'] / 1000)
+    return DeterministicProfiler()
+
+
+class ProfileStore:
+    """
+    Profiles saved as gzipped JSON files under ``PROFILING['DIR']``, the
+    oldest removed beyond ``MAX_FILES`` (a ring buffer shared by all worker
+    processes). File names sort by creation time.
+    """
+
+    def __init__(self):
+        self.summaries = {}  # Files never change once written
+
+    @property
+    def directory(self):
+        return Path(settings.PROFILING['DIR'])
+
+    def path(self, profile_id):
+        if not PROFILE_ID.match(profile_id):
+            return None
+        return self.directory / f"{profile_id}.json.gz"
+
+    def files(self):
+        try:
+            return sorted(self.directory.glob('*.json.gz'))
+        except FileNotFoundError:
+            return []
+
+    def save(self, document):
+        profile_id = f"{time.time_ns():019d}-{uuid.uuid4().hex[:12]}"
+        document["summary"]["id"] = profile_id
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.path(profile_id)
+        temporary = path.with_suffix('.tmp')
+        temporary.write_bytes(gzip.compress(json.dumps(document, separators=(',', ':')).encode(), 6))
+        os.replace(temporary, path)
+        for old in self.files()[:-settings.PROFILING['MAX_FILES']]:
+            old.unlink(missing_ok=True)
+        return profile_id
+
+    def load(self, profile_id):
+        path = self.path(profile_id)
+        if path is None or not path.exists():
+            return None
+        return json.loads(gzip.decompress(path.read_bytes()))
+
+    def list(self):
+        files = self.files()
+        names = {path.name for path in files}
+        for name in set(self.summaries) - names:
+            del self.summaries[name]
+        summaries = []
+        for path in reversed(files):
+            summary = self.summaries.get(path.name)
+            if summary is None:
+                try:
+                    document = json.loads(gzip.decompress(path.read_bytes()))
+                except FileNotFoundError:  # Pruned by another worker meanwhile
+                    continue
+                summary = self.summaries[path.name] = {**document["summary"], "bytes": path.stat().st_size}
+            summaries.append(summary)
+        return summaries
+
+
+profile_store = ProfileStore()
+
+
+def build_document(request, response, trigger, profiler, recorder, elapsed):
+    return {
+        "summary": {
+            "createdAt": datetime.now(timezone.utc).isoformat(),
+            "method": request.method,
+            "path": request.path,
+            "query": request.META.get('QUERY_STRING', ''),
+            "status": response.status_code,
+            "trigger": trigger,
+            "mode": profiler.mode,
+            "durationMs": round(elapsed * 1000, 3),
+            "sqlCount": recorder.count,
+            "sqlMs": round(recorder.duration * 1000, 3),
+        },
+        "sql": recorder.statements,
+        "profile": profiler.result(),
+    }
+
+
+def to_pstats(profile):
+    """
+    Re-create the ``pstats`` dump (as written by ``cProfile.Profile.dump_stats``)
+    of a deterministic profile, for snakeviz, ``python -m pstats`` and the like.
+    """
+    functions = profile["functions"]
+    keys = [tuple(function[:3]) for function in functions]
+    stats = {}
+    for key, function in zip(keys, functions):
+        cc, nc, tt, ct, callers = function[3:]
+        stats[key] = (cc, nc, tt, ct, {keys[caller[0]]: tuple(caller[1:]) for caller in callers})
+    return marshal.dumps(stats)
+
+
+class ProfileListAPIView(APIView):
+    """
+    Profiles kept by `ProfilingMiddleware`, newest first. Staff only.
+    """
+    permission_classes = [IsAdminUser]
+    swagger_schema = None  # Internal; left out of the API schema
+
+    def get(self, request):
+        return Response(custom_response(
+            message="Profiles retrieved successfully",
+            code=200,
+            data=profile_store.list(),
+        ), status=status.HTTP_200_OK)
+
+
+class ProfileDownloadAPIView(APIView):
+    """
+    Download one profile: the stored gzipped JSON, or with ``?export=pstats``
+    (deterministic profiles) or ``?export=folded`` (statistical profiles,
+    for flame graph tools) a file those tools read. Staff only.
+    """
+    permission_classes = [IsAdminUser]
+    swagger_schema = None
+
+    def get(self, request, profile_id):
+        path = profile_store.path(profile_id)
+        if path is None or not path.exists():
+            return Response(custom_response(
+                message="Profile not found",
+                code=404,
+                errors={"detail": "Profile does not exist"},
+            ), status=status.HTTP_404_NOT_FOUND)
+        export = request.query_params.get('export')
+        if export is None:
+            return FileResponse(path.open('rb'), as_attachment=True, filename=path.name, content_type='application/gzip')
+        profile = profile_store.load(profile_id)["profile"]
+        if export == 'pstats' and profile["type"] == DeterministicProfiler.mode:
+            content, filename = to_pstats(profile), f"{profile_id}.pstats"
+        elif export == 'folded' and profile["type"] == StackSampler.mode:
+            content = ''.join(f"{stack} {count}\n" for stack, count in profile["stacks"].items()).encode()
+            filename = f"{profile_id}.folded"
+        else:
+            return Response(custom_response(
+                message="Profile download failed",
+                code=400,
+                errors={"export": [f"Not available for a {profile['type']} profile."]},
+            ), status=status.HTTP_400_BAD_REQUEST)
+        response = HttpResponse(content, content_type='application/octet-stream')
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
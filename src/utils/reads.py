@@ -0,0 +1,140 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from utils.cache import api_cache, call_cache
+from utils.conditional import (
+    afetch_detail_validators,
+    aggregate_validators,
+    alist_aggregate,
+    content_validators,
+    detail_validators,
+    fetch_detail_validators,
+    has_conditional_headers,
+    is_not_modified,
+    list_aggregate,
+)
+from utils.fieldsets import get_fieldset, trim
+from utils.pagination import KeysetPagination, get_paginator
+
+
+def prepare_list(view, request):
+    """
+    Return ``(serializer_class, fieldset, queryset, paginator)`` for the
+    list page of ``view``, with the view's filters applied; runs no queries.
+    """
+    serializer_class = view.get_serializer_class()
+    fieldset = get_fieldset(request, serializer_class)
+    queryset = view.filter_queryset(view.get_queryset())
+    return serializer_class, fieldset, queryset, get_paginator(view, request)
+
+
+def page_source(serializer_class, queryset, fieldset):
+    """
+    The queryset a page is sliced from: ``values()`` rows with
+    ``FAST_READ_SERIALIZATION``, else instances restricted to the fieldset.
+    """
+    if settings.FAST_READ_SERIALIZATION:
+        return serializer_class.fast_values(queryset, fieldset)
+    return serializer_class.restrict(queryset, fieldset)
+
+
+def serialize_page(view, serializer_class, rows, fieldset):
+    if settings.FAST_READ_SERIALIZATION:
+        return serializer_class.fast_data(rows, fieldset)
+    return view.get_serializer(rows, many=True, fieldset=fieldset).data
+
+
+def build_list_page(view, request, cache_key):
+    """
+    Query, paginate and serialize the list page of ``view`` for
+    ``request``, cache it under ``cache_key`` and return the cache entry
+    ``{"body", "validators"}``.
+
+    When the list aggregate already shows that the client's copy is
+    current, the page is neither built nor cached and ``body`` is None.
+    Shared by the sync list views; `abuild_list_page` is its async twin.
+    """
+    serializer_class, fieldset, queryset, paginator = prepare_list(view, request)
+    aggregate = list_aggregate(queryset) if paginator.counts_exactly(request, view) else None
+    validators = aggregate and aggregate_validators(request, queryset, aggregate)
+    if validators and is_not_modified(request, validators):
+        return {"body": None, "validators": validators}
+    count = aggregate and aggregate['total']
+    rows = paginator.paginate_queryset(page_source(serializer_class, queryset, fieldset), request, view=view, count=count)
+    body = paginator.get_paginated_response(serialize_page(view, serializer_class, rows, fieldset)).data
+    return api_cache.set(cache_key, {"body": body, "validators": validators or content_validators(body)})
+
+
+async def abuild_list_page(view, request, cache_key):
+    """
+    Async counterpart of `build_list_page` for
+    `utils.async_views.AsyncListView`: the aggregate is read with
+    ``aaggregate`` and the page with async iteration. Totals from a count
+    strategy other than the aggregate, and cursor pages, are DRF/sync code
+    and run in a worker thread.
+    """
+    serializer_class, fieldset, queryset, paginator = prepare_list(view, request)
+    aggregate = await alist_aggregate(queryset) if paginator.counts_exactly(request, view) else None
+    validators = aggregate and aggregate_validators(request, queryset, aggregate)
+    if validators and is_not_modified(request, validators):
+        return {"body": None, "validators": validators}
+    count = aggregate and aggregate['total']
+    source = page_source(serializer_class, queryset, fieldset)
+    if isinstance(paginator, KeysetPagination):
+        rows = await sync_to_async(paginator.paginate_queryset)(source, request, view=view)
+    else:
+        rows = await paginator.apaginate_queryset(source, request, view=view, count=count)
+    body = paginator.get_paginated_response(serialize_page(view, serializer_class, rows, fieldset)).data
+    return await call_cache(api_cache.set, cache_key, {"body": body, "validators": validators or content_validators(body)})
+
+
+def get_list_page(view, request):
+    """
+    Return the cache entry of the list page of ``view`` for ``request``
+    (see `build_list_page`), from the cache when it has it.
+    """
+    model = view.get_serializer_class().Meta.model
+    cache_key = api_cache.list_key(model, request)
+    return api_cache.get(cache_key) or build_list_page(view, request, cache_key)
+
+
+def get_detail(request, serializer_class, pk):
+    """
+    Return ``(data, validators)`` for object ``pk``, restricted to the
+    requested fieldset, from the cache or one query; raises
+    ``model.DoesNotExist``.
+
+    A conditional request is answered from ``updated_at`` alone when the
+    client's copy is current, in which case ``data`` is None. Shared by the
+    sync retrieve views; `aget_detail` is its async twin.
+    """
+    model = serializer_class.Meta.model
+    fieldset = get_fieldset(request, serializer_class)
+    if has_conditional_headers(request):
+        validators = fetch_detail_validators(model, pk)
+        if is_not_modified(request, validators):
+            return None, validators
+    cache_key = api_cache.detail_key(model, pk)
+    data = api_cache.get(cache_key)
+    if data is None:
+        instance = model._default_manager.get(pk=pk)
+        data = api_cache.set(cache_key, dict(serializer_class(instance).data))
+    return trim(data, fieldset), detail_validators(model, pk, data["updated_at"])
+
+
+async def aget_detail(request, serializer_class, pk):
+    """
+    Async counterpart of `get_detail` for
+    `utils.async_views.AsyncRetrieveView`, reading with ``afirst``/``aget``.
+    """
+    model = serializer_class.Meta.model
+    fieldset = get_fieldset(request, serializer_class)
+    if has_conditional_headers(request):
+        validators = await afetch_detail_validators(model, pk)
+        if is_not_modified(request, validators):
+            return None, validators
+    cache_key = await call_cache(api_cache.detail_key, model, pk)
+    data = await call_cache(api_cache.get, cache_key)
+    if data is None:
+        instance = await model._default_manager.aget(pk=pk)
+        data = await call_cache(api_cache.set, cache_key, dict(serializer_class(instance).data))
+    return trim(data, fieldset), detail_validators(model, pk, data["updated_at"])
@@ -0,0 +1,135 @@
+import math
+
+from rest_framework import renderers
+from rest_framework.negotiation import DefaultContentNegotiation
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # Optional: falls back to DRF's stdlib json renderer
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # Optional: MessagePack is not offered without it
+    msgpack = None
+
+LAYOUT_QUERY_PARAM = 'layout'
+
+_fallback_encoder = JSONEncoder()
+
+if orjson is not None:
+    # Datetimes are left to DRF's encoder, which writes UTC as "Z" and keeps milliseconds only.
+    ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+def encode_fallback(obj):
+    """
+    Encode types the fast encoders don't know (Decimal, lazy strings, ...)
+    the way DRF's JSON encoder does.
+    """
+    return _fallback_encoder.default(obj)
+
+
+def has_non_finite_float(data):
+    """
+    Whether ``data`` holds a NaN or infinite float, which orjson writes as
+    ``null`` where DRF's encoder writes ``NaN`` or refuses it.
+    """
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        kind = type(value)
+        if kind is dict:
+            stack.extend(value.values())
+        elif kind is list or kind is tuple:
+            stack.extend(value)
+        elif kind is float and not math.isfinite(value):
+            return True
+    return False
+
+
+def to_columnar(data):
+    """
+    Rewrite ``data.results`` of a list envelope from a list of objects into
+    ``{"fields": [...], "rows": [[...], ...]}`` so field names appear once.
+    """
+    payload = data.get('data') if isinstance(data, dict) else None
+    results = payload.get('results') if isinstance(payload, dict) else None
+    if not isinstance(results, list) or not all(isinstance(row, dict) for row in results):
+        return data
+    fields = list(results[0]) if results else []
+    rows = [[row.get(name) for name in fields] for row in results]
+    return {**data, 'data': {**payload, 'results': {'fields': fields, 'rows': rows}}}
+
+
+class ColumnarLayoutMixin:
+    """
+    Applies `to_columnar` when the request asks for ``?layout=columnar``.
+    """
+
+    def prepare(self, data, renderer_context):
+        request = (renderer_context or {}).get('request')
+        if request is not None and request.query_params.get(LAYOUT_QUERY_PARAM) == 'columnar':
+            return to_columnar(data)
+        return data
+
+
+class FastJSONRenderer(ColumnarLayoutMixin, renderers.JSONRenderer):
+    """
+    JSON renderer backed by orjson when it is installed.
+
+    Produces the same bytes as DRF's compact, unicode JSON renderer:
+    datetimes go through DRF's encoder, and payloads orjson can't write the
+    same way (integers wider than 64 bits, NaN and infinities) use the stdlib
+    path, as do pretty printing (``indent``) and non-default JSON settings.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        data = self.prepare(data, renderer_context)
+        if data is None:
+            return b''
+        use_orjson = (
+            orjson is not None and self.compact and not self.ensure_ascii
+            and self.get_indent(accepted_media_type, renderer_context or {}) is None
+        )
+        if not use_orjson:
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(data, default=encode_fallback, option=ORJSON_OPTIONS)
+        except TypeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        if b'null' in ret and has_non_finite_float(data):
+            return super().render(data, accepted_media_type, renderer_context)
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
+
+
+class MessagePackRenderer(ColumnarLayoutMixin, renderers.BaseRenderer):
+    """
+    Compact binary rendering of the same envelope, selected with
+    ``Accept: application/msgpack`` or ``?format=msgpack``.
+    """
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+    available = msgpack is not None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        data = self.prepare(data, renderer_context)
+        if data is None:
+            return b''
+        return msgpack.packb(data, default=encode_fallback, use_bin_type=True)
+
+
+class AvailableRendererNegotiation(DefaultContentNegotiation):
+    """
+    Content negotiation that skips renderers whose optional dependency is
+    missing (``available = False``).
+    """
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        renderers = [renderer for renderer in renderers if getattr(renderer, 'available', True)]
+        return super().select_renderer(request, renderers, format_suffix)
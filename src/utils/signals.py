@@ -0,0 +1,9 @@
+from django.dispatch import Signal
+
+# Sent after rows were written without the model save()/delete() signals,
+# e.g. by bulk_create, bulk_update, QuerySet.update() or a truncate.
+# Receivers get `sender` (the model), `pks` (the affected primary keys, or
+# None when any row may have changed), `fields` (the columns written, or
+# None when any may have changed) and `deleted` (True when the rows were
+# deleted, e.g. by a bulk delete that skipped the per-row post_delete).
+rows_changed = Signal()
@@ -0,0 +1,265 @@
+import hashlib
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from contextlib import nullcontext
+from contextvars import ContextVar
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.db import DatabaseError, transaction
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from utils.response_formatter import custom_response
+from utils.snapshots import SnapshotStore, flusher
+
+EXPLAINABLE = ('SELECT', 'WITH', 'INSERT', 'UPDATE', 'DELETE')
+REPORT_ORDERS = {
+    'total': lambda entry: entry['totalMs'],
+    'count': lambda entry: entry['count'],
+    'max': lambda entry: entry['maxMs'],
+    'mean': lambda entry: entry['totalMs'] / entry['count'],
+}
+
+# Set while the log runs its own EXPLAIN, which must not be logged in turn.
+explaining = ContextVar('slow_query_explaining', default=False)
+
+NORMALIZE = [
+    (re.compile(r"'(?:[^']|'')*'"), '?'),  # String literals
+    (re.compile(r'\b\d+(?:\.\d+)?\b'), '?'),  # Numbers, e.g. inlined LIMIT/OFFSET
+    (re.compile(r'%s'), '?'),  # Parameters
+    (re.compile(r'\(\s*\?(?:\s*,\s*\?)*\s*\)'), '(...)'),  # IN lists of any length
+    (re.compile(r'\s+'), ' '),
+]
+
+
+def normalize_sql(sql):
+    """
+    Reduce a statement to its shape: literals and parameters become ``?``,
+    ``IN`` lists ``(...)``, and whitespace is collapsed, so the same query
+    with other values (filters, pages) gets the same fingerprint.
+    """
+    for pattern, replacement in NORMALIZE:
+        sql = pattern.sub(replacement, sql)
+    return sql.strip()
+
+
+def fingerprint(normalized_sql):
+    return hashlib.sha1(normalized_sql.encode()).hexdigest()[:16]
+
+
+def explain(connection, sql, params):
+    """
+    Return the plan of ``sql`` as a list of lines, or ``None``: ``EXPLAIN`` on
+    PostgreSQL, ``EXPLAIN QUERY PLAN`` on SQLite. The statement itself is
+    not run.
+    """
+    if connection.vendor == 'postgresql':
+        prefix = 'EXPLAIN'
+    elif connection.vendor == 'sqlite':
+        prefix = 'EXPLAIN QUERY PLAN'
+    else:
+        return None
+    token = explaining.set(True)
+    try:
+        # A failed EXPLAIN must not abort the caller's transaction.
+        with transaction.atomic(using=connection.alias) if connection.in_atomic_block else nullcontext():
+            with connection.cursor() as cursor:
+                cursor.execute(f"{prefix} {sql}", params)
+                rows = cursor.fetchall()
+    except DatabaseError:
+        return None
+    finally:
+        explaining.reset(token)
+    if connection.vendor == 'sqlite':
+        # Rows are (id, parent, notused, detail); indent children under parents.
+        depth = {0: -1}
+        lines = []
+        for node, parent, _, detail in rows:
+            depth[node] = depth.get(parent, -1) + 1
+            lines.append(f"{'  ' * depth[node]}{detail}")
+        return lines
+    return [row[0] for row in rows]
+
+
+def sequential_scans(plan):
+    """
+    Tables the plan reads in full: ``Seq Scan on t`` (PostgreSQL) or
+    ``SCAN t`` without an index (SQLite).
+    """
+    tables = []
+    for line in plan or ():
+        match = re.search(r'Seq Scan on (\w+)', line) or re.search(r'\bSCAN (?:TABLE )?(?!CONSTANT\b)(\w+)(?!.*USING)', line)
+        if match and match.group(1) not in tables:
+            tables.append(match.group(1))
+    return tables
+
+
+def merge_entry(target, source):
+    target['count'] += source['count']
+    target['totalMs'] += source['totalMs']
+    if source['maxMs'] > target['maxMs']:
+        target['maxMs'], target['sample'] = source['maxMs'], source['sample']
+    target['lastSeen'] = max(target['lastSeen'], source['lastSeen'])
+    if source['plan'] is not None and (target['plan'] is None or source['planAt'] > target['planAt']):
+        target['plan'], target['planAt'], target['seqScans'] = source['plan'], source['planAt'], source['seqScans']
+
+
+class SlowQueryLog:
+    """
+    Statements slower than ``SLOW_QUERIES['THRESHOLD_MS']``, aggregated per
+    fingerprint of their normalized SQL: count, total and max time, the
+    slowest sample (SQL without parameters) and the plan, captured the
+    first time and again after ``PLAN_TTL`` seconds.
+
+    Like `utils.metrics.MetricsRegistry`, each process snapshots its state
+    to ``SLOW_QUERIES['DIR']`` (when set) from the `utils.snapshots.flusher`
+    thread, every ``FLUSH_INTERVAL`` seconds, so reports cover every worker.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()  # Least recently seen first
+        self.flusher_pid = None
+
+    @property
+    def options(self):
+        return settings.SLOW_QUERIES
+
+    @property
+    def store(self):
+        directory = self.options['DIR']
+        return SnapshotStore(directory, 'slow-queries', max_age=self.options['SNAPSHOT_MAX_AGE']) if directory else None
+
+    def needs_plan(self, key):
+        entry = self.entries.get(key)
+        return self.options['EXPLAIN'] and (
+            entry is None or entry['plan'] is None or time.time() - entry['planAt'] >= self.options['PLAN_TTL']
+        )
+
+    def observe(self, connection, sql, params, duration):
+        normalized = normalize_sql(sql)
+        key = fingerprint(normalized)
+        plan = None
+        if self.needs_plan(key) and sql.lstrip()[:6].upper().startswith(EXPLAINABLE):
+            plan = explain(connection, sql, params)
+        duration_ms = duration * 1000
+        now = time.time()
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                entry = self.entries[key] = {
+                    'fingerprint': key, 'sql': normalized, 'vendor': connection.vendor,
+                    'count': 0, 'totalMs': 0.0, 'maxMs': 0.0, 'sample': sql, 'lastSeen': now,
+                    'plan': None, 'planAt': None, 'seqScans': [],
+                }
+            merge_entry(entry, {
+                'count': 1, 'totalMs': duration_ms, 'maxMs': duration_ms, 'sample': sql, 'lastSeen': now,
+                'plan': plan, 'planAt': now, 'seqScans': sequential_scans(plan),
+            })
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.options['MAX_FINGERPRINTS']:
+                self.entries.popitem(last=False)
+        if self.flusher_pid != os.getpid() and self.options['DIR']:
+            self.flusher_pid = os.getpid()
+            flusher.register(self.flush, lambda: self.options['FLUSH_INTERVAL'])
+
+    def snapshot(self):
+        with self.lock:
+            return {key: dict(entry) for key, entry in self.entries.items()}
+
+    def flush(self):
+        store = self.store
+        if store is not None:
+            store.write({'entries': self.snapshot()})
+
+    def collect(self):
+        """
+        Return this process's entries merged with every other worker's last snapshot.
+        """
+        merged = self.snapshot()
+        store = self.store
+        if store is not None:
+            for data in store.read_others():
+                for key, entry in data.get('entries', {}).items():
+                    if key in merged:
+                        merge_entry(merged[key], entry)
+                    else:
+                        merged[key] = dict(entry)
+        return merged
+
+    def report(self, top=20, order='total'):
+        """
+        The ``top`` fingerprints by ``order`` (one of `REPORT_ORDERS`).
+        """
+        entries = sorted(self.collect().values(), key=REPORT_ORDERS[order], reverse=True)[:top]
+        return [
+            {
+                **entry,
+                'totalMs': round(entry['totalMs'], 3),
+                'maxMs': round(entry['maxMs'], 3),
+                'meanMs': round(entry['totalMs'] / entry['count'], 3),
+                'lastSeen': datetime.fromtimestamp(entry['lastSeen'], timezone.utc).isoformat(),
+                'planAt': datetime.fromtimestamp(entry['planAt'], timezone.utc).isoformat() if entry['planAt'] else None,
+            }
+            for entry in entries
+        ]
+
+    def reset(self):
+        with self.lock:
+            self.entries.clear()
+
+
+slow_query_log = SlowQueryLog()
+
+
+def log_slow_queries(execute, sql, params, many, context):
+    if explaining.get():
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    result = execute(sql, params, many, context)
+    duration = time.perf_counter() - started
+    if duration * 1000 >= settings.SLOW_QUERIES['THRESHOLD_MS']:
+        slow_query_log.observe(context['connection'], sql, None if many else params, duration)
+    return result
+
+
+def install_slow_query_log(connection, **kwargs):
+    if settings.SLOW_QUERIES['ENABLED'] and log_slow_queries not in connection.execute_wrappers:
+        connection.execute_wrappers.append(log_slow_queries)
+
+
+class SlowQueryReportAPIView(APIView):
+    """
+    Top slow-query fingerprints (``?top=20&order=total|count|max|mean``)
+    across all workers. Staff only.
+    """
+    permission_classes = [IsAdminUser]
+    swagger_schema = None  # Internal; left out of the API schema
+
+    def get(self, request):
+        order = request.query_params.get('order', 'total')
+        try:
+            top = int(request.query_params.get('top', 20))
+        except ValueError:
+            top = 0
+        errors = {}
+        if order not in REPORT_ORDERS:
+            errors["order"] = [f"Expected one of: {', '.join(REPORT_ORDERS)}."]
+        if top < 1:
+            errors["top"] = ["Expected a positive integer."]
+        if errors:
+            return Response(custom_response(
+                message="Slow query report failed",
+                code=400,
+                errors=errors,
+            ), status=status.HTTP_400_BAD_REQUEST)
+        return Response(custom_response(
+            message="Slow queries retrieved successfully",
+            code=200,
+            data=slow_query_log.report(top, order),
+        ), status=status.HTTP_200_OK)
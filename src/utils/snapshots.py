@@ -0,0 +1,116 @@
+import json
+import os
+import secrets
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+_process_tokens = {}
+
+
+def process_token():
+    """
+    Name of this process's snapshot: the pid plus a random suffix, so a
+    later process that reuses the pid does not overwrite it.
+    """
+    pid = os.getpid()
+    if pid not in _process_tokens:
+        _process_tokens.clear()  # Forked: the parent's token is not ours
+        _process_tokens[pid] = f"{pid}-{secrets.token_hex(4)}"
+    return _process_tokens[pid]
+
+
+class SnapshotStore:
+    """
+    Shares per-process state between workers through a directory of JSON
+    files, one per process (``<name>-<pid>-<random>.json``), replaced
+    atomically.
+
+    Readers merge every file. With ``max_age`` set, files not rewritten for
+    that many seconds belong to exited workers and are deleted when read, so
+    writers must rewrite theirs more often than that even when idle.
+    """
+
+    def __init__(self, directory, name, max_age=None):
+        self.directory = Path(directory)
+        self.name = name
+        self.max_age = max_age
+
+    @property
+    def path(self):
+        return self.directory / f"{self.name}-{process_token()}.json"
+
+    def write(self, data):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=f".{self.name}-", suffix='.tmp')
+        with os.fdopen(fd, 'w') as handle:
+            json.dump(data, handle, separators=(',', ':'))
+        os.replace(tmp_path, self.path)
+
+    def read_others(self):
+        """
+        Yield the snapshots written by every process except this one.
+        """
+        if not self.directory.is_dir():
+            return
+        own = self.path.name
+        expired_before = time.time() - self.max_age if self.max_age is not None else None
+        for path in self.directory.glob(f"{self.name}-*.json"):
+            if path.name == own:
+                continue
+            try:
+                if expired_before is not None and path.stat().st_mtime < expired_before:
+                    path.unlink()
+                    continue
+                yield json.loads(path.read_text())
+            except (OSError, ValueError):
+                continue  # Being replaced, truncated or already pruned, skip this round
+
+
+class SnapshotFlusher:
+    """
+    One daemon thread per process that writes snapshots off the request
+    path: each registered ``flush`` is called every ``interval()`` seconds
+    (read on every round, so settings changes apply), even when idle, which
+    keeps the snapshots of live workers from expiring.
+
+    Threads do not survive a fork, so owners register on their first
+    observation in each worker; registering starts the thread there.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.wake = threading.Event()
+        self.jobs = {}  # flush: interval
+        self.pid = None
+
+    def register(self, flush, interval):
+        with self.lock:
+            self.jobs[flush] = interval
+            start = self.pid != os.getpid()
+            self.pid = os.getpid()
+        if start:
+            threading.Thread(target=self.run, name='snapshot-flush', daemon=True).start()
+        self.wake.set()
+
+    def run(self):
+        due = {}
+        while True:
+            self.wake.clear()
+            with self.lock:
+                jobs = list(self.jobs.items())
+            now = time.monotonic()
+            for flush, interval in jobs:
+                if flush not in due:
+                    due[flush] = now + interval()
+                elif due[flush] <= now:
+                    due[flush] = now + interval()
+                    try:
+                        flush()
+                    except OSError:
+                        pass  # Directory missing or full; retried next round
+            self.wake.wait(max(0.0, min(due.values()) - time.monotonic()))
+
+
+flusher = SnapshotFlusher()
@@ -0,0 +1,93 @@
+import re
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import connections
+from django.urls import URLResolver, get_resolver
+from django.utils import translation
+
+IMPORTTIME_LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)')
+
+
+def parse_importtime(output):
+    """
+    Parse the ``python -X importtime`` report into ``(module, self_us,
+    cumulative_us, depth)`` tuples, in the order Python printed them.
+    """
+    modules = []
+    for line in output.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            modules.append((module, int(self_us), int(cumulative_us), len(indent) // 2))
+    return modules
+
+
+def module_group(module):
+    """
+    The app or package an import is charged to: ``src.apps.<app>`` and
+    ``django.contrib.<app>`` per app, any other module by its top-level
+    package.
+    """
+    parts = module.split('.')
+    if parts[0] == 'src' and len(parts) > 2 or parts[:2] == ['django', 'contrib'] and len(parts) > 2:
+        return '.'.join(parts[:3])
+    return parts[0]
+
+
+def group_import_times(modules):
+    """
+    Return ``[(group, self_us, module_count)]``, slowest first.
+    """
+    totals = defaultdict(lambda: [0, 0])
+    for module, self_us, cumulative_us, depth in modules:
+        totals[module_group(module)][0] += self_us
+        totals[module_group(module)][1] += 1
+    return sorted(((group, *total) for group, total in totals.items()), key=lambda row: -row[1])
+
+
+def url_patterns(patterns):
+    """
+    Every pattern of a URLconf, including those of included URLconfs.
+    """
+    for pattern in patterns:
+        yield pattern
+        if isinstance(pattern, URLResolver):
+            yield from url_patterns(pattern.url_patterns)
+
+
+def served_serializers():
+    """
+    Serializer classes of the DRF views in the URLconf.
+    """
+    serializers = []
+    for pattern in url_patterns(get_resolver().url_patterns):
+        view_class = getattr(getattr(pattern, 'callback', None), 'cls', None)
+        serializer_class = getattr(view_class, 'serializer_class', None)
+        if serializer_class is not None and serializer_class not in serializers:
+            serializers.append(serializer_class)
+    return serializers
+
+
+def warm_up():
+    """
+    Do at boot the one-off work a worker otherwise does on its first
+    requests: compile the URL patterns and build the reverse lookup tables,
+    import the SQL compilers, load the translation catalog, and build every
+    served serializer's fields (which fills the models' field caches). It
+    opens no database connection.
+    """
+    resolver = get_resolver()
+    resolver.reverse_dict
+    for pattern in url_patterns(resolver.url_patterns):
+        pattern.pattern.regex
+    for connection in connections.all():
+        connection.ops.compiler('SQLCompiler')
+    if settings.USE_I18N:
+        with translation.override(settings.LANGUAGE_CODE):
+            pass
+    for serializer_class in served_serializers():
+        if hasattr(serializer_class, 'fast_fields'):
+            serializer_class.fast_fields()
+        else:
+            serializer_class().fields
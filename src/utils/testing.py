@@ -0,0 +1,37 @@
+import io
+
+from django.core.management import call_command
+from django.db import connection
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+
+class QueryPlanAssertionsMixin:
+    """
+    Helpers for asserting that a list view's filters and orderings are
+    served by an index rather than a full table scan (SQLite plans).
+    """
+    plan_rows = 100000
+    page_size = 10
+
+    @classmethod
+    def seed(cls, entity):
+        # The search index is not under test here and would triple the seeding time.
+        call_command('generate_data', **{'customers': 0, 'vendors': 0, 'accounts': 0, entity: cls.plan_rows},
+                     batch_size=10000, index=False, stdout=io.StringIO())
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+
+    def list_queryset(self, view_class, params):
+        view = view_class()
+        view.format_kwarg = None
+        view.request = Request(APIRequestFactory().get('/', params))
+        return view.filter_queryset(view.get_queryset())[:self.page_size]
+
+    def assertIndexedPlan(self, view_class, params):
+        queryset = self.list_queryset(view_class, params)
+        table = queryset.model._meta.db_table
+        plan = queryset.explain()
+        for line in plan.splitlines():
+            self.assertFalse(line.rstrip().endswith(f'SCAN {table}'), f"Full scan for {params}:\n{plan}")
+            self.assertNotIn('USE TEMP B-TREE', line, f"Unindexed sort for {params}:\n{plan}")
@@ -0,0 +1,56 @@
+import io
+import os
+import subprocess
+import sys
+import tempfile
+
+from django.conf import settings
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from utils.api_schema import schema_artifact
+
+
+class ApiSchemaTests(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.settings_override = override_settings(API_SCHEMA=dict(settings.API_SCHEMA, DIR=directory.name))
+        self.settings_override.enable()
+        self.addCleanup(self.settings_override.disable)
+        schema_artifact.reset()
+        self.addCleanup(schema_artifact.reset)
+
+    def test_serves_generated_artifact_with_etag(self):
+        call_command('generate_schema', stdout=io.StringIO())
+        response = self.client.get('/swagger.json')
+        self.assertEqual(response.status_code, 200)
+        schema = response.json()
+        self.assertIn('/accounts/{id}/', schema['paths'])
+        # Overrides declared through the shim are applied at generation time
+        self.assertEqual(schema['paths']['/search/']['get']['summary'], "Search")
+        not_modified = self.client.get('/swagger.json', HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(self.client.get('/swagger.yaml')['Content-Type'], 'application/yaml')
+
+    def test_missing_artifact(self):
+        with override_settings(API_SCHEMA=dict(settings.API_SCHEMA, GENERATE_ON_DEMAND=False)):
+            self.assertEqual(self.client.get('/swagger.json').status_code, 404)
+        self.assertEqual(self.client.get('/swagger.json').status_code, 200)
+
+    def test_docs_pages(self):
+        for url in ('/swagger/', '/redoc/'):
+            with self.subTest(url=url):
+                self.assertContains(self.client.get(url), '/swagger.json')
+
+    def test_serving_does_not_import_drf_yasg(self):
+        # Rendering a docs page loads the URLconf, and with it every view module
+        script = (
+            "import sys, django; sys.path.insert(0, 'src'); django.setup();"
+            "from django.test import Client; assert Client(HTTP_HOST='localhost').get('/swagger/').status_code == 200;"
+            "print(sorted(name for name in sys.modules if name.startswith('drf_yasg.')))"
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', script], capture_output=True, text=True, check=True,
+            env=dict(os.environ, DJANGO_SETTINGS_MODULE='src.config.settings.testing'),
+        )
+        self.assertEqual(result.stdout.strip(), '[]')
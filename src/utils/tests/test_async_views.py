@@ -0,0 +1,195 @@
+import asyncio
+import json
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db.models import QuerySet
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.throttling import UserRateThrottle
+from src.apps.accounts.models import Account
+from src.apps.accounts.serializers import AccountSerializer
+from src.apps.accounts.views import (
+    AccountAsyncListView,
+    AccountAsyncRetrieveView,
+    AccountListCreateAPIView,
+    AccountRetrieveUpdateDeleteAPIView,
+)
+from utils.async_views import AsyncListView, AsyncRetrieveView, SingleFlight
+from utils.cache import api_cache
+
+
+class OncePerMinuteThrottle(UserRateThrottle):
+    rate = '1/min'
+
+
+class PrivateAccountListView(AccountListCreateAPIView):
+    permission_classes = [IsAuthenticated]
+    throttle_classes = [OncePerMinuteThrottle]
+
+
+class PrivateAccountRetrieveView(AccountRetrieveUpdateDeleteAPIView):
+    permission_classes = [IsAuthenticated]
+
+
+class PrivateAccountAsyncListView(AsyncListView):
+    sync_view_class = PrivateAccountListView
+
+
+class PrivateAccountAsyncRetrieveView(AsyncRetrieveView):
+    sync_view_class = PrivateAccountRetrieveView
+    serializer_class = AccountSerializer
+    entity_name = "Account"
+
+
+LIST_PATHS = (
+    '/api/accounts/',
+    '/api/accounts/?page=2&page_size=5&ordering=-code',
+    '/api/accounts/?code_prefix=2',
+    '/api/accounts/?pagination=cursor&page_size=4',
+    '/api/accounts/?page=9',
+    '/api/accounts/?created_at_after=never',
+    '/api/accounts/?format=msgpack',
+    '/api/accounts/?count=cached&page=2',
+    '/api/accounts/?count=estimated&page_size=4',
+    '/api/accounts/?count=bogus',
+    '/api/accounts/?fields=id,name,code&pagination=cursor&page_size=4',
+    '/api/accounts/?exclude=description',
+)
+
+
+class AsyncReadViewTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(15):
+            Account.objects.create(name=f"Account {i}", code=f"{i % 3 + 1}{i:04d}", account_type="asset")
+
+    def setUp(self):
+        cache.clear()  # Throttle history
+
+    def request(self, path, user=None):
+        request = RequestFactory().get(path)
+        if user is not None:
+            request.user = user
+        return request
+
+    def responses(self, view_class, path, user=None, **kwargs):
+        api_cache.local.clear()
+        sync_response = view_class.sync_view_class.as_view()(self.request(path, user), **kwargs).render()
+        api_cache.local.clear()
+        cache.clear()
+        async_response = async_to_sync(view_class.as_view())(self.request(path, user), **kwargs)
+        return sync_response, async_response
+
+    def assertSameResponse(self, view_class, path, user=None, **kwargs):
+        sync_response, async_response = self.responses(view_class, path, user, **kwargs)
+        self.assertEqual(async_response.status_code, sync_response.status_code)
+        self.assertEqual(async_response.content, sync_response.content)
+        for header in ('Content-Type', 'ETag', 'Last-Modified', 'Allow', 'Vary', 'WWW-Authenticate', 'Retry-After'):
+            self.assertEqual(async_response.get(header), sync_response.get(header), header)
+        return async_response
+
+    def test_list_matches_sync_view(self):
+        for fast in (False, True):
+            for path in LIST_PATHS:
+                with self.subTest(path=path, fast=fast), override_settings(FAST_READ_SERIALIZATION=fast):
+                    self.assertSameResponse(AccountAsyncListView, path)
+
+    def test_retrieve_matches_sync_view(self):
+        pk = Account.objects.first().pk
+        self.assertSameResponse(AccountAsyncRetrieveView, f'/api/accounts/{pk}/', pk=pk)
+        self.assertSameResponse(AccountAsyncRetrieveView, '/api/accounts/999/', pk=999)
+        self.assertSameResponse(AccountAsyncRetrieveView, f'/api/accounts/{pk}/?fields=code', pk=pk)
+
+    def test_reads_use_the_async_orm(self):
+        pk = Account.objects.first().pk
+        spies = {
+            name: mock.patch.object(QuerySet, name, autospec=True, side_effect=getattr(QuerySet, name))
+            for name in ('aaggregate', '__aiter__', 'afirst', 'aget')
+        }
+        with spies['aaggregate'] as aaggregate, spies['__aiter__'] as aiter:
+            api_cache.local.clear()
+            response = async_to_sync(AccountAsyncListView.as_view())(self.request('/api/accounts/'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((aaggregate.call_count, aiter.call_count), (1, 1))
+        with spies['afirst'] as afirst, spies['aget'] as aget:
+            api_cache.local.clear()
+            request = self.request(f'/api/accounts/{pk}/')
+            request.META['HTTP_IF_NONE_MATCH'] = '"stale"'
+            response = async_to_sync(AccountAsyncRetrieveView.as_view())(request, pk=pk)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((afirst.call_count, aget.call_count), (1, 1))
+
+    def test_writes_are_delegated(self):
+        request = RequestFactory().post(
+            '/api/accounts/', {"name": "Cash", "code": "9999", "account_type": "asset"}, content_type='application/json'
+        )
+        response = async_to_sync(AccountAsyncListView.as_view())(request).render()
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(Account.objects.filter(code="9999").exists())
+
+    def test_permissions_are_checked(self):
+        pk = Account.objects.first().pk
+        user = User.objects.create_user('reader')
+        for view_class, path, kwargs in (
+            (PrivateAccountAsyncListView, '/api/accounts/', {}),
+            (PrivateAccountAsyncRetrieveView, f'/api/accounts/{pk}/', {'pk': pk}),
+        ):
+            with self.subTest(view=view_class.__name__):
+                response = self.assertSameResponse(view_class, path, **kwargs)
+                self.assertEqual(response.status_code, 403)
+                self.assertEqual(json.loads(response.content)['code'], 403)
+                self.assertEqual(self.assertSameResponse(view_class, path, user, **kwargs).status_code, 200)
+
+    def test_throttles_are_checked(self):
+        view = async_to_sync(PrivateAccountAsyncListView.as_view())
+        user = User.objects.create_user('reader')
+        self.assertEqual(view(self.request('/api/accounts/', user)).status_code, 200)
+        response = view(self.request('/api/accounts/', user))
+        self.assertEqual(response.status_code, 429)
+        self.assertTrue(response['Retry-After'])
+
+
+class SingleFlightTests(SimpleTestCase):
+
+    def test_waiters_share_the_result(self):
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0)
+            return 'page'
+
+        async def main():
+            flight = SingleFlight()
+            return await asyncio.gather(*(flight.run('key', compute) for _ in range(3)))
+
+        self.assertEqual(asyncio.run(main()), ['page'] * 3)
+        self.assertEqual(len(calls), 1)
+
+    def test_waiters_recompute_when_the_leader_is_cancelled(self):
+        async def main():
+            flight = SingleFlight()
+            started = asyncio.Event()
+
+            async def hang():
+                started.set()
+                await asyncio.Event().wait()
+
+            async def compute():
+                return 'page'
+
+            leader = asyncio.create_task(flight.run('key', hang))
+            await started.wait()
+            waiter = asyncio.create_task(flight.run('key', compute))
+            await asyncio.sleep(0)
+            leader.cancel()
+            result = await asyncio.wait_for(waiter, timeout=1)
+            self.assertTrue(leader.cancelled())
+            self.assertEqual(flight.pending, {})
+            return result
+
+        self.assertEqual(asyncio.run(main()), 'page')
@@ -0,0 +1,69 @@
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+from src.apps.vendors.models import Vendor
+from utils.cache import api_cache
+from utils.tests.test_cache import SHARED_CACHE
+
+
+class BatchRetrieveTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.vendors = [
+            Vendor.objects.create(name=f"Vendor {i}", email=f"vendor{i}@example.com", contact_person="Ama")
+            for i in range(3)
+        ]
+
+    def setUp(self):
+        api_cache.local.clear()
+
+    def test_get_by_ids(self):
+        first, second, third = (vendor.pk for vendor in self.vendors)
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/vendors/batch/', {'ids': f'{third},999,{first},{third}'})
+        data = response.json()['data']
+        self.assertEqual([vendor['vendor_id'] for vendor in data['results']], [third, first])
+        self.assertEqual(data['missing'], [999])
+        # Cached objects are not read again.
+        with self.assertNumQueries(1):
+            response = self.client.post('/api/vendors/batch/?fields=name', {'ids': [first, second]}, 'application/json')
+        self.assertEqual(response.json()['data']['results'], [{"name": "Vendor 0"}, {"name": "Vendor 1"}])
+
+    @override_settings(CACHES=SHARED_CACHE, API_CACHE=dict(settings.API_CACHE, ENABLED=None, SHARED_ALIAS='api'))
+    def test_one_shared_cache_round_trip(self):
+        ids = [vendor.pk for vendor in self.vendors]
+        self.client.get('/api/vendors/batch/', {'ids': ','.join(map(str, ids))})
+        api_cache.local.clear()  # As seen from another worker
+        shared = caches['api']
+        with mock.patch.object(shared, 'get', wraps=shared.get) as get, \
+                mock.patch.object(shared, 'get_many', wraps=shared.get_many) as get_many, \
+                self.assertNumQueries(0):
+            response = self.client.post('/api/vendors/batch/', {'ids': ids}, 'application/json')
+        self.assertEqual([vendor['vendor_id'] for vendor in response.json()['data']['results']], ids)
+        # The generation is read once, the objects with a single get_many
+        # (LocMemCache.get_many calls get(key, default) for each key itself).
+        direct = [call for call in get.call_args_list if len(call.args) == 1]
+        self.assertEqual(direct, [mock.call(api_cache.generation_key(Vendor))])
+        self.assertEqual(get_many.call_count, 1)
+
+    def test_ids_must_be_integers(self):
+        response = self.client.post('/api/vendors/batch/', {'ids': [1, 1.9, True, "2", " 3 ", "1e3"]}, 'application/json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['errors'], {"ids": [
+            "1.9 is not an integer id.",
+            "True is not an integer id.",
+            "'1e3' is not an integer id.",
+        ]})
+
+    @override_settings(BATCH_RETRIEVE_MAX_IDS=2)
+    def test_invalid_ids(self):
+        for ids in ('1,2,3', 'one', ''):
+            with self.subTest(ids=ids):
+                response = self.client.get('/api/vendors/batch/', {'ids': ids})
+                self.assertEqual(response.status_code, 400)
+                self.assertIn('ids', response.json()['errors'])
+        response = self.client.post('/api/vendors/batch/', {'ids': 1}, 'application/json')
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,73 @@
+import io
+import json
+import os
+import tempfile
+from argparse import Namespace
+from contextlib import redirect_stdout
+
+from django.test import TestCase, modify_settings
+from benchmarks import compare
+from benchmarks.http_bench import build_plan, percentile
+from src.apps.vendors.models import Vendor
+from utils.cache import api_cache
+
+
+class BenchmarkHarnessTests(TestCase):
+
+    def setUp(self):
+        api_cache.local.clear()
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 0.5), 51)
+        self.assertEqual(percentile(values, 0.99), 99)
+        self.assertEqual(percentile(values, 1), 100)
+        self.assertEqual(percentile([7], 0.95), 7)
+        self.assertIsNone(percentile([], 0.5))
+
+    def test_plan_is_reproducible(self):
+        args = Namespace(seed=3, requests=4, reads_only=True)
+        rows = {'customers': 10, 'vendors': 250, 'accounts': 10}
+        plan = dict(build_plan(args, rows, {}))
+        self.assertEqual(plan, dict(build_plan(args, rows, {})))
+        self.assertEqual(plan['vendors.list_deep_page'][0], ('GET', '/api/vendors/?page=3&page_size=100', None))
+        self.assertNotIn('vendors.create', plan)
+
+    def test_plan_feeds_writes_with_created_rows(self):
+        args = Namespace(seed=3, requests=2, reads_only=False)
+        plan = dict(build_plan(args, {'customers': 1, 'vendors': 1, 'accounts': 1}, {'vendors': [8, 9]}))
+        self.assertEqual(len(plan['vendors.create']), 2)
+        self.assertEqual([path for _, path, _ in plan['vendors.delete']], ['/api/vendors/8/', '/api/vendors/9/'])
+        self.assertEqual(plan['customers.update'], [])
+
+    def test_compare(self):
+        def report(rps, p50):
+            return {
+                'meta': {'commit': 'abc', 'timestamp': 'now'},
+                'scenarios': [{
+                    'name': 'vendors.retrieve', 'throughput_rps': rps,
+                    'latency_ms': {'p50': p50, 'p95': p50, 'p99': p50}, 'queries_per_request': {'mean': 2},
+                }],
+            }
+
+        self.assertEqual(compare.change(200, 250), 25)
+        self.assertIsNone(compare.change(0, 5))
+        with tempfile.TemporaryDirectory() as directory:
+            paths = []
+            for name, data in (('before', report(100, 10)), ('after', report(150, 5))):
+                paths.append(os.path.join(directory, f'{name}.json'))
+                with open(paths[-1], 'w') as handle:
+                    json.dump(data, handle)
+            output = io.StringIO()
+            with redirect_stdout(output):
+                compare.main(paths)
+        line = output.getvalue().splitlines()[-1]
+        self.assertIn('( +50.0%+)', line)
+        self.assertIn('( -50.0%+)', line)
+
+    @modify_settings(MIDDLEWARE={'prepend': 'utils.middleware.QueryCountMiddleware'})
+    def test_query_count_header(self):
+        vendor = Vendor.objects.create(name="Vendor", email="vendor@example.com")
+        response = self.client.get(f'/api/vendors/{vendor.pk}/')
+        self.assertGreaterEqual(int(response['X-Query-Count']), 1)
+        self.assertGreaterEqual(float(response['X-DB-Time-Ms']), 0)
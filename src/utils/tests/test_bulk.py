@@ -0,0 +1,121 @@
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from src.apps.sync.models import Tombstone
+from src.apps.vendors.models import Vendor
+from utils import bulk
+from utils.cache import api_cache
+
+
+class BulkWriteTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.taken = Vendor.objects.create(name="Taken", email="taken@example.com")
+        cls.other = Vendor.objects.create(name="Other", email="other@example.com")
+
+    def setUp(self):
+        api_cache.local.clear()
+
+    def send(self, method, items):
+        return getattr(self.client, method)('/api/vendors/bulk/', items, content_type='application/json')
+
+    def outcome(self, response):
+        data = response.json()['data']
+        return data['succeeded'], data['failed'], {r['index']: r for r in data['results']}
+
+    def test_create_reports_failures_per_index(self):
+        response = self.send('post', [
+            {"name": "New", "email": "new@example.com"},
+            {"name": "Bad", "email": "not-an-email"},
+            {"name": "Again", "email": "new@example.com"},
+            {"name": "Clash", "email": "taken@example.com"},
+            "not an object",
+        ])
+        self.assertEqual(response.status_code, 207)
+        succeeded, failed, results = self.outcome(response)
+        self.assertEqual((succeeded, failed), (1, 4))
+        self.assertEqual(results[0]['status'], "created")
+        self.assertEqual(results[0]['data']['email'], "new@example.com")
+        self.assertIn('email', results[1]['errors'])
+        self.assertIn('email', results[2]['errors'])
+        self.assertIn('email', results[3]['errors'])
+        self.assertIn('non_field_errors', results[4]['errors'])
+        self.assertEqual(Vendor.objects.filter(email="new@example.com").count(), 1)
+
+    def test_create_all_invalid(self):
+        response = self.send('post', [{"name": "Clash", "email": "taken@example.com"}])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.outcome(response)[:2], (0, 1))
+
+    def test_create_rejects_non_list(self):
+        response = self.send('post', {"name": "New", "email": "new@example.com"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('detail', response.json()['errors'])
+
+    def test_concurrent_conflict_is_reported_per_row(self):
+        real = bulk.find_unique_conflicts
+        calls = []
+
+        def find_unique_conflicts(model, rows):
+            calls.append(rows)
+            if len(calls) == 1:
+                # A concurrent request takes the email after the pre-check.
+                Vendor.objects.create(name="Racer", email="race@example.com")
+                return {}
+            return real(model, rows)
+
+        with mock.patch('utils.bulk.find_unique_conflicts', find_unique_conflicts):
+            response = self.send('post', [
+                {"name": "Fine", "email": "fine@example.com"},
+                {"name": "Late", "email": "race@example.com"},
+            ])
+        self.assertEqual(response.status_code, 207, response.content)
+        succeeded, failed, results = self.outcome(response)
+        self.assertEqual((succeeded, failed), (1, 1))
+        self.assertEqual(results[0]['status'], "created")
+        self.assertIn('email', results[1]['errors'])
+        self.assertTrue(Vendor.objects.filter(email="fine@example.com").exists())
+
+    def test_update_reports_failures_per_index(self):
+        response = self.send('patch', [
+            {"vendor_id": self.other.pk, "name": "Renamed"},
+            {"vendor_id": 999999, "name": "Missing"},
+            {"vendor_id": self.other.pk, "email": "not-an-email"},
+            {"vendor_id": self.other.pk, "email": "taken@example.com"},
+            {"name": "No id"},
+        ])
+        self.assertEqual(response.status_code, 207)
+        succeeded, failed, results = self.outcome(response)
+        self.assertEqual((succeeded, failed), (1, 4))
+        self.assertEqual(results[0]['data']['name'], "Renamed")
+        self.assertEqual(results[1]['errors'], {"detail": "Vendor does not exist"})
+        self.assertIn('email', results[2]['errors'])
+        self.assertIn('email', results[3]['errors'])
+        self.assertIn('vendor_id', results[4]['errors'])
+        self.other.refresh_from_db()
+        self.assertEqual((self.other.name, self.other.email), ("Renamed", "other@example.com"))
+
+    def test_delete_rejects_missing_and_null_ids(self):
+        response = self.send('delete', [self.other.pk, 999999, None, "", "abc"])
+        self.assertEqual(response.status_code, 207)
+        succeeded, failed, results = self.outcome(response)
+        self.assertEqual((succeeded, failed), (1, 4))
+        self.assertEqual(results[0], {"index": 0, "status": "deleted", "id": self.other.pk})
+        self.assertEqual(results[1]['errors'], {"detail": "Vendor does not exist"})
+        for index in (2, 3, 4):
+            self.assertEqual(results[index]['errors'], {"detail": "Expected an id."})
+        self.assertFalse(Vendor.objects.filter(pk=self.other.pk).exists())
+
+    def test_delete_is_one_statement_and_records_tombstones(self):
+        pks = [Vendor.objects.create(name=f"Gone {i}", email=f"gone{i}@example.com").pk for i in range(5)]
+        with CaptureQueriesContext(connection) as queries:
+            response = self.send('delete', pks)
+        self.assertEqual(response.status_code, 200)
+        deletes = [q['sql'] for q in queries if q['sql'].startswith('DELETE FROM "vendors_vendor"')]
+        self.assertEqual(len(deletes), 1, deletes)
+        self.assertEqual(
+            sorted(Tombstone.objects.filter(entity="vendors").values_list('object_id', flat=True)), sorted(pks),
+        )
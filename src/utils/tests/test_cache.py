@@ -0,0 +1,72 @@
+from django.conf import settings
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from src.apps.vendors.models import Vendor
+from utils.cache import api_cache
+from utils.signals import rows_changed
+
+SHARED_CACHE = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+    'api': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'api-cache-tests'},
+}
+
+
+class APICacheTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.vendor = Vendor.objects.create(name="Vendor", email="vendor@example.com")
+
+    def setUp(self):
+        api_cache.local.clear()
+
+    def get(self, path, **params):
+        """
+        GET ``path`` and return the response data and the row SELECTs it ran.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(path, params)
+        self.assertEqual(response.status_code, 200)
+        rows = 'SELECT "vendors_vendor"."vendor_id", "vendors_vendor"."name"'
+        return response.json()['data'], sum(1 for query in queries if query['sql'].startswith(rows))
+
+    def test_detail_is_invalidated_by_a_write(self):
+        path = f'/api/vendors/{self.vendor.pk}/'
+        self.assertEqual(self.get(path)[1], 1)
+        data, reads = self.get(path)
+        self.assertEqual((data['name'], reads), ("Vendor", 0))
+        self.client.patch(path, {"name": "Renamed"}, content_type='application/json')
+        data, reads = self.get(path)
+        self.assertEqual((data['name'], reads), ("Renamed", 1))
+
+    def test_list_is_invalidated_by_bulk_writes(self):
+        self.assertEqual(self.get('/api/vendors/')[1], 1)
+        self.assertEqual(self.get('/api/vendors/')[1], 0)
+        Vendor.objects.filter(pk=self.vendor.pk).update(name="Updated")
+        rows_changed.send(sender=Vendor, pks=[self.vendor.pk])
+        data, reads = self.get('/api/vendors/')
+        self.assertEqual((data['results'][0]['name'], reads), ("Updated", 1))
+
+    def test_query_strings_are_cached_apart(self):
+        self.get('/api/vendors/')
+        self.assertEqual(self.get('/api/vendors/', page_size=1)[1], 1)
+
+    @override_settings(API_CACHE=dict(settings.API_CACHE, ENABLED=None))
+    def test_off_without_a_shared_cache(self):
+        self.assertFalse(api_cache.enabled)
+        path = f'/api/vendors/{self.vendor.pk}/'
+        self.get(path)
+        self.assertEqual(self.get(path)[1], 1)
+
+    @override_settings(CACHES=SHARED_CACHE, API_CACHE=dict(settings.API_CACHE, ENABLED=None, SHARED_ALIAS='api'))
+    def test_shared_generations(self):
+        self.assertTrue(api_cache.enabled)
+        path = f'/api/vendors/{self.vendor.pk}/'
+        self.get(path)
+        api_cache.local.clear()  # As seen from another worker
+        self.assertEqual(self.get(path)[1], 0)
+        before = api_cache.generation(Vendor)
+        self.vendor.save()
+        self.assertEqual(api_cache.generation(Vendor), before + 1)
+        self.assertEqual(self.get(path)[1], 1)
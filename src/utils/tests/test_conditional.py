@@ -0,0 +1,60 @@
+from django.test import TestCase
+from src.apps.vendors.models import Vendor
+from utils.cache import api_cache
+
+
+class ConditionalRequestTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.vendors = [Vendor.objects.create(name=f"Vendor {i}", email=f"vendor{i}@example.com") for i in range(3)]
+
+    def setUp(self):
+        api_cache.local.clear()
+
+    def test_list_revalidates(self):
+        response = self.client.get('/api/vendors/')
+        self.assertEqual(self.client.get('/api/vendors/', HTTP_IF_NONE_MATCH=response['ETag']).status_code, 304)
+        api_cache.local.clear()
+        with self.assertNumQueries(1):  # The aggregate alone
+            self.assertEqual(self.client.get('/api/vendors/', HTTP_IF_NONE_MATCH=response['ETag']).status_code, 304)
+        self.vendors[0].delete()
+        self.assertEqual(self.client.get('/api/vendors/', HTTP_IF_NONE_MATCH=response['ETag']).status_code, 200)
+
+    def test_list_ignores_if_modified_since(self):
+        response = self.client.get('/api/vendors/')
+        self.assertNotIn('Last-Modified', response)
+        self.vendors[0].delete()
+        # Deleting a row does not move the latest updated_at; only the ETag notices.
+        response = self.client.get('/api/vendors/', HTTP_IF_MODIFIED_SINCE='Fri, 01 Jan 2100 00:00:00 GMT')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['data']['total'], 2)
+
+    def test_list_counts_once(self):
+        with self.assertNumQueries(2):  # The aggregate, whose count is the total, and the page
+            data = self.client.get('/api/vendors/', {'page_size': 2}).json()['data']
+        self.assertEqual((data['total'], data['count']), (3, 2))
+
+    def test_list_etag_follows_the_page_not_the_url(self):
+        first = self.client.get('/api/vendors/', {'page_size': 2, 'ordering': 'name'})['ETag']
+        self.assertEqual(first, self.client.get('/api/vendors/?ordering=name&page_size=2')['ETag'])
+        second = self.client.get('/api/vendors/', {'page_size': 2, 'ordering': 'name', 'page': 2})['ETag']
+        self.assertNotEqual(first, second)
+
+    def test_detail_revalidates(self):
+        path = f'/api/vendors/{self.vendors[0].pk}/'
+        response = self.client.get(path)
+        self.assertEqual(self.client.get(path, HTTP_IF_NONE_MATCH=response['ETag']).status_code, 304)
+        self.assertEqual(self.client.get(path, HTTP_IF_MODIFIED_SINCE=response['Last-Modified']).status_code, 304)
+        self.assertNotEqual(response['ETag'], self.client.get(f'/api/vendors/{self.vendors[1].pk}/')['ETag'])
+
+    def test_if_match_takes_an_etag_from_any_representation(self):
+        path = f'/api/vendors/{self.vendors[0].pk}/'
+        etag = self.client.get(path, {'fields': 'name'})['ETag']
+        self.assertEqual(etag, self.client.get(path)['ETag'])
+
+        def patch(data):
+            return self.client.patch(path, data, content_type='application/json', HTTP_IF_MATCH=etag)
+
+        self.assertEqual(patch({"name": "Renamed"}).status_code, 200)
+        self.assertEqual(patch({"name": "Again"}).status_code, 412)
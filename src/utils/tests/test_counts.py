@@ -0,0 +1,77 @@
+import io
+
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from src.apps.vendors.models import Vendor
+from utils.cache import api_cache
+
+
+class ListCountTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        call_command('generate_data', customers=0, vendors=35, accounts=0, stdout=io.StringIO())
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+
+    def setUp(self):
+        api_cache.local.clear()
+
+    def list(self, **params):
+        response = self.client.get('/api/vendors/', params)
+        return response, response.json()['data']
+
+    def total(self, **params):
+        _, data = self.list(**params)
+        return data['total'], data['totalExact']
+
+    def test_strategies(self):
+        self.assertEqual(self.total(), (35, True))
+        self.assertEqual(self.total(count='exact'), (35, True))
+        self.assertEqual(self.total(count='cached'), (35, True))
+        # Below LIST_COUNT['EXACT_BELOW'] an estimate is replaced by an exact count.
+        self.assertEqual(self.total(count='estimated'), (35, True))
+
+    @override_settings(LIST_COUNT=dict(settings.LIST_COUNT, STRATEGY='estimated'))
+    def test_default_strategy_from_settings(self):
+        self.assertEqual(self.total(), (35, True))
+
+    def test_cached_count_is_invalidated_by_writes(self):
+        self.list(count='cached')
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.total(count='cached', page=2), (35, True))
+        self.assertFalse(any('COUNT(' in query['sql'] for query in queries))
+        Vendor.objects.first().delete()
+        self.assertEqual(self.total(count='cached'), (34, True))
+        Vendor.objects.create(name="New vendor", email="new-vendor@example.com")
+        self.assertEqual(self.total(count='cached', page=2), (35, True))
+
+    @override_settings(LIST_COUNT=dict(settings.LIST_COUNT, EXACT_BELOW=10))
+    def test_estimated_count(self):
+        with CaptureQueriesContext(connection) as queries:
+            response, data = self.list(count='estimated', page=4)
+        self.assertEqual((data['total'], data['totalExact'], data['count'], data['next']), (35, False, 5, None))
+        self.assertFalse(any('COUNT(' in query['sql'] for query in queries))
+        self.assertNotIn('Last-Modified', response)
+        self.assertEqual(
+            self.client.get('/api/vendors/', {'count': 'estimated', 'page': 4}, HTTP_IF_NONE_MATCH=response['ETag'])
+            .status_code, 304,
+        )
+        self.assertEqual(self.client.get('/api/vendors/', {'count': 'estimated', 'page': 5}).status_code, 404)
+        # SQLite has no estimate for a filtered query, which is counted exactly.
+        _, data = self.list(count='estimated', name_prefix='A')
+        self.assertTrue(data['totalExact'])
+
+    def test_invalid_strategy_uses_the_envelope(self):
+        response = self.client.get('/api/vendors/', {'count': 'bogus'})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {
+            "message": "Bad Request",
+            "code": 400,
+            "data": None,
+            "subCode": "0",
+            "errors": {"count": ["Expected one of: exact, cached, estimated."]},
+        })
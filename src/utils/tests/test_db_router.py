@@ -0,0 +1,79 @@
+import time
+
+from django.conf import settings
+from django.db import router
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from src.apps.customers.models import Customer
+from src.apps.search.models import SearchDocument
+from utils.cache import api_cache
+from utils.db_router import lag_monitor, read_database
+from utils.middleware import ReplicaRoutingMiddleware
+
+
+@override_settings(DATABASE_REPLICAS=['replica'])
+class ReplicaRoutingTests(TestCase):
+    databases = {'default', 'replica'}
+
+    def setUp(self):
+        lag_monitor.reset()
+
+    def route(self, method='get', cookies=None, path='/api/customers/'):
+        """
+        Run a request through the middleware and return the databases its
+        reads were routed to, and the response.
+        """
+        request = getattr(RequestFactory(), method)(path)
+        request.COOKIES.update(cookies or {})
+        routed = {}
+
+        def view(request):
+            routed['customers'] = router.db_for_read(Customer)
+            routed['search'] = router.db_for_read(SearchDocument)
+            routed['writes'] = router.db_for_write(Customer)
+            return HttpResponse(status=201 if method == 'post' else 200)
+
+        return routed, ReplicaRoutingMiddleware(view)(request)
+
+    def test_reads_go_to_a_replica(self):
+        routed, _ = self.route()
+        self.assertEqual(routed, {'customers': 'replica', 'search': 'default', 'writes': 'default'})
+
+    def test_reads_after_a_write_stay_on_the_primary(self):
+        routed, response = self.route('post')
+        self.assertEqual(routed['customers'], 'default')
+        cookie = response.cookies['read_primary_until']
+        routed, _ = self.route(cookies={cookie.key: cookie.value})
+        self.assertEqual(routed['customers'], 'default')
+        routed, _ = self.route(cookies={cookie.key: str(time.time() - 1)})
+        self.assertEqual(routed['customers'], 'replica')
+
+    def test_read_only_posts_go_to_a_replica(self):
+        routed, response = self.route('post', path='/api/customers/batch/')
+        self.assertEqual(routed['customers'], 'replica')
+        self.assertNotIn('read_primary_until', response.cookies)
+
+    @override_settings(REPLICA_ROUTING=dict(settings.REPLICA_ROUTING, MAX_LAG=-1))
+    def test_lagging_replicas_are_skipped(self):
+        routed, _ = self.route()
+        self.assertEqual(routed['customers'], 'default')
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_without_replicas(self):
+        routed, response = self.route('post')
+        self.assertEqual(routed['customers'], 'default')
+        self.assertNotIn('read_primary_until', response.cookies)
+
+    def test_replica_reads_are_cached_unless_recently_written(self):
+        api_cache.bump(Customer)
+        key = api_cache.detail_key(Customer, 1)
+        token = read_database.set('replica')
+        try:
+            api_cache.set(key, {"body": 1})
+            self.assertIsNone(api_cache.get(key))
+            # Once the write is older than any usable replica's lag
+            api_cache.local_written_at['customers.customer'] -= api_cache.replica_lag_window
+            api_cache.set(key, {"body": 1})
+        finally:
+            read_database.reset(token)
+        self.assertEqual(api_cache.get(key), {"body": 1})
@@ -0,0 +1,72 @@
+import csv
+import io
+import json
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from src.apps.vendors.models import Vendor
+from utils.db_router import lag_monitor
+from utils.export import StreamingExportAPIView
+
+
+class StreamingExportTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.vendors = [
+            Vendor.objects.create(name=f"Vendor {i}", email=f"vendor{i}@example.com", phone=None if i % 2 else "555")
+            for i in range(5)
+        ]
+
+    def export(self, **params):
+        response = self.client.get('/api/vendors/export/', params)
+        self.assertEqual(response.status_code, 200)
+        return response, b''.join(response.streaming_content).decode()
+
+    def test_ndjson(self):
+        response, body = self.export()
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="vendors.ndjson"')
+        rows = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual([row['vendor_id'] for row in rows], [vendor.pk for vendor in self.vendors])
+        self.assertEqual(rows[1]['phone'], None)
+        self.assertEqual(rows[0]['created_at'], self.client.get(f'/api/vendors/{self.vendors[0].pk}/').json()['data']['created_at'])
+
+    def test_csv(self):
+        response, body = self.export(output='csv')
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        header, *rows = list(csv.reader(io.StringIO(body)))
+        self.assertEqual(header[:3], ['vendor_id', 'name', 'email'])
+        self.assertEqual([row[1] for row in rows], [vendor.name for vendor in self.vendors])
+
+    def test_filters(self):
+        since = self.vendors[3].updated_at.isoformat()
+        _, body = self.export(updated_since=since)
+        self.assertEqual([json.loads(line)['name'] for line in body.splitlines()], ["Vendor 3", "Vendor 4"])
+        self.assertEqual(self.client.get('/api/vendors/export/', {'updated_since': 'soon'}).status_code, 400)
+
+    def test_unknown_output(self):
+        response = self.client.get('/api/vendors/export/', {'output': 'xml'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('output', response.json()['errors'])
+
+
+@override_settings(DATABASE_REPLICAS=['replica'])
+class StreamingExportRoutingTests(TestCase):
+    databases = {'default', 'replica'}
+
+    def setUp(self):
+        lag_monitor.reset()
+
+    def test_streams_from_the_replica_picked_for_the_request(self):
+        routed = []
+
+        def iter_rows(view, queryset, fields):
+            # Runs while the body is consumed, after the middleware returned.
+            routed.append(queryset.db)
+            return iter(())
+
+        with mock.patch.object(StreamingExportAPIView, 'iter_rows', iter_rows):
+            response = self.client.get('/api/vendors/export/')
+            b''.join(response.streaming_content)
+        self.assertEqual(routed, ['replica'])
@@ -0,0 +1,79 @@
+import io
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+from django.core.management import call_command
+from django.test import TestCase
+from rest_framework import serializers
+from src.apps.search.models import SearchDocument, SearchGram
+from utils.fast_serializers import FastReadSerializerMixin, build_converter
+from utils.startup import served_serializers
+
+
+class SearchGramSerializer(FastReadSerializerMixin, serializers.ModelSerializer):
+    class Meta:
+        model = SearchGram
+        fields = '__all__'
+
+
+class FastReadSerializationTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        call_command('generate_data', customers=40, vendors=40, accounts=40, seed=7, stdout=io.StringIO())
+
+    def fast_serializers(self):
+        found = [cls for cls in served_serializers() if issubclass(cls, FastReadSerializerMixin)]
+        self.assertEqual(len(found), 3)
+        return found
+
+    def assertSameData(self, serializer_class, queryset, fieldset=None, **kwargs):
+        fast = serializer_class.fast_data(serializer_class.fast_values(queryset, fieldset), fieldset)
+        if fieldset is not None:
+            kwargs['fieldset'] = fieldset
+        self.assertEqual(fast, [dict(row) for row in serializer_class(queryset, many=True, **kwargs).data])
+        return fast
+
+    def test_matches_drf_for_every_served_serializer(self):
+        for serializer_class in self.fast_serializers():
+            with self.subTest(serializer=serializer_class.__name__):
+                queryset = serializer_class.Meta.model.objects.order_by('pk')
+                data = self.assertSameData(serializer_class, queryset)
+                self.assertTrue(any(value is None for row in data for value in row.values()))
+
+    def test_matches_drf_for_fieldsets(self):
+        for serializer_class in self.fast_serializers():
+            names = list(serializer_class().fields)
+            queryset = serializer_class.Meta.model.objects.order_by('pk')
+            for fieldset in ([names[0]], [names[1], 'updated_at'], names[::2], []):
+                with self.subTest(serializer=serializer_class.__name__, fieldset=fieldset):
+                    data = self.assertSameData(serializer_class, queryset, fieldset)
+                    self.assertEqual(list(data[0]), [name for name in names if name in fieldset])
+
+    def test_foreign_keys(self):
+        document = SearchDocument.objects.create(entity='tests', object_id=1, title="T", text="t", gram_count=1)
+        SearchGram.objects.bulk_create([
+            SearchGram(gram=gram, entity='tests', document=document) for gram in ("ab", "bc")
+        ])
+        data = self.assertSameData(SearchGramSerializer, SearchGram.objects.filter(document=document).order_by('pk'))
+        self.assertEqual({row['document'] for row in data}, {document.pk})
+
+    def test_converters(self):
+        cases = [
+            (serializers.DecimalField(max_digits=10, decimal_places=2), [Decimal('1.5'), Decimal('-0.01'), 3]),
+            (serializers.DecimalField(max_digits=10, decimal_places=2, coerce_to_string=False), [Decimal('2.345')]),
+            (serializers.DateTimeField(), [
+                datetime(2025, 1, 2, 3, 4, 5, 678, tzinfo=timezone.utc),
+                datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone(timedelta(hours=-5))),
+            ]),
+            (serializers.DateTimeField(format='%Y'), [datetime(2025, 1, 2, tzinfo=timezone.utc)]),
+            (serializers.IntegerField(), [0, 7]),
+            (serializers.ChoiceField(choices=[(1, 'One'), ('a', 'A')]), [1, 'a', 'other']),
+            (serializers.FloatField(), [0.5, 2]),
+        ]
+        for field, values in cases:
+            field.bind('value', serializers.Serializer())
+            convert = build_converter(field)
+            for value in values:
+                with self.subTest(field=type(field).__name__, value=value):
+                    self.assertEqual(convert(value), field.to_representation(value))
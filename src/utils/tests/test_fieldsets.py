@@ -0,0 +1,53 @@
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from src.apps.accounts.models import Account
+from utils.cache import api_cache
+
+
+class SparseFieldsetTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.account = Account.objects.create(name="Cash", code="1000", account_type="asset", description="x" * 500)
+
+    def setUp(self):
+        api_cache.local.clear()
+
+    def test_list_selects_only_requested_columns(self):
+        for fast in (False, True):
+            with self.subTest(fast=fast), override_settings(FAST_READ_SERIALIZATION=fast):
+                api_cache.local.clear()
+                with CaptureQueriesContext(connection) as queries:
+                    response = self.client.get('/api/accounts/', {'fields': 'id,name,code'})
+                results = response.json()['data']['results']
+                self.assertEqual(results, [{"account_id": self.account.pk, "name": "Cash", "code": "1000"}])
+                page_query = queries[-1]['sql']
+                self.assertIn('"code"', page_query)
+                self.assertNotIn('"description"', page_query)
+
+    def test_exclude(self):
+        results = self.client.get('/api/accounts/', {'exclude': 'description,created_at'}).json()['data']['results']
+        self.assertEqual(set(results[0]), {"account_id", "name", "code", "account_type", "updated_at"})
+
+    def test_retrieve(self):
+        data = self.client.get(f'/api/accounts/{self.account.pk}/', {'fields': 'name'}).json()['data']
+        self.assertEqual(data, {"name": "Cash"})
+
+    def test_unknown_fields_use_the_envelope(self):
+        for path, params in (
+            ('/api/accounts/', {'fields': 'name,balance'}),
+            ('/api/accounts/', {'fields': 'name,balance', 'pagination': 'cursor'}),
+            (f'/api/accounts/{self.account.pk}/', {'exclude': 'balance'}),
+        ):
+            with self.subTest(path=path, params=params):
+                response = self.client.get(path, params)
+                self.assertEqual(response.status_code, 400)
+                param = 'fields' if 'fields' in params else 'exclude'
+                self.assertEqual(response.json(), {
+                    "message": "Bad Request",
+                    "code": 400,
+                    "data": None,
+                    "subCode": "0",
+                    "errors": {param: ["Unknown field(s): balance."]},
+                })
@@ -0,0 +1,32 @@
+from django.test import TestCase
+from src.apps.vendors.models import Vendor
+from utils.cache import api_cache
+
+
+class FilterErrorTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        Vendor.objects.create(name="Vendor", email="vendor@example.com")
+
+    def setUp(self):
+        api_cache.local.clear()
+
+    def test_invalid_filter_uses_the_envelope(self):
+        for count in ('exact', 'cached', 'estimated'):
+            with self.subTest(count=count):
+                response = self.client.get('/api/vendors/', {'created_at_after': 'yesterday', 'count': count})
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json(), {
+                    "message": "Bad Request",
+                    "code": 400,
+                    "data": None,
+                    "subCode": "0",
+                    "errors": {"created_at_after": ["Expected an ISO 8601 datetime."]},
+                })
+
+    def test_prefix_ending_in_the_last_code_point(self):
+        Vendor.objects.create(name="Vendor\U0010ffff", email="last@example.com")
+        response = self.client.get('/api/vendors/', {'name_prefix': 'Vendor\U0010ffff'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([row['email'] for row in response.json()['data']['results']], ["last@example.com"])
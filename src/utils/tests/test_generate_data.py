@@ -0,0 +1,61 @@
+import io
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from src.apps.accounts.models import Account
+from src.apps.customers.models import Customer
+from src.apps.vendors.models import Vendor
+from utils.management.commands.generate_data import generate_chunk
+
+
+class GenerateDataTests(TestCase):
+
+    def rows(self, *timestamps):
+        return list(Vendor.objects.order_by('pk').values_list(
+            'pk', 'name', 'email', 'phone', 'address', 'contact_person', *timestamps,
+        ))
+
+    def generate(self, **counts):
+        call_command('generate_data', '--truncate', customers=0, accounts=0, stdout=io.StringIO(), **counts)
+
+    def test_same_seed_same_rows(self):
+        self.generate(vendors=12, batch_size=5)
+        first = self.rows('created_at', 'updated_at')
+        self.assertEqual([row[0] for row in first], list(range(1, 13)))
+        self.generate(vendors=12, batch_size=5)
+        self.assertEqual(self.rows('created_at', 'updated_at'), first)
+
+    def test_anchor(self):
+        self.generate(vendors=5, anchor='2024-03-01', days=10)
+        created = Vendor.objects.values_list('created_at', flat=True)
+        anchor = datetime(2024, 3, 1, tzinfo=dt_timezone.utc)
+        self.assertTrue(all(anchor - timedelta(days=10) <= value <= anchor for value in created))
+
+    def test_chunk_completion_order_does_not_matter(self):
+        now = timezone.now()
+        chunks = [(start, min(start + 4, 10)) for start in range(0, 10, 4)]
+        for start, stop in chunks:
+            generate_chunk('vendors', start, stop, 0, 42, now, 30, 4)
+        in_order = self.rows('created_at', 'updated_at')
+        Vendor.objects.all().delete()
+        for start, stop in reversed(chunks):
+            generate_chunk('vendors', start, stop, 0, 42, now, 30, 4)
+        self.assertEqual(self.rows('created_at', 'updated_at'), in_order)
+
+    def test_appends_after_existing_rows(self):
+        existing = Vendor.objects.create(name="Existing", email="existing@example.com")
+        call_command('generate_data', customers=0, vendors=3, accounts=0, stdout=io.StringIO())
+        self.assertEqual(
+            list(Vendor.objects.order_by('pk').values_list('pk', flat=True)),
+            [existing.pk, existing.pk + 1, existing.pk + 2, existing.pk + 3],
+        )
+        self.assertEqual(Vendor.objects.create(name="Next", email="next@example.com").pk, existing.pk + 4)
+
+    def test_repeated_runs_append_without_collisions(self):
+        for _ in range(2):
+            call_command('generate_data', customers=3, vendors=3, accounts=3, stdout=io.StringIO())
+        self.assertEqual(Vendor.objects.count(), 6)
+        self.assertEqual(Customer.objects.count(), 6)
+        self.assertEqual(Account.objects.count(), 6)
@@ -0,0 +1,121 @@
+import io
+import json
+import os
+import tempfile
+from unittest import mock
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from src.apps.vendors.models import Vendor
+from src.apps.vendors.serializers import VendorSerializer
+from utils import importer as importer_module
+from utils.importer import BulkImporter, iter_records
+
+
+class BulkImportTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        Vendor.objects.create(name="Taken", email="taken@example.com")
+
+    def upload(self, name, content, **params):
+        upload = SimpleUploadedFile(name, content if isinstance(content, bytes) else content.encode())
+        query = '?' + '&'.join(f'{key}={value}' for key, value in params.items()) if params else ''
+        return self.client.post(f'/api/vendors/import/{query}', {'file': upload})
+
+    def test_ndjson_reports_error_rows(self):
+        response = self.upload('vendors.ndjson', '\n'.join([
+            json.dumps({"name": "One", "email": "one@example.com"}),
+            '{"name": "Broken",',
+            '',
+            json.dumps({"name": "Bad", "email": "not-an-email"}),
+            json.dumps({"name": "Again", "email": "one@example.com"}),
+            json.dumps({"name": "Clash", "email": "taken@example.com"}),
+        ]))
+        self.assertEqual(response.status_code, 207)
+        report = response.json()['data']
+        self.assertEqual((report['processed'], report['created'], report['rejected']), (5, 1, 4))
+        rejections = {rejection['row']: rejection['errors'] for rejection in report['rejections']}
+        self.assertEqual(sorted(rejections), [2, 4, 5, 6])
+        self.assertIn('Invalid JSON', rejections[2]['non_field_errors'][0])
+        for row in (4, 5, 6):
+            self.assertIn('email', rejections[row])
+        self.assertTrue(Vendor.objects.filter(email="one@example.com").exists())
+
+    def test_csv_drops_empty_cells(self):
+        response = self.upload('vendors.csv', "name,email,phone\nOne,one@example.com,\nTwo,two@example.com,555\n")
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()['data']['created'], 2)
+        self.assertEqual(
+            list(Vendor.objects.filter(name__in=["One", "Two"]).order_by('name').values_list('phone', flat=True)),
+            [None, "555"],
+        )
+
+    def test_every_row_rejected(self):
+        response = self.upload('vendors.ndjson', json.dumps({"name": "Clash", "email": "taken@example.com"}))
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['data']['rejected'], 1)
+
+    def test_format_errors(self):
+        self.assertIn('input', self.upload('vendors.txt', "name\n").json()['errors'])
+        self.assertEqual(self.upload('vendors.txt', "name,email\nOne,one@example.com\n", input='csv').status_code, 201)
+        self.assertIn('file', self.client.post('/api/vendors/import/', {}).json()['errors'])
+
+    def test_batches_and_rejection_cap(self):
+        lines = [json.dumps({"name": f"V{i}", "email": "bad" if i % 2 else f"v{i}@example.com"}) for i in range(7)]
+        progress = []
+        importer = BulkImporter(
+            VendorSerializer, batch_size=3, max_rejections=2, on_progress=lambda report: progress.append(report['processed']),
+        )
+        report = importer.run(iter_records(io.StringIO('\n'.join(lines)), 'ndjson'))
+        self.assertEqual(progress, [3, 6, 7])
+        self.assertEqual((report['created'], report['rejected']), (4, 3))
+        self.assertEqual([rejection['row'] for rejection in report['rejections']], [2, 4])
+
+    def test_concurrent_conflict_rejects_only_that_row(self):
+        real = importer_module.find_unique_conflicts
+        calls = []
+
+        def find_unique_conflicts(model, rows):
+            calls.append(rows)
+            if len(calls) == 1:
+                # A concurrent writer takes the email after the pre-check.
+                Vendor.objects.create(name="Racer", email="race@example.com")
+                return {}
+            return real(model, rows)
+
+        lines = [
+            json.dumps({"name": "Fine", "email": "fine@example.com"}),
+            json.dumps({"name": "Late", "email": "race@example.com"}),
+        ]
+        with mock.patch('utils.importer.find_unique_conflicts', find_unique_conflicts):
+            report = BulkImporter(VendorSerializer).run(iter_records(io.StringIO('\n'.join(lines)), 'ndjson'))
+        self.assertEqual((report['created'], report['rejected']), (1, 1))
+        self.assertEqual(report['rejections'][0]['row'], 2)
+        self.assertIn('email', report['rejections'][0]['errors'])
+        self.assertTrue(Vendor.objects.filter(email="fine@example.com").exists())
+
+    @override_settings(IMPORT_BATCH_SIZE=100)
+    def test_unreadable_file_reports_committed_batches(self):
+        # The undecodable bytes sit past the first read, after one full batch.
+        lines = [json.dumps({"name": f"V{i}", "email": f"vendor.{i}@example.com"}) for i in range(400)]
+        response = self.upload('vendors.ndjson', '\n'.join(lines).encode() + b'\n\xff\xfe\n')
+        self.assertEqual(response.status_code, 400)
+        body = response.json()
+        self.assertIn('file', body['errors'])
+        self.assertGreaterEqual(body['data']['created'], 100)
+        self.assertEqual(Vendor.objects.filter(name__startswith='V').count(), body['data']['created'])
+
+    def test_command_writes_rejects(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source, rejects = os.path.join(directory, 'vendors.csv'), os.path.join(directory, 'rejects.ndjson')
+            with open(source, 'w') as handle:
+                handle.write("name,email\nOne,one@example.com\nClash,taken@example.com\n")
+            stdout = io.StringIO()
+            call_command('import_records', 'vendors', source, '--rejects', rejects, stdout=stdout)
+            with open(rejects) as handle:
+                rejected = [json.loads(line) for line in handle]
+        self.assertIn("Imported 1 vendors, rejected 1 of 2 rows.", stdout.getvalue())
+        self.assertEqual([row['row'] for row in rejected], [2])
+        self.assertIn('email', rejected[0]['errors'])
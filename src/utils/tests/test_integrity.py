@@ -0,0 +1,47 @@
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from src.apps.accounts.models import Account
+from src.apps.accounts.serializers import AccountSerializer
+
+
+@override_settings(CONSTRAINT_UNIQUENESS=True)
+class ConstraintUniquenessTests(TestCase):
+    payload = {"name": "Cash", "code": "1000", "account_type": "asset"}
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.account = Account.objects.create(name="Bank", code="1010", account_type="asset")
+
+    def test_create_skips_validator_query(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post('/api/accounts/', self.payload, content_type='application/json')
+        self.assertEqual(response.status_code, 201)
+        # The savepoint is the test case's transaction; no SELECT precedes the INSERT.
+        statements = [query['sql'].split()[0] for query in queries]
+        self.assertEqual(statements, ['SAVEPOINT', 'INSERT', 'RELEASE'])
+
+    def test_duplicate_matches_validator_errors(self):
+        payload = dict(self.payload, code="1010")
+        with override_settings(CONSTRAINT_UNIQUENESS=False):
+            expected = self.client.post('/api/accounts/', payload, content_type='application/json').json()
+        response = self.client.post('/api/accounts/', payload, content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), expected)
+        self.assertEqual(response.json()['errors'], {"code": ["account with this code already exists."]})
+
+    def test_put_duplicate(self):
+        other = Account.objects.create(**self.payload)
+        response = self.client.put(
+            f'/api/accounts/{other.pk}/', dict(self.payload, code="1010"), content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("code", response.json()['errors'])
+
+    @override_settings(CONSTRAINT_UNIQUENESS=False)
+    def test_race_past_validator(self):
+        serializer = AccountSerializer(data=self.payload)
+        self.assertTrue(serializer.is_valid())
+        Account.objects.create(**self.payload)
+        self.assertFalse(serializer.try_save())
+        self.assertEqual(serializer.errors, {"code": ["account with this code already exists."]})
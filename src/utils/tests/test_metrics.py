@@ -0,0 +1,96 @@
+import json
+import os
+import tempfile
+import time
+
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from src.apps.vendors.models import Vendor
+from utils import snapshots
+from utils.cache import api_cache
+from utils.metrics import MetricsRegistry, registry
+from utils.snapshots import SnapshotStore
+
+
+class MetricsTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = User.objects.create_user('staff', password='x', is_staff=True)
+        cls.vendor = Vendor.objects.create(name="Vendor", email="vendor@example.com")
+
+    def setUp(self):
+        api_cache.local.clear()
+        registry.routes.clear()
+
+    def test_requests_are_aggregated_per_route(self):
+        for _ in range(3):
+            self.client.get(f'/api/vendors/{self.vendor.pk}/')
+        self.client.get('/api/vendors/999999/')
+        stats = registry.snapshot()['vendor-retrieve-update-delete|GET']
+        self.assertEqual(stats['statuses'], {'200': 3, '404': 1})
+        self.assertEqual(stats['latency']['count'], 4)
+        self.assertEqual(sum(stats['queries']['buckets']), 4)
+        self.assertGreater(stats['size']['sum'], 0)
+
+    def test_endpoint_is_staff_only(self):
+        self.client.get('/api/vendors/')
+        self.assertEqual(self.client.get('/metrics').status_code, 403)
+        self.client.force_login(self.staff)
+        response = self.client.get('/metrics')
+        self.assertEqual(response.status_code, 200)
+        body = response.content.decode()
+        self.assertIn('http_requests_total{route="vendor-list-create",method="GET",status="200"} 1', body)
+        self.assertIn('http_request_duration_seconds_bucket{route="vendor-list-create",method="GET",le="+Inf"} 1', body)
+
+    @override_settings(METRICS_TOKEN='secret')
+    def test_endpoint_accepts_the_scrape_token(self):
+        self.assertEqual(self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer secret').status_code, 200)
+        self.assertEqual(self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer wrong').status_code, 403)
+        self.assertEqual(self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer sécret').status_code, 403)
+
+    def test_other_workers_are_merged(self):
+        with tempfile.TemporaryDirectory() as directory, override_settings(METRICS_DIR=directory):
+            other = MetricsRegistry()
+            other.observe('vendor-list-create', 'GET', 200, 0.01, 2, 0.001, 100)
+            with open(os.path.join(directory, 'metrics-1-other.json'), 'w') as handle:
+                json.dump({'routes': other.snapshot()}, handle)
+            registry.observe('vendor-list-create', 'GET', 500, 0.02, 1, 0.001, 100)
+            statuses = registry.collect()['vendor-list-create|GET']['statuses']
+        self.assertEqual(statuses, {'200': 1, '500': 1})
+
+    def test_snapshots_are_written_off_the_request_path(self):
+        with (
+            tempfile.TemporaryDirectory() as directory,
+            override_settings(METRICS_DIR=directory, METRICS_FLUSH_INTERVAL=0.01),
+        ):
+            metrics = MetricsRegistry()
+            metrics.observe('vendor-list-create', 'GET', 200, 0.01, 2, 0.001, 100)
+            self.assertEqual(metrics.flusher_pid, os.getpid())
+            path = metrics.store.path
+            for _ in range(200):
+                if path.exists():
+                    break
+                time.sleep(0.01)
+            self.assertIn('vendor-list-create|GET', json.loads(path.read_text())['routes'])
+
+
+class SnapshotStoreTests(TestCase):
+
+    def test_expired_snapshots_are_pruned(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = SnapshotStore(directory, 'metrics', max_age=60)
+            live, dead = (os.path.join(directory, f'metrics-{name}.json') for name in ('1-live', '2-dead'))
+            for path, value in ((live, 1), (dead, 2)):
+                with open(path, 'w') as handle:
+                    json.dump({'value': value}, handle)
+            os.utime(dead, (time.time() - 120, time.time() - 120))
+            self.assertEqual(list(store.read_others()), [{'value': 1}])
+            self.assertFalse(os.path.exists(dead))
+
+    def test_reused_pid_gets_its_own_file(self):
+        store = SnapshotStore(tempfile.gettempdir(), 'metrics')
+        first = store.path
+        snapshots._process_tokens.clear()  # As if a new process got the same pid
+        self.assertNotEqual(store.path, first)
+        self.assertTrue(store.path.name.startswith(f'metrics-{os.getpid()}-'))
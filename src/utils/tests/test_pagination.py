@@ -0,0 +1,70 @@
+from urllib.parse import parse_qs, urlsplit
+
+from django.test import TestCase
+from src.apps.vendors.models import Vendor
+from utils.cache import api_cache
+
+
+class KeysetPaginationTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        # Three names, so ordering by name has long runs of ties.
+        cls.vendors = [
+            Vendor.objects.create(name=f"Vendor {'ABC'[i % 3]}", email=f"vendor{i}@example.com")
+            for i in range(11)
+        ]
+
+    def setUp(self):
+        api_cache.local.clear()
+
+    def page(self, **params):
+        response = self.client.get('/api/vendors/', params)
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()['data']
+
+    def cursor(self, link):
+        return parse_qs(urlsplit(link).query)['cursor'][0] if link else None
+
+    def walk(self, **params):
+        """
+        Follow ``next`` links from the first page; returns the pages' ids.
+        """
+        pages, cursor = [], None
+        while True:
+            data = self.page(pagination='cursor', page_size=4, **params, **({'cursor': cursor} if cursor else {}))
+            pages.append([row['vendor_id'] for row in data['results']])
+            cursor = self.cursor(data['next'])
+            if cursor is None:
+                return pages
+
+    def test_walks_every_row_once_without_counting(self):
+        data = self.page(pagination='cursor', page_size=4)
+        self.assertEqual((data['total'], data['totalExact'], data['previous']), (None, False, None))
+        pages = self.walk()
+        self.assertEqual([len(page) for page in pages], [4, 4, 3])
+        self.assertEqual(sum(pages, []), [vendor.pk for vendor in self.vendors])
+
+    def test_ties_are_broken_by_primary_key(self):
+        for ordering in ('name', '-name'):
+            with self.subTest(ordering=ordering):
+                expected = sorted(
+                    self.vendors, key=lambda vendor: (vendor.name, vendor.pk), reverse=ordering.startswith('-'),
+                )
+                self.assertEqual(sum(self.walk(ordering=ordering), []), [vendor.pk for vendor in expected])
+
+    def test_previous_link_returns_the_same_page(self):
+        first = self.page(pagination='cursor', page_size=4)
+        second = self.page(pagination='cursor', page_size=4, cursor=self.cursor(first['next']))
+        third = self.page(pagination='cursor', page_size=4, cursor=self.cursor(second['next']))
+        back = self.page(pagination='cursor', page_size=4, cursor=self.cursor(third['previous']))
+        self.assertEqual(back['results'], second['results'])
+
+    def test_cursor_survives_a_fieldset_without_the_ordering_column(self):
+        first = self.page(pagination='cursor', page_size=6, fields='name')
+        self.assertEqual(first['results'], [{"name": vendor.name} for vendor in self.vendors[:6]])
+        rest = self.page(pagination='cursor', page_size=6, fields='email', cursor=self.cursor(first['next']))
+        self.assertEqual(rest['results'], [{"email": vendor.email} for vendor in self.vendors[6:]])
+
+    def test_invalid_cursor(self):
+        self.assertEqual(self.client.get('/api/vendors/', {'cursor': 'not-a-cursor'}).status_code, 404)
@@ -0,0 +1,61 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from src.apps.customers.models import Customer
+from src.apps.search.indexing import search_index
+
+
+class PartialUpdateTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        with cls.captureOnCommitCallbacks(execute=True):
+            cls.customer = Customer.objects.create(name="Ama", email="ama@example.com", phone="0200000000")
+            Customer.objects.create(name="Kofi", email="kofi@example.com", phone="0240000000")
+
+    def patch(self, data, **headers):
+        # Commit callbacks, i.e. the search indexing, run as they would outside a test transaction.
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.patch(f'/api/customers/{self.customer.pk}/', data, 'application/json', **headers)
+
+    def test_single_update_of_supplied_columns(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.patch({"address": "12 Ring Road"})
+        self.assertEqual(response.status_code, 200)
+        statements = [query['sql'] for query in queries if not query['sql'].startswith(('SAVEPOINT', 'RELEASE'))]
+        self.assertEqual(len(statements), 1)
+        self.assertTrue(statements[0].startswith('UPDATE "customers_customer" SET "address" = '))
+        self.assertNotIn('"email"', statements[0])
+        self.customer.refresh_from_db()
+        self.assertEqual((self.customer.address, self.customer.name), ("12 Ring Road", "Ama"))
+
+    def test_response_holds_the_written_columns(self):
+        data = self.patch({"address": "12 Ring Road"}).json()['data']
+        self.assertEqual(set(data), {"customer_id", "address", "updated_at"})
+        self.assertEqual((data["customer_id"], data["address"]), (self.customer.pk, "12 Ring Road"))
+
+    def test_searched_fields_are_reindexed(self):
+        # The UPDATE in its savepoint, then the row and its document are read
+        # and the document rewritten (two DELETEs, two INSERTs) in another.
+        with self.assertNumQueries(11):
+            self.assertEqual(self.patch({"phone": "0551234567"}).status_code, 200)
+        self.assertEqual(search_index.search('0551234567')[0]['id'], self.customer.pk)
+
+    def test_validation_and_unique_errors(self):
+        self.assertIn('email', self.patch({"email": "not-an-email"}).json()['errors'])
+        response = self.patch({"email": "kofi@example.com"})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['errors'], {"email": ["customer with this email already exists."]})
+        self.assertEqual(self.patch({}).status_code, 400)
+        self.assertEqual(self.client.patch('/api/customers/999/', {"phone": "1"}, 'application/json').status_code, 404)
+
+    def test_optimistic_concurrency(self):
+        etag = self.client.get(f'/api/customers/{self.customer.pk}/')['ETag']
+        self.assertEqual(self.patch({"phone": "1"}, HTTP_IF_MATCH=etag).status_code, 200)
+        self.assertEqual(self.patch({"phone": "2"}, HTTP_IF_MATCH=etag).status_code, 412)
+        stale = self.patch({"phone": "3"}, HTTP_IF_UNMODIFIED_SINCE='Mon, 01 Jan 2024 00:00:00 GMT')
+        self.assertEqual(stale.status_code, 412)
+        last_modified = self.client.get(f'/api/customers/{self.customer.pk}/')['Last-Modified']
+        self.assertEqual(self.patch({"phone": "4"}, HTTP_IF_UNMODIFIED_SINCE=last_modified).status_code, 200)
+        self.customer.refresh_from_db()
+        self.assertEqual(self.customer.phone, "4")
@@ -0,0 +1,60 @@
+import gzip
+import json
+import marshal
+import tempfile
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from src.apps.vendors.models import Vendor
+from utils.cache import api_cache
+
+
+class ProfilingTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        Vendor.objects.create(name="Vendor 0", email="vendor0@example.com", contact_person="Ama")
+        cls.staff = User.objects.create_user('staff', password='x', is_staff=True)
+
+    def setUp(self):
+        api_cache.local.clear()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        override = override_settings(PROFILING=dict(settings.PROFILING, TOKEN='secret', DIR=directory.name))
+        override.enable()
+        self.addCleanup(override.disable)
+
+    def test_header_triggers_profile(self):
+        response = self.client.get('/api/vendors/', {'page': 1}, HTTP_X_PROFILE='secret')
+        self.assertEqual(response.status_code, 200)
+        profile_id = response['X-Profile-Id']
+
+        self.client.force_login(self.staff)
+        summaries = self.client.get('/profiles/').json()['data']
+        self.assertEqual([summary['id'] for summary in summaries], [profile_id])
+        self.assertEqual(summaries[0]['path'], '/api/vendors/')
+        download = self.client.get(f'/profiles/{profile_id}/')
+        document = json.loads(gzip.decompress(b''.join(download.streaming_content)))
+        self.assertEqual(len(document['sql']), document['summary']['sqlCount'])
+        self.assertTrue(any('"vendors_vendor"' in statement['sql'] for statement in document['sql']))
+        stats = marshal.loads(self.client.get(f'/profiles/{profile_id}/', {'export': 'pstats'}).content)
+        self.assertTrue(any(name == 'list' for _, _, name in stats))
+
+    def test_unauthorized_requests_are_not_profiled(self):
+        self.assertNotIn('X-Profile-Id', self.client.get('/api/vendors/', HTTP_X_PROFILE='wrong'))
+        response = self.client.get('/api/vendors/', HTTP_X_PROFILE='sécret')
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('X-Profile-Id', response)
+        self.assertNotIn('X-Profile-Id', self.client.get('/api/vendors/'))
+        self.assertEqual(self.client.get('/profiles/').status_code, 403)
+
+    def test_ring_buffer_and_statistical_mode(self):
+        with override_settings(PROFILING=dict(settings.PROFILING, MAX_FILES=2, MODE='statistical', SAMPLE_RATE=1.0)):
+            profile_ids = [self.client.get('/api/vendors/')['X-Profile-Id'] for _ in range(3)]
+        self.client.force_login(self.staff)
+        summaries = self.client.get('/profiles/').json()['data']
+        self.assertEqual([summary['id'] for summary in summaries], profile_ids[:0:-1])
+        self.assertEqual(summaries[0]['mode'], 'statistical')
+        self.assertEqual(self.client.get(f'/profiles/{profile_ids[0]}/').status_code, 404)
+        self.assertEqual(self.client.get(f'/profiles/{profile_ids[2]}/', {'export': 'folded'}).status_code, 200)
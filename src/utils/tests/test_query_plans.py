@@ -0,0 +1,102 @@
+from django.test import TestCase
+from src.apps.accounts.views import AccountListCreateAPIView
+from src.apps.customers.views import CustomerListCreateAPIView
+from src.apps.vendors.views import VendorListCreateAPIView
+from utils.testing import QueryPlanAssertionsMixin
+
+
+class AccountListQueryPlanTests(QueryPlanAssertionsMixin, TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.seed('accounts')
+
+    def test_filters_use_an_index(self):
+        for params in (
+            {'account_type': 'asset'},
+            {'code_prefix': '10'},
+            {'name_prefix': 'Cash'},
+            {'created_at_after': '2025-01-01T00:00:00Z'},
+            {'created_at_before': '2025-01-01T00:00:00Z'},
+            {'updated_at_after': '2025-01-01T00:00:00Z', 'updated_at_before': '2025-06-01T00:00:00Z'},
+        ):
+            with self.subTest(params=params):
+                self.assertIndexedPlan(AccountListCreateAPIView, params)
+
+    def test_orderings_use_an_index(self):
+        # The primary key is SQLite's rowid, which is read in order without an index.
+        for field in AccountListCreateAPIView.ordering_fields[1:]:
+            for ordering in (field, f'-{field}'):
+                with self.subTest(ordering=ordering):
+                    self.assertIndexedPlan(AccountListCreateAPIView, {'ordering': ordering})
+
+    def test_filters_and_ordering(self):
+        rows = self.list_queryset(AccountListCreateAPIView, {'account_type': 'income', 'code_prefix': '4', 'ordering': '-code'})
+        codes = [account.code for account in rows]
+        self.assertEqual(codes, sorted(codes, reverse=True))
+        self.assertTrue(all(account.account_type == 'income' and account.code.startswith('4') for account in rows))
+        self.assertEqual(self.client.get('/api/accounts/', {'created_at_after': 'yesterday'}).status_code, 400)
+
+
+class CustomerListQueryPlanTests(QueryPlanAssertionsMixin, TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.seed('customers')
+
+    def test_filters_use_an_index(self):
+        for params in (
+            {'email': 'someone@example.com'},
+            {'name_prefix': 'James'},
+            {'created_at_after': '2025-01-01T00:00:00Z'},
+            {'created_at_before': '2025-01-01T00:00:00Z'},
+            {'updated_at_after': '2025-01-01T00:00:00Z', 'updated_at_before': '2025-06-01T00:00:00Z'},
+        ):
+            with self.subTest(params=params):
+                self.assertIndexedPlan(CustomerListCreateAPIView, params)
+
+    def test_orderings_use_an_index(self):
+        # The primary key is SQLite's rowid, which is read in order without an index.
+        for field in CustomerListCreateAPIView.ordering_fields[1:]:
+            for ordering in (field, f'-{field}'):
+                with self.subTest(ordering=ordering):
+                    self.assertIndexedPlan(CustomerListCreateAPIView, {'ordering': ordering})
+
+    def test_filters_and_ordering(self):
+        rows = self.list_queryset(CustomerListCreateAPIView, {'name_prefix': 'James', 'ordering': '-created_at'})
+        created = [customer.created_at for customer in rows]
+        self.assertEqual(created, sorted(created, reverse=True))
+        self.assertTrue(all(customer.name.startswith('James') for customer in rows))
+        self.assertEqual(self.client.get('/api/customers/', {'updated_at_before': 'soon'}).status_code, 400)
+
+
+class VendorListQueryPlanTests(QueryPlanAssertionsMixin, TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.seed('vendors')
+
+    def test_filters_use_an_index(self):
+        for params in (
+            {'email': 'someone@example.com'},
+            {'name_prefix': 'Global'},
+            {'created_at_after': '2025-01-01T00:00:00Z'},
+            {'created_at_before': '2025-01-01T00:00:00Z'},
+            {'updated_at_after': '2025-01-01T00:00:00Z', 'updated_at_before': '2025-06-01T00:00:00Z'},
+        ):
+            with self.subTest(params=params):
+                self.assertIndexedPlan(VendorListCreateAPIView, params)
+
+    def test_orderings_use_an_index(self):
+        # The primary key is SQLite's rowid, which is read in order without an index.
+        for field in VendorListCreateAPIView.ordering_fields[1:]:
+            for ordering in (field, f'-{field}'):
+                with self.subTest(ordering=ordering):
+                    self.assertIndexedPlan(VendorListCreateAPIView, {'ordering': ordering})
+
+    def test_filters_and_ordering(self):
+        rows = self.list_queryset(VendorListCreateAPIView, {'name_prefix': 'Global', 'ordering': '-created_at'})
+        created = [vendor.created_at for vendor in rows]
+        self.assertEqual(created, sorted(created, reverse=True))
+        self.assertTrue(all(vendor.name.startswith('Global') for vendor in rows))
+        self.assertEqual(self.client.get('/api/vendors/', {'updated_at_before': 'soon'}).status_code, 400)
@@ -0,0 +1,75 @@
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from unittest import mock
+
+import msgpack
+from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
+from src.apps.vendors.models import Vendor
+from utils.cache import api_cache
+from utils.renderers import FastJSONRenderer, MessagePackRenderer, to_columnar
+
+
+class RendererTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.vendors = [
+            Vendor.objects.create(name=f"Vendor {i}", email=f"vendor{i}@example.com", phone=None) for i in range(3)
+        ]
+
+    def setUp(self):
+        api_cache.local.clear()
+
+    def test_orjson_output_matches_drf(self):
+        data = {
+            "text": "café \u2028\u2029 \"quoted\"", "number": 1.5, "decimal": Decimal("2.50"),
+            "nested": [{"none": None, "flag": True}], "big": 2 ** 40,
+        }
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_orjson_edge_cases_match_drf(self):
+        for data in (
+            {"at": datetime(2025, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc), "day": date(2025, 1, 2)},
+            {"at": [datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone(timedelta(hours=2))), datetime(2025, 1, 2)]},
+            {1: "int key", None: "none key", False: "bool key", 2.5: "float key"},
+            {"wide": 2 ** 70, "negative": -2 ** 64},
+        ):
+            with self.subTest(data=data):
+                self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_non_finite_floats_match_drf(self):
+        for value in (float('nan'), float('inf'), -float('inf')):
+            data = {"value": value, "none": None}
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    JSONRenderer().render(data)
+                with self.assertRaises(ValueError):
+                    FastJSONRenderer().render(data)
+                fast, drf = FastJSONRenderer(), JSONRenderer()
+                fast.strict = drf.strict = False  # STRICT_JSON = False
+                self.assertEqual(fast.render(data), drf.render(data))
+
+    def test_negotiation(self):
+        path = '/api/vendors/'
+        json_response = self.client.get(path)
+        self.assertEqual(json_response['Content-Type'], 'application/json')
+        for params, headers in (({'format': 'msgpack'}, {}), ({}, {'HTTP_ACCEPT': 'application/msgpack'})):
+            response = self.client.get(path, params, **headers)
+            self.assertEqual(response['Content-Type'], 'application/msgpack')
+            self.assertEqual(msgpack.unpackb(response.content), json_response.json())
+        self.assertEqual(self.client.get(path, HTTP_ACCEPT='application/xml').status_code, 406)
+
+    def test_msgpack_is_skipped_when_unavailable(self):
+        with mock.patch.object(MessagePackRenderer, 'available', False):
+            response = self.client.get('/api/vendors/', HTTP_ACCEPT='application/msgpack, application/json;q=0.5')
+        self.assertEqual(response['Content-Type'], 'application/json')
+
+    def test_columnar_layout(self):
+        rows = self.client.get('/api/vendors/').json()['data']['results']
+        results = self.client.get('/api/vendors/', {'layout': 'columnar'}).json()['data']['results']
+        self.assertEqual(results['fields'], list(rows[0]))
+        self.assertEqual([dict(zip(results['fields'], row)) for row in results['rows']], rows)
+        detail = self.client.get(f'/api/vendors/{self.vendors[0].pk}/', {'layout': 'columnar'}).json()
+        self.assertEqual(detail['data']['name'], "Vendor 0")  # Not a list; left as is
+        self.assertEqual(to_columnar({'data': {'results': []}}), {'data': {'results': {'fields': [], 'rows': []}}})
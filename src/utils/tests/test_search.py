@@ -0,0 +1,151 @@
+import io
+from unittest import mock
+
+from django.conf import settings
+from django.core.management import call_command
+from django.db import transaction
+from django.test import TestCase, TransactionTestCase
+from src.apps.accounts.models import Account
+from src.apps.customers.models import Customer
+from src.apps.search.indexing import search_index, trigrams
+from src.apps.search.models import SearchDocument
+from src.apps.vendors.models import Vendor
+from utils.signals import rows_changed
+
+
+class TrigramTests(TestCase):
+
+    def test_words_are_padded(self):
+        self.assertEqual(trigrams('Ab'), {' ab', 'ab '})
+        self.assertEqual(trigrams('kofi.osei'), trigrams('Kofi Osei'))
+
+    def test_prefix_leaves_the_last_word_open(self):
+        self.assertEqual(trigrams('jam', prefix=True), {' ja', 'jam'})
+        self.assertLessEqual(trigrams('jam', prefix=True), trigrams('james'))
+        self.assertIn('am ', trigrams('jam ', prefix=True))
+
+
+class SearchIndexTests(TestCase):
+
+    def setUp(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.customer = Customer.objects.create(name="Kwame Mensah", email="kwame@example.com", phone="+15551234567")
+            self.vendor = Vendor.objects.create(name="Volta Supplies", email="sales@volta.example.com", contact_person="Ama Owusu")
+            self.account = Account.objects.create(name="Petty Cash", code="1001", account_type="asset")
+
+    def committed(self):
+        """
+        Run the index updates queued for commit, which ``TestCase`` never
+        reaches on its own.
+        """
+        return self.captureOnCommitCallbacks(execute=True)
+
+    def search(self, query, **params):
+        response = self.client.get('/api/search/', {'q': query, **params})
+        self.assertEqual(response.status_code, 200)
+        return [(result["type"], result["id"]) for result in response.json()["data"]["results"]]
+
+    def test_matches_across_entities(self):
+        self.assertEqual(self.search('kwam'), [('customers', self.customer.pk)])
+        self.assertEqual(self.search('ama owu'), [('vendors', self.vendor.pk)])
+        self.assertEqual(self.search('1001'), [('accounts', self.account.pk)])
+        self.assertEqual(self.search('5551234'), [('customers', self.customer.pk)])
+
+    def test_tolerates_typos_and_ranks_prefixes_first(self):
+        with self.committed():
+            Customer.objects.create(name="Kwesi Mensa", email="kwesi@example.com")
+        results = self.search('mensah')
+        self.assertEqual(results[0], ('customers', self.customer.pk))
+        self.assertEqual(len(results), 2)
+
+    def test_types_filter(self):
+        with self.committed():
+            Vendor.objects.create(name="Kwame Trading", email="kt@example.com")
+        self.assertEqual({entity for entity, _ in self.search('kwame', types='vendors')}, {'vendors'})
+
+    def test_candidates_come_from_the_rarest_trigrams(self):
+        with self.committed():
+            Customer.objects.bulk_create([
+                Customer(name=f"Kwame Owusu {i}", email=f"kwame{i}@example.com") for i in range(30)
+            ])
+            rows_changed.send(sender=Customer, pks=list(Customer.objects.values_list('pk', flat=True)))
+        with self.settings(SEARCH=dict(settings.SEARCH, POSTINGS_BUDGET=30)):
+            self.assertEqual(self.search('kwame mensah')[0], ('customers', self.customer.pk))
+            self.assertEqual(self.search('ama owusu')[0], ('vendors', self.vendor.pk))
+
+    def test_index_follows_saves_deletes_and_bulk_writes(self):
+        with self.committed():
+            self.customer.name, self.customer.email = "Kojo Mensah", "kojo@example.com"
+            self.customer.save()
+        self.assertEqual(self.search('kwam'), [])
+        self.assertEqual(self.search('kojo'), [('customers', self.customer.pk)])
+
+        with self.committed():
+            self.vendor.delete()
+        self.assertEqual(self.search('volta'), [])
+
+        with self.committed():
+            Account.objects.filter(pk=self.account.pk).update(name="Cash Float")
+            rows_changed.send(sender=Account, pks=[self.account.pk], fields=['name'])
+        self.assertEqual(self.search('float'), [('accounts', self.account.pk)])
+
+    def test_writes_are_indexed_once_per_transaction(self):
+        with self.captureOnCommitCallbacks() as callbacks, transaction.atomic():
+            customers = [Customer.objects.create(name=f"Esi Addo {i}", email=f"esi{i}@example.com") for i in range(3)]
+            customers[0].delete()
+        # The rows, their documents, and one INSERT each of documents and trigrams in a savepoint
+        with self.assertNumQueries(6):
+            for callback in callbacks:
+                callback()
+        self.assertEqual(sorted(pk for _, pk in self.search('esi addo')), [customer.pk for customer in customers[1:]])
+
+    def test_writes_of_other_fields_are_not_indexed(self):
+        with self.committed() as callbacks:
+            self.customer.address = "1 High Street"
+            self.customer.save(update_fields=['address'])
+            rows_changed.send(sender=Customer, pks=[self.customer.pk], fields=['address', 'updated_at'])
+        self.assertEqual(callbacks, [])
+        with self.assertNumQueries(3), self.committed():  # The UPDATE; with the text unchanged, two reads
+            self.customer.save()
+
+    def test_writes_of_every_row_wait_for_a_rebuild(self):
+        Account.objects.filter(pk=self.account.pk).update(name="Cash Float")
+        with self.committed() as callbacks:
+            rows_changed.send(sender=Account, pks=None)
+        self.assertEqual(callbacks, [])
+        self.assertEqual(self.search('float'), [])
+        call_command('rebuild_search_index', 'accounts', stdout=io.StringIO())
+        self.assertEqual(self.search('float'), [('accounts', self.account.pk)])
+
+    def test_rebuild(self):
+        Customer.objects.filter(pk=self.customer.pk).update(name="Yaw Asante")
+        self.assertEqual(search_index.rebuild([search_index.entities['customers']]), {'customers': 1})
+        self.assertEqual(self.search('asante'), [('customers', self.customer.pk)])
+
+    def test_rejects_invalid_parameters(self):
+        response = self.client.get('/api/search/', {'q': 'k', 'types': 'staff', 'limit': 500})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(set(response.json()["errors"]), {'q', 'types', 'limit'})
+
+
+class ConcurrentIndexingTests(TransactionTestCase):
+
+    def test_duplicate_document_does_not_fail_the_write(self):
+        insert = search_index.insert
+
+        def insert_after_a_concurrent_save(built):
+            # Another save of the same row added its document after this one read the index.
+            for document, _ in built:
+                SearchDocument.objects.create(
+                    entity=document.entity, object_id=document.object_id, title='', text='', gram_count=0,
+                )
+            return insert(built)
+
+        with mock.patch.object(search_index, 'insert', insert_after_a_concurrent_save), \
+                self.assertLogs('django.db.backends.base', 'ERROR'):
+            response = self.client.post(
+                '/api/vendors/', {"name": "Volta Supplies", "email": "sales@volta.example.com"},
+                content_type='application/json',
+            )
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertTrue(Vendor.objects.filter(email="sales@volta.example.com").exists())
@@ -0,0 +1,80 @@
+import io
+import json
+import os
+import tempfile
+import time
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from src.apps.vendors.models import Vendor
+from utils.slow_queries import SlowQueryLog, normalize_sql, slow_query_log
+
+
+@override_settings(SLOW_QUERIES=dict(settings.SLOW_QUERIES, THRESHOLD_MS=0))
+class SlowQueryLogTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = User.objects.create_user('staff', password='x', is_staff=True)
+
+    def setUp(self):
+        slow_query_log.reset()
+        self.addCleanup(slow_query_log.reset)
+
+    def test_normalize(self):
+        self.assertEqual(
+            normalize_sql('SELECT "a" FROM "t" WHERE "b" IN (%s, %s) AND "c" = \'x\'\n LIMIT 21 OFFSET 40'),
+            'SELECT "a" FROM "t" WHERE "b" IN (...) AND "c" = ? LIMIT ? OFFSET ?',
+        )
+
+    def test_pages_share_a_fingerprint_with_plan(self):
+        list(Vendor.objects.filter(contact_person__contains="Ama")[10:20])
+        list(Vendor.objects.filter(contact_person__contains="Kofi")[30:40])
+        entries = [entry for entry in slow_query_log.report(50) if '"vendors_vendor"' in entry['sql']]
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries[0]['count'], 2)
+        self.assertTrue(entries[0]['plan'])
+        self.assertEqual(entries[0]['seqScans'], ['vendors_vendor'])
+
+    def test_report_endpoint_and_command(self):
+        Vendor.objects.filter(email="a@example.com").exists()
+        self.assertEqual(self.client.get('/slow-queries/').status_code, 403)
+        self.client.force_login(self.staff)
+        data = self.client.get('/slow-queries/', {'top': 1, 'order': 'count'}).json()['data']
+        self.assertEqual(len(data), 1)
+        self.assertEqual(self.client.get('/slow-queries/', {'order': 'slowest'}).status_code, 400)
+        out = io.StringIO()
+        call_command('slow_queries', top=5, stdout=out, stderr=io.StringIO())
+        self.assertIn('fingerprint(s) slower than 0 ms', out.getvalue())
+
+    def test_snapshots_are_written_off_the_request_path(self):
+        with tempfile.TemporaryDirectory() as directory:
+            options = dict(settings.SLOW_QUERIES, DIR=directory, FLUSH_INTERVAL=0.01)
+            with override_settings(SLOW_QUERIES=options):
+                log = SlowQueryLog()
+                log.observe(connection, 'SELECT 1', None, 0.2)
+                self.assertEqual(log.flusher_pid, os.getpid())
+                path = log.store.path
+                for _ in range(200):
+                    if path.exists():
+                        break
+                    time.sleep(0.01)
+                entries = json.loads(path.read_text())['entries']
+        self.assertEqual([entry['sql'] for entry in entries.values()], ['SELECT ?'])
+
+    def test_snapshots_of_exited_workers_expire(self):
+        with tempfile.TemporaryDirectory() as directory:
+            live, dead = (os.path.join(directory, f'slow-queries-{name}.json') for name in ('1-live', '2-dead'))
+            for path, sql in ((live, 'SELECT 1'), (dead, 'SELECT 2')):
+                with open(path, 'w') as handle:
+                    json.dump({'entries': {sql: {
+                        'fingerprint': sql, 'sql': sql, 'vendor': 'sqlite', 'count': 1, 'totalMs': 1.0, 'maxMs': 1.0,
+                        'sample': sql, 'lastSeen': time.time(), 'plan': None, 'planAt': None, 'seqScans': [],
+                    }}}, handle)
+            os.utime(dead, (time.time() - 120, time.time() - 120))
+            with override_settings(SLOW_QUERIES=dict(settings.SLOW_QUERIES, DIR=directory, SNAPSHOT_MAX_AGE=60)):
+                self.assertEqual([entry['sql'] for entry in slow_query_log.report()], ['SELECT 1'])
+            self.assertFalse(os.path.exists(dead))
@@ -0,0 +1,25 @@
+from django.test import TestCase
+from src.apps.accounts.serializers import AccountSerializer
+from utils.startup import group_import_times, parse_importtime, served_serializers, warm_up
+
+
+class StartupTests(TestCase):
+    def test_import_times_grouped_per_app(self):
+        report = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       300 |        300 |     src.apps.accounts.models\n"
+            "import time:       100 |        400 |   src.apps.accounts\n"
+            "import time:        50 |         50 |   django.contrib.admin.sites\n"
+            "import time:        20 |        470 | rest_framework\n"
+        )
+        modules = parse_importtime(report)
+        self.assertEqual(modules[1], ('src.apps.accounts', 100, 400, 1))
+        self.assertEqual(group_import_times(modules), [
+            ('src.apps.accounts', 400, 2), ('django.contrib.admin', 50, 1), ('rest_framework', 20, 1),
+        ])
+
+    def test_warm_up_builds_served_serializers(self):
+        self.assertIn(AccountSerializer, served_serializers())
+        with self.assertNumQueries(0):
+            warm_up()
+        self.assertIn('_fast_fields', AccountSerializer.__dict__)
@@ -0,0 +1,96 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.conf import settings
+from django.db import DatabaseError
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from src.apps.sync.changes import Watermark, change_feed
+from src.apps.sync.models import Tombstone
+from src.apps.vendors.models import Vendor
+from utils.db_router import read_database
+
+
+@override_settings(SYNC=dict(settings.SYNC, SETTLE_SECONDS=0))
+class ChangeFeedTests(TestCase):
+
+    def setUp(self):
+        self.vendors = [
+            Vendor.objects.create(name=f"Vendor {i}", email=f"vendor{i}@example.com", contact_person="Ama")
+            for i in range(5)
+        ]
+
+    def sync(self, **params):
+        response = self.client.get('/api/sync/vendors/', params)
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()['data']
+
+    def sync_all(self, token=None, limit=2):
+        """
+        Follow the feed until ``hasMore`` is false; returns (ids, deleted, token).
+        """
+        ids, deleted = [], []
+        while True:
+            data = self.sync(**({'since': token} if token else {}), limit=limit)
+            ids += [row['vendor_id'] for row in data['results']]
+            deleted += data['deleted']
+            token = data['next']
+            if not data['hasMore']:
+                return ids, deleted, token
+
+    def test_initial_sync_then_deltas(self):
+        ids, deleted, token = self.sync_all()
+        self.assertEqual(ids, [vendor.pk for vendor in self.vendors])
+        self.assertEqual(deleted, [])
+
+        self.client.patch(f'/api/vendors/{self.vendors[1].pk}/', {"contact_person": "Kofi"}, 'application/json')
+        self.client.delete(f'/api/vendors/{self.vendors[3].pk}/')
+        self.client.delete('/api/vendors/bulk/', [self.vendors[4].pk], 'application/json')
+        ids, deleted, token = self.sync_all(token)
+        self.assertEqual(ids, [self.vendors[1].pk])
+        self.assertEqual(deleted, [self.vendors[3].pk, self.vendors[4].pk])
+
+        data = self.sync(since=token)
+        self.assertEqual((data['results'], data['deleted'], data['hasMore']), ([], [], False))
+
+    def test_updated_since(self):
+        Vendor.objects.filter(pk=self.vendors[2].pk).update(updated_at='2030-01-01T00:00:00Z')
+        with override_settings(SYNC=dict(settings.SYNC, SETTLE_SECONDS=-10 ** 9)):
+            data = self.sync(updated_since='2029-12-31T00:00:00Z')
+        self.assertEqual([row['vendor_id'] for row in data['results']], [self.vendors[2].pk])
+
+    def test_deletes_are_recorded(self):
+        pk = self.vendors[0].pk
+        self.vendors[0].delete()
+        self.assertEqual(list(Tombstone.objects.values_list('entity', 'object_id')), [("vendors", pk)])
+
+    def test_bulk_delete_rolls_back_without_its_tombstones(self):
+        pk = self.vendors[0].pk
+        with mock.patch.object(Tombstone.objects, 'bulk_create', side_effect=DatabaseError), \
+                self.assertRaises(DatabaseError):
+            self.client.delete('/api/vendors/bulk/', [pk], 'application/json')
+        self.assertTrue(Vendor.objects.filter(pk=pk).exists())
+        self.client.delete('/api/vendors/bulk/', [pk], 'application/json')
+        self.assertEqual(list(Tombstone.objects.values_list('object_id', flat=True)), [pk])
+
+    def test_errors(self):
+        self.assertEqual(self.client.get('/api/sync/invoices/').status_code, 404)
+        self.assertEqual(self.client.get('/api/sync/vendors/', {'since': 'garbage'}).status_code, 400)
+        self.assertEqual(self.client.get('/api/sync/vendors/', {'limit': 0}).status_code, 400)
+        token = self.sync()['next']
+        with override_settings(SYNC=dict(settings.SYNC, TOMBSTONE_RETENTION_DAYS=-1)):
+            self.assertEqual(self.client.get('/api/sync/vendors/', {'since': token}).status_code, 410)
+
+    def test_replica_reads_hold_back_the_lag_window(self):
+        window = settings.REPLICA_ROUTING['MAX_LAG'] + settings.REPLICA_ROUTING['LAG_CHECK_INTERVAL']
+        Vendor.objects.filter(pk=self.vendors[0].pk).update(updated_at=timezone.now() - timedelta(seconds=window - 1))
+        Vendor.objects.filter(pk=self.vendors[1].pk).update(updated_at=timezone.now() - timedelta(seconds=window + 1))
+
+        def changed():
+            rows, _, _, _ = change_feed.changes(change_feed.entities['vendors'], Watermark(), limit=10)
+            return {row.pk for row in rows}
+
+        self.assertEqual(changed(), {vendor.pk for vendor in self.vendors})
+        token = read_database.set('default')  # As if a replica had been picked for the request
+        self.addCleanup(read_database.reset, token)
+        self.assertEqual(changed(), {self.vendors[1].pk})